@@ -1,4 +1,6 @@
 from django.apps import AppConfig as DjangoApponfig
+from django.conf import settings
+from django.utils.module_loading import import_string
 from edc_appointment.constants import COMPLETE_APPT
 from edc_odk.apps import AppConfig as BaseEdcOdkAppConfig
 from edc_timepoint import Timepoint, TimepointCollection
@@ -10,6 +12,15 @@ class AppConfig(DjangoApponfig):
     name = 'flourish_form_validations'
     verbose_name = 'Flourish Form Validations'
 
+    def ready(self):
+        from . import signals  # noqa
+
+        instrumentation = getattr(settings, 'FORM_VALIDATOR_INSTRUMENTATION', None)
+        if instrumentation:
+            from .instrumentation import instrument_validators
+            sink_cls = import_string(instrumentation.get('sink'))
+            instrument_validators(sink_cls(**instrumentation.get('options', {})))
+
 
 class EdcVisitTrackingAppConfig(BaseEdcVisitTrackingAppConfig):
     visit_models = {
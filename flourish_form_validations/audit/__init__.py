@@ -0,0 +1,4 @@
+from .incremental import AuditState, audit_queryset_since, upstream_models
+from .runner import (AuditResult, audit_instance, audit_queryset,
+                     cleaned_data_from_instance, iter_audit, write_report)
+from .targets import AuditTarget, audit_targets
@@ -0,0 +1,134 @@
+import json
+import os
+from fnmatch import fnmatch
+
+from django.apps import apps as django_apps
+from django.conf import settings
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+from .runner import audit_queryset, visit_attrs
+
+# {upstream model label: validator class names}. A change to an upstream
+# instance re-validates the subject's instances of the models whose
+# validator is, or inherits from, one of the named classes. A label may
+# be a pattern, e.g. 'flourish_caregiver.onschedule*'.
+#
+# Not covered, so schedule a full audit, i.e. without a mark, as well:
+# - deleted upstream instances, which leave nothing modified to find;
+# - child CRFs, keyed by the child's subject identifier, for changes to
+#   the caregiver's upstream instances;
+# - upstream instances keyed by a screening identifier only, e.g.
+#   flourishconsentversion.
+audit_dependencies = getattr(settings, 'VALIDATION_AUDIT_DEPENDENCIES', {
+    'flourish_caregiver.subjectconsent': ['FormValidatorMixin'],
+    'flourish_caregiver.caregiverchildconsent': ['FormValidatorMixin'],
+    'flourish_caregiver.onschedule*': ['FormValidatorMixin'],
+    'flourish_prn.caregiveroffstudy': ['FormValidatorMixin'],
+    'edc_action_item.actionitem': ['FormValidatorMixin'],
+    'flourish_caregiver.antenatalenrollment': ['ObstericalHistoryFormValidator'],
+    'flourish_caregiver.ultrasound': ['ObstericalHistoryFormValidator'],
+    'flourish_caregiver.maternaldelivery': [
+        'InterviewFocusGroupInterestFormValidator',
+        'InterviewFocusGroupInterestVersion2FormValidator',
+        'ObstericalHistoryFormValidator',
+        'RelationshipFatherInvolvementFormValidator',
+        'SocioDemographicDataFormValidator',
+        'SubjectConsentFormValidator'],
+})
+
+# {upstream model label: lookup path to the subject identifier}, for
+# upstream models whose own subject identifier is not the one of the
+# instances that depend on them.
+upstream_subject_paths = getattr(settings, 'VALIDATION_AUDIT_UPSTREAM_PATHS', {
+    'flourish_caregiver.caregiverchildconsent': 'subject_consent__subject_identifier',
+})
+
+
+def upstream_models(target, dependencies=None):
+    """Returns the labels of the upstream models the target's validator
+    depends on.
+    """
+    dependencies = audit_dependencies if dependencies is None else dependencies
+    names = {cls.__name__ for cls in target.validator_cls.__mro__}
+    return [label for label, validators in dependencies.items()
+            if names.intersection(validators)]
+
+
+def upstream_model_classes(label, apps=None):
+    """Returns the installed model classes matching the label or label
+    pattern, none if its app is not installed.
+    """
+    apps = apps or django_apps
+    if not any(char in label for char in '*?['):
+        app_label, model_name = label.split('.')
+        try:
+            return [apps.get_model(app_label, model_name)]
+        except LookupError:
+            return []
+    return [model_cls for model_cls in apps.get_models()
+            if fnmatch(model_cls._meta.label_lower, label)]
+
+
+def subject_identifier_path(model_cls):
+    """Returns the lookup path from `model_cls` to the subject
+    identifier, or None.
+    """
+    field_names = {field.name for field in model_cls._meta.get_fields()}
+    if 'subject_identifier' in field_names:
+        return 'subject_identifier'
+    for attr in visit_attrs:
+        if attr in field_names:
+            return f'{attr}__subject_identifier'
+
+
+def audit_queryset_since(target, since, dependencies=None, apps=None):
+    """Returns the queryset of the target's instances modified after
+    `since`, or whose subject has an upstream instance modified after
+    `since`. Returns all instances if `since` is None.
+    """
+    apps = apps or django_apps
+    model_cls = apps.get_model(target.model)
+    queryset = audit_queryset(model_cls)
+    if since is None:
+        return queryset
+    changed = Q(modified__gt=since)
+    path = subject_identifier_path(model_cls)
+    if path:
+        for label in upstream_models(target, dependencies=dependencies):
+            for upstream_cls in upstream_model_classes(label, apps=apps):
+                upstream_path = upstream_subject_paths.get(
+                    upstream_cls._meta.label_lower,
+                    subject_identifier_path(upstream_cls))
+                if not upstream_path:
+                    continue
+                subjects = upstream_cls._default_manager.filter(
+                    modified__gt=since).values(upstream_path)
+                changed |= Q(**{f'{path}__in': subjects})
+    return queryset.filter(changed)
+
+
+class AuditState:
+    """The high-water mark of each audited model, saved to a JSON file.
+
+    A mark is the time the model's last completed audit started, so
+    instances saved while it ran are audited again next time.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.marks = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                self.marks = json.load(f)
+
+    def since(self, model):
+        mark = self.marks.get(model)
+        return parse_datetime(mark) if mark else None
+
+    def update(self, model, mark):
+        self.marks[model] = mark.isoformat()
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.marks, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
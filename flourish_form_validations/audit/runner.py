@@ -0,0 +1,135 @@
+import json
+from collections import namedtuple
+from itertools import islice
+
+from django.apps import apps as django_apps
+from django.core.exceptions import ValidationError
+
+from ..form_validators.batch import prefetch_lookups, validation_errors
+
+# Foreign keys to the visit, for CRFs without a subject_identifier field.
+visit_attrs = ['maternal_visit', 'child_visit']
+
+
+class AuditResult(namedtuple('AuditResult', [
+        'model', 'pk', 'subject_identifier', 'validator', 'errors',
+        'error_codes', 'exception'])):
+    """The outcome of re-validating one stored instance. `errors` is
+    None if the instance is valid and `exception` holds the repr of any
+    error other than a ValidationError.
+    """
+
+    __slots__ = ()
+
+    @property
+    def is_valid(self):
+        return self.errors is None and self.exception is None
+
+    def as_json(self):
+        return json.dumps(self._asdict(), default=str, sort_keys=True)
+
+
+def cleaned_data_from_instance(obj):
+    """Returns the cleaned_data a model form would pass the validator
+    for the saved instance `obj`.
+    """
+    opts = obj._meta
+    cleaned_data = {}
+    for field in opts.concrete_fields:
+        if field.editable and not field.auto_created:
+            cleaned_data[field.name] = getattr(obj, field.name)
+    for field in opts.many_to_many:
+        if field.editable:
+            cleaned_data[field.name] = getattr(obj, field.name).all()
+    return cleaned_data
+
+
+def subject_identifier_for(obj):
+    """Returns the subject identifier of `obj` or of its visit.
+    """
+    subject_identifier = getattr(obj, 'subject_identifier', None)
+    if not subject_identifier:
+        for attr in visit_attrs:
+            visit = getattr(obj, attr, None)
+            if visit:
+                return visit.subject_identifier
+    return subject_identifier
+
+
+def audit_queryset(model_cls):
+    """Returns the queryset of all instances of `model_cls` in primary
+    key order, joined to the objects cleaned_data refers to.
+    """
+    relations = [field.name for field in model_cls._meta.concrete_fields
+                 if field.is_relation and field.editable]
+    return model_cls._default_manager.select_related(*relations).order_by('pk')
+
+
+def audit_instance(target, obj, cleaned_data, prefetched=None):
+    """Returns the AuditResult of validating `obj` with the target's
+    validator.
+    """
+    form_validator = target.validator_cls(cleaned_data=cleaned_data)
+    form_validator.prefetched = prefetched
+    errors, error_codes, exception = None, [], None
+    try:
+        form_validator.validate()
+    except ValidationError as e:
+        errors = validation_errors(form_validator, e)
+        error_codes = form_validator._error_codes
+    except Exception as e:
+        exception = repr(e)
+    return AuditResult(
+        model=target.model,
+        pk=str(obj.pk),
+        subject_identifier=subject_identifier_for(obj),
+        validator=target.validator_cls.__name__,
+        errors=errors,
+        error_codes=error_codes,
+        exception=exception)
+
+
+def iter_audit_chunks(target, queryset=None, chunk_size=2000):
+    """Streams the instances of the target's model, or of `queryset`,
+    and yields the primary key of the last instance read and a list of
+    AuditResult per chunk.
+
+    Rows are read with `.iterator()` and validated a chunk at a time,
+    running the validator's batch lookups once per chunk, so memory use
+    does not grow with the table size.
+    """
+    if queryset is None:
+        queryset = audit_queryset(django_apps.get_model(target.model))
+    rows = queryset.iterator(chunk_size=chunk_size)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        last_pk = chunk[-1].pk
+        records = [cleaned_data_from_instance(obj) for obj in chunk]
+        prefetched = prefetch_lookups(target.validator_cls, records)
+        yield last_pk, [
+            audit_instance(target, obj, cleaned_data, values)
+            for obj, cleaned_data, values in zip(chunk, records, prefetched)]
+
+
+def iter_audit(target, queryset=None, chunk_size=2000):
+    """Yields an AuditResult per instance, see `iter_audit_chunks`.
+    """
+    for _, results in iter_audit_chunks(
+            target, queryset=queryset, chunk_size=chunk_size):
+        yield from results
+
+
+def write_report(results, fp):
+    """Writes the results in `results` that are not valid to `fp`, one
+    JSON object per line, and returns the number of results and of
+    violations.
+    """
+    count = violations = 0
+    for result in results:
+        count += 1
+        if not result.is_valid:
+            violations += 1
+            fp.write(result.as_json() + '\n')
+    return count, violations
@@ -0,0 +1,156 @@
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from django.db import connections
+from django.db.models import Value
+from django.db.models.functions import MD5, Coalesce, Substr
+
+from .incremental import audit_queryset_since, subject_identifier_path
+from .runner import iter_audit_chunks
+
+# Subjects are hashed to one of 256 buckets, the first byte of the MD5
+# of their identifier, and bucket b belongs to shard b % shards.
+shard_buckets = 256
+
+
+def shard_for(subject_identifier, shards):
+    """Returns the shard of `subject_identifier`, stable across
+    processes and runs.
+    """
+    digest = hashlib.md5((subject_identifier or '').encode()).hexdigest()
+    return int(digest[:2], 16) % shards
+
+
+def shard_queryset(queryset, shard, shards):
+    """Returns `queryset` filtered in SQL to the instances whose subject
+    is in `shard`, by the same hash as `shard_for`, so each shard only
+    reads its own rows.
+
+    Instances of a model without a subject identifier all belong to
+    shard 0.
+    """
+    if shards == 1:
+        return queryset
+    path = subject_identifier_path(queryset.model)
+    if not path:
+        return queryset if shard == 0 else queryset.none()
+    prefixes = [f'{bucket:02x}' for bucket in range(shard_buckets)
+                if bucket % shards == shard]
+    return queryset.annotate(
+        audit_shard_bucket=Substr(MD5(Coalesce(path, Value(''))), 1, 2)).filter(
+        audit_shard_bucket__in=prefixes)
+
+
+class ShardCheckpoint:
+    """The progress of one shard, by model, saved to a JSON file after
+    every chunk so an interrupted audit resumes after the last chunk
+    written.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.models = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                self.models = json.load(f)
+
+    @property
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def position(self, model):
+        return self.models.get(
+            model, {'last_pk': None, 'done': False, 'count': 0, 'violations': 0})
+
+    def update(self, model, last_pk=None, count=0, violations=0, done=False):
+        position = self.position(model)
+        self.models[model] = {
+            'last_pk': position['last_pk'] if last_pk is None else str(last_pk),
+            'done': done,
+            'count': position['count'] + count,
+            'violations': position['violations'] + violations}
+        self.save()
+
+    def save(self):
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.models, f)
+        os.replace(tmp_path, self.path)
+
+
+def shard_paths(checkpoint_dir, shard, shards):
+    """Returns the checkpoint and report paths of a shard. Both include
+    the shard count so a run with another count starts afresh.
+    """
+    name = os.path.join(checkpoint_dir, f'shard-{shard}-of-{shards}')
+    return f'{name}.json', f'{name}.jsonl'
+
+
+def audit_shard(shard, shards=1, targets=None, checkpoint_dir=None, chunk_size=2000,
+                since=None):
+    """Audits the instances of the audit `targets` belonging to the
+    subjects in `shard`, resuming from the shard's checkpoint, and
+    returns the checkpoint.
+
+    `since` is an optional dict of {model: datetime} limiting a model's
+    audit to the instances changed since, see `audit_queryset_since`.
+    """
+    since = since or {}
+    checkpoint_path, report_path = shard_paths(checkpoint_dir, shard, shards)
+    checkpoint = ShardCheckpoint(checkpoint_path)
+    with open(report_path, 'a' if checkpoint.exists else 'w') as fp:
+        for target in targets:
+            position = checkpoint.position(target.model)
+            if position['done']:
+                continue
+            queryset = shard_queryset(
+                audit_queryset_since(target, since.get(target.model)), shard, shards)
+            if position['last_pk'] is not None:
+                queryset = queryset.filter(pk__gt=position['last_pk'])
+            for last_pk, results in iter_audit_chunks(
+                    target, queryset=queryset, chunk_size=chunk_size):
+                violations = [result for result in results if not result.is_valid]
+                for result in violations:
+                    fp.write(result.as_json() + '\n')
+                fp.flush()
+                checkpoint.update(target.model, last_pk=last_pk,
+                                  count=len(results), violations=len(violations))
+            checkpoint.update(target.model, done=True)
+    return checkpoint
+
+
+def merge_reports(paths, fp):
+    """Writes the violations of the shard reports in `paths` to `fp`,
+    dropping lines repeated by a resumed shard, and returns the number
+    of violations.
+    """
+    seen = set()
+    for path in paths:
+        with open(path) as f:
+            for line in f:
+                result = json.loads(line)
+                key = (result['model'], result['pk'])
+                if key not in seen:
+                    seen.add(key)
+                    fp.write(line)
+    return len(seen)
+
+
+def run_sharded_audit(shards, checkpoint_dir, targets, chunk_size=2000,
+                      since=None, executor_cls=ProcessPoolExecutor):
+    """Audits every shard in a process of its own and returns the
+    shard checkpoints, in shard order.
+
+    Database connections are closed first so the processes do not share
+    the parent's connections.
+    """
+    os.makedirs(checkpoint_dir, exist_ok=True)
+    connections.close_all()
+    run = partial(audit_shard, shards=shards, targets=targets,
+                  checkpoint_dir=checkpoint_dir, chunk_size=chunk_size,
+                  since=since)
+    with executor_cls(max_workers=shards) as executor:
+        return list(executor.map(run, range(shards)))
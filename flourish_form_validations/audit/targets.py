@@ -0,0 +1,58 @@
+from collections import namedtuple
+
+from django.apps import apps as django_apps
+from django.conf import settings
+
+from ..instrumentation import exported_validators
+
+AuditTarget = namedtuple('AuditTarget', ['model', 'validator_cls'])
+
+# Apps searched for the model of each exported validator.
+audit_apps = getattr(
+    settings, 'VALIDATION_AUDIT_APPS', ['flourish_caregiver', 'flourish_child'])
+
+# Explicit {model label: validator class name} pairs, for validators not
+# named after their model.
+audit_models = getattr(settings, 'VALIDATION_AUDIT_MODELS', {})
+
+
+def validator_model_name(validator_cls):
+    """Returns the model name a validator is named after, e.g.
+    `maternaldelivery` for MaternalDeliveryFormValidator, or None.
+    """
+    name = validator_cls.__name__
+    if name.endswith('FormValidator'):
+        return name[:-len('FormValidator')].lower()
+
+
+def audit_targets(models=None, apps=None):
+    """Returns a list of AuditTarget, one per model with a matching
+    exported validator, ordered by model label.
+
+    `models` limits the targets to those model labels.
+    """
+    apps = apps or django_apps
+    validators = {validator_cls.__name__: validator_cls
+                  for validator_cls in exported_validators()}
+    targets = {}
+    for validator_cls in validators.values():
+        model_name = validator_model_name(validator_cls)
+        if not model_name:
+            continue
+        for app_label in audit_apps:
+            try:
+                model_cls = apps.get_model(app_label, model_name)
+            except LookupError:
+                continue
+            targets[model_cls._meta.label_lower] = validator_cls
+    for label, validator_name in audit_models.items():
+        targets[label.lower()] = validators[validator_name]
+    if models:
+        models = [label.lower() for label in models]
+        unknown = set(models) - set(targets)
+        if unknown:
+            raise LookupError(
+                f'No validator found for {", ".join(sorted(unknown))}.')
+        targets = {label: targets[label] for label in models}
+    return [AuditTarget(model=label, validator_cls=targets[label])
+            for label in sorted(targets)]
@@ -0,0 +1,3 @@
+from .harness import (BenchmarkResult, ValidatorBenchmark, compare_to_baseline,
+                      load_baseline, save_baseline)
+from .payloads import BenchmarkFixture, payload_factories, validator_payloads
@@ -0,0 +1,144 @@
+import json
+import math
+import time
+import tracemalloc
+from collections import namedtuple
+
+from django.core.exceptions import ValidationError
+
+from ..form_validators.hiv_status import invalidate_hiv_status
+from ..form_validators.visit_context import visit_contexts
+from ..instrumentation import QueryCounter
+
+BenchmarkResult = namedtuple(
+    'BenchmarkResult', [
+        'validator', 'case', 'outcome', 'iterations', 'ops_per_sec',
+        'p50_ms', 'p99_ms', 'queries', 'peak_memory_kb'])
+
+
+def percentile(values, pct):
+    """Returns the nearest rank percentile of `values`.
+    """
+    ordered = sorted(values)
+    if not ordered:
+        return 0
+    rank = math.ceil(pct / 100 * len(ordered))
+    return ordered[max(0, min(len(ordered), rank) - 1)]
+
+
+def reset_caches():
+    """Clears the caches shared between validations so that every
+    iteration measures a cold save.
+    """
+    visit_contexts.clear()
+    invalidate_hiv_status()
+
+
+class ValidatorBenchmark:
+    """Times `validate()` of a validator class for one cleaned_data
+    payload.
+    """
+
+    def __init__(self, validator_cls, cleaned_data, case=None,
+                 iterations=50, warmup=3, cold=True):
+        self.validator_cls = validator_cls
+        self.cleaned_data = cleaned_data
+        self.case = case
+        self.iterations = iterations
+        self.warmup = warmup
+        self.cold = cold
+
+    def validate_once(self):
+        """Returns the outcome of one validation: `valid`,
+        `invalid:<code>` or `error:<exception name>`.
+        """
+        if self.cold:
+            reset_caches()
+        form_validator = self.validator_cls(cleaned_data=dict(self.cleaned_data))
+        try:
+            form_validator.validate()
+        except ValidationError as e:
+            return f'invalid:{getattr(e, "code", None) or "invalid"}'
+        except Exception as e:
+            return f'error:{e.__class__.__name__}'
+        return 'valid'
+
+    def run(self):
+        for _ in range(self.warmup):
+            self.validate_once()
+
+        with QueryCounter() as queries:
+            outcome = self.validate_once()
+
+        tracemalloc.start()
+        try:
+            self.validate_once()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        timings = []
+        for _ in range(self.iterations):
+            start = time.perf_counter()
+            self.validate_once()
+            timings.append(time.perf_counter() - start)
+        total = sum(timings)
+
+        return BenchmarkResult(
+            validator=self.validator_cls.__name__,
+            case=self.case,
+            outcome=outcome,
+            iterations=self.iterations,
+            ops_per_sec=round(self.iterations / total, 2) if total else 0,
+            p50_ms=round(percentile(timings, 50) * 1000, 4),
+            p99_ms=round(percentile(timings, 99) * 1000, 4),
+            queries=queries.count,
+            peak_memory_kb=round(peak / 1024, 2))
+
+
+def results_as_dict(results):
+    """Returns results keyed by validator then case, as saved in a
+    baseline file.
+    """
+    data = {}
+    for result in results:
+        data.setdefault(result.validator, {})[result.case] = {
+            k: v for k, v in result._asdict().items()
+            if k not in ['validator', 'case']}
+    return data
+
+
+def save_baseline(results, path):
+    with open(path, 'w') as f:
+        json.dump(results_as_dict(results), f, indent=2, sort_keys=True)
+
+
+def load_baseline(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare_to_baseline(results, baseline, tolerance=0.2):
+    """Returns a list of regression messages for results slower than
+    the baseline p50 by more than `tolerance`, running more queries or
+    with a changed outcome.
+    """
+    regressions = []
+    for result in results:
+        previous = baseline.get(result.validator, {}).get(result.case)
+        if not previous:
+            continue
+        name = f'{result.validator} ({result.case})'
+        if result.outcome != previous['outcome']:
+            regressions.append(
+                f'{name}: outcome changed from {previous["outcome"]} '
+                f'to {result.outcome}')
+        if result.queries > previous['queries']:
+            regressions.append(
+                f'{name}: queries increased from {previous["queries"]} '
+                f'to {result.queries}')
+        if result.p50_ms > previous['p50_ms'] * (1 + tolerance):
+            regressions.append(
+                f'{name}: p50 increased from {previous["p50_ms"]}ms '
+                f'to {result.p50_ms}ms')
+    return regressions
@@ -0,0 +1,225 @@
+from contextlib import contextmanager
+
+from dateutil.relativedelta import relativedelta
+from edc_base.utils import get_utcnow
+from edc_constants.constants import FEMALE, NO, NOT_APPLICABLE, YES
+
+MISSING = object()
+
+
+class BenchmarkFixture:
+    """Creates the test model records shared by every benchmark
+    payload.
+    """
+
+    subject_identifier = 'B1000001'
+    child_subject_identifier = 'B1000001-10'
+    screening_identifier = 'BS12345'
+    schedule_name = 'cohort_a_enrollment'
+
+    def create(self):
+        from ..tests.models import (
+            Appointment, CaregiverChildConsent, CaregiverLocator,
+            FlourishConsentVersion, MaternalVisit, OnSchedule, Schedule,
+            SubjectConsent)
+
+        now = get_utcnow()
+        self.subject_consent = SubjectConsent.objects.create(
+            subject_identifier=self.subject_identifier,
+            screening_identifier=self.screening_identifier,
+            gender=FEMALE,
+            dob=(now - relativedelta(years=25)).date(),
+            first_name='TEST ONE',
+            last_name='TEST',
+            initials='TOT',
+            consent_datetime=now - relativedelta(days=7),
+            version='1')
+        FlourishConsentVersion.objects.create(
+            screening_identifier=self.screening_identifier,
+            version='1')
+        CaregiverChildConsent.objects.create(
+            subject_consent=self.subject_consent,
+            subject_identifier=self.child_subject_identifier,
+            child_dob=(now - relativedelta(months=6)).date(),
+            preg_enroll=True,
+            consent_datetime=now - relativedelta(days=7))
+        CaregiverLocator.objects.create(
+            subject_identifier=self.subject_identifier,
+            screening_identifier=self.screening_identifier,
+            may_call=YES,
+            may_visit_home=YES)
+        OnSchedule.objects.create(
+            subject_identifier=self.subject_identifier,
+            child_subject_identifier=self.child_subject_identifier,
+            schedule_name=self.schedule_name)
+        schedule = Schedule.objects.create(
+            subject_identifier=self.subject_identifier,
+            child_subject_identifier=self.child_subject_identifier,
+            schedule_name=self.schedule_name,
+            onschedule_model='flourish_form_validations.onschedule')
+        appointment = Appointment.objects.create(
+            subject_identifier=self.subject_identifier,
+            appt_datetime=now - relativedelta(days=1),
+            visit_code='2000M')
+        self.maternal_visit = MaternalVisit.objects.create(
+            appointment=appointment,
+            schedule=schedule,
+            schedule_name=self.schedule_name,
+            report_datetime=now - relativedelta(days=1))
+        return self
+
+
+def crf_payloads(fixture):
+    """Returns a valid and an invalid (report datetime before the visit)
+    payload for a CRF validator.
+    """
+    report_datetime = fixture.maternal_visit.report_datetime
+    valid = {'maternal_visit': fixture.maternal_visit,
+             'report_datetime': report_datetime}
+    invalid = dict(valid, report_datetime=report_datetime - relativedelta(days=1))
+    return valid, invalid
+
+
+def subject_consent_payloads(fixture):
+    valid = {
+        'subject_identifier': fixture.subject_identifier,
+        'screening_identifier': fixture.screening_identifier,
+        'consent_datetime': get_utcnow(),
+        'version': '2',
+        'gender': FEMALE,
+        'dob': (get_utcnow() - relativedelta(years=25)).date(),
+        'first_name': 'TEST ONE',
+        'last_name': 'TEST',
+        'initials': 'TOT',
+        'identity': '123425678',
+        'confirm_identity': '123425678',
+        'identity_type': 'country_id',
+        'citizen': YES,
+        'is_literate': YES,
+        'child_consent': NOT_APPLICABLE}
+    invalid = dict(valid, first_name='Test one')
+    return valid, invalid
+
+
+def caregiver_child_consent_payloads(fixture):
+    valid = {
+        'subject_consent': fixture.subject_consent,
+        'consent_datetime': get_utcnow(),
+        'version': '1',
+        'child_dob': (get_utcnow() - relativedelta(years=5)).date().strftime('%Y-%m-%d'),
+        'first_name': 'TEST ONE',
+        'last_name': 'TEST',
+        'initials': 'TOT',
+        'gender': FEMALE,
+        'child_preg_test': NOT_APPLICABLE,
+        'child_knows_status': NOT_APPLICABLE,
+        'identity': '123425678',
+        'confirm_identity': '123425678',
+        'identity_type': 'birth_cert',
+        'citizen': YES}
+    invalid = dict(valid, identity='123415678', confirm_identity='123415678')
+    return valid, invalid
+
+
+def caregiver_locator_payloads(fixture):
+    valid = {
+        'subject_identifier': fixture.subject_identifier,
+        'may_visit_home': NO,
+        'may_call': YES,
+        'subject_cell': '71234567',
+        'may_call_work': NO,
+        'may_contact_indirectly': NO,
+        'has_caretaker': NO}
+    invalid = dict(valid, subject_cell=None)
+    return valid, invalid
+
+
+def tb_visit_screening_women_payloads(fixture):
+    valid, invalid = crf_payloads(fixture)
+    symptoms = {
+        'have_cough': YES,
+        'cough_duration': 'month',
+        'cough_intersects_preg': NO,
+        'cough_illness': NO,
+        'fever_during_preg': NO,
+        'night_sweats_during_preg': NO,
+        'weight_loss_during_preg': NO,
+        'cough_blood_during_preg': NO,
+        'enlarged_lymph_nodes_during_preg': NO}
+    valid.update(symptoms)
+    invalid = dict(valid, cough_duration=None)
+    return valid, invalid
+
+
+payload_factories = {
+    'SubjectConsentFormValidator': subject_consent_payloads,
+    'CaregiverChildConsentFormValidator': caregiver_child_consent_payloads,
+    'CaregiverLocatorFormValidator': caregiver_locator_payloads,
+    'TbVisitScreeningWomenFormValidator': tb_visit_screening_women_payloads,
+}
+
+# The test model labels the benchmarked validators read, in place of the
+# flourish models.
+benchmark_model_labels = {
+    'caregiver_consent_model': 'flourish_form_validations.subjectconsent',
+    'subject_consent_model': 'flourish_form_validations.subjectconsent',
+    'caregiver_child_consent_model': 'flourish_form_validations.caregiverchildconsent',
+    'maternal_dataset_model': 'flourish_form_validations.maternaldataset',
+    'child_dataset_model': 'flourish_form_validations.childdataset',
+    'antenatal_enrollment_model': 'flourish_form_validations.antenatalenrollment',
+    'subject_screening_model': 'flourish_form_validations.subjectscreening',
+    'prior_screening_model': 'flourish_form_validations.screeningpriorbhpparticipants',
+    'bhp_prior_screening_model': 'flourish_form_validations.screeningpriorbhpparticipants',
+    'arvs_pre_preg_model': 'flourish_form_validations.arvsprepregnancy',
+    'preg_women_screening_model': 'flourish_form_validations.screeningpregwomen',
+    'caregiver_locator_model': 'flourish_form_validations.caregiverlocator',
+    'delivery_model': 'flourish_form_validations.maternaldelivery',
+    'maternal_delivery_model': 'flourish_form_validations.maternaldelivery',
+    'maternal_visit_model': 'flourish_form_validations.maternalvisit',
+    'maternal_arv_model': 'flourish_form_validations.maternalarv',
+    'arvs_pre_pregnancy': 'flourish_form_validations.maternalarvduringpreg',
+    'ultrasound_model': 'flourish_form_validations.ultrasound',
+    'screening_preg_women': 'flourish_form_validations.screeningpregwomen',
+    'caregiver_offstudy_model': 'flourish_form_validations.offstudy',
+    'caregiver_contact_model': 'flourish_form_validations.caregivercontact',
+    'consent_version_model': 'flourish_form_validations.flourishconsentversion',
+    'child_assent_model': 'flourish_form_validations.childassent',
+}
+
+
+@contextmanager
+def benchmark_model_labels_applied(validator_cls):
+    """Points the model label attributes of `validator_cls` to the test
+    models, restoring them on exit.
+    """
+    saved = {attr: validator_cls.__dict__.get(attr, MISSING)
+             for attr in benchmark_model_labels}
+    for attr, label in benchmark_model_labels.items():
+        setattr(validator_cls, attr, label)
+    try:
+        yield validator_cls
+    finally:
+        for attr, value in saved.items():
+            if value is MISSING:
+                delattr(validator_cls, attr)
+            else:
+                setattr(validator_cls, attr, value)
+
+
+def missing_payloads(validator_classes):
+    """Returns the names of the validator classes without payloads in
+    `payload_factories`.
+    """
+    return [validator_cls.__name__ for validator_cls in validator_classes
+            if validator_cls.__name__ not in payload_factories]
+
+
+def validator_payloads(validator_cls, fixture):
+    """Returns a list of (case, cleaned_data) for `validator_cls`.
+
+    Validators are only benchmarked against payloads written for their
+    form, generic cleaned_data fails on the first required field and
+    would time that instead. Raises KeyError if there are none.
+    """
+    valid, invalid = payload_factories[validator_cls.__name__](fixture)
+    return [('valid', valid), ('invalid', invalid)]
@@ -0,0 +1,172 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+package_name = 'flourish_form_validations.form_validators'
+
+IMPORT_SCRIPT = 'import django; django.setup(); import {module}'
+
+FIRST_VALIDATION_SCRIPT = '''
+import json, time
+start = time.perf_counter()
+import django
+from django.conf import settings
+settings.DATABASES['default'] = settings.DATABASES[{database!r}]
+django.setup()
+setup = time.perf_counter()
+from importlib import import_module
+validator_cls = getattr(import_module({package!r}), {validator!r})
+imported = time.perf_counter()
+try:
+    validator_cls(cleaned_data={{}}).validate()
+except Exception:
+    pass
+validated = time.perf_counter()
+print(json.dumps({{
+    'setup_ms': (setup - start) * 1000,
+    'import_ms': (imported - setup) * 1000,
+    'validation_ms': (validated - imported) * 1000,
+    'total_ms': (validated - start) * 1000}}))
+'''
+
+
+def run_python(*args):
+    """Runs a fresh interpreter with the current settings module and
+    returns the completed process.
+    """
+    return subprocess.run(
+        [sys.executable, *args], env=os.environ.copy(), cwd=os.getcwd(),
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        universal_newlines=True, check=True)
+
+
+def parse_importtime(output):
+    """Returns a dict of {module: (self_us, cumulative_us)} from the
+    stderr of `python -X importtime`.
+    """
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        try:
+            self_us, cumulative_us = int(fields[0]), int(fields[1])
+        except ValueError:
+            continue
+        times.setdefault(fields[2].strip(), (self_us, cumulative_us))
+    return times
+
+
+def measure_import(module, repeat=3):
+    """Returns the median self and cumulative import time, in ms, of
+    `module` imported in a fresh interpreter after Django setup.
+
+    Modules already imported by Django setup, e.g. through the app's
+    signals, are reported with the cost of that first import.
+    """
+    self_times, cumulative_times = [], []
+    for _ in range(repeat):
+        process = run_python('-X', 'importtime', '-c', IMPORT_SCRIPT.format(module=module))
+        self_us, cumulative_us = parse_importtime(process.stderr).get(module, (0, 0))
+        self_times.append(self_us / 1000)
+        cumulative_times.append(cumulative_us / 1000)
+    return {'self_ms': round(statistics.median(self_times), 3),
+            'cumulative_ms': round(statistics.median(cumulative_times), 3)}
+
+
+def measure_first_validation(validator, database, repeat=3):
+    """Returns the median time, in ms, of a fresh interpreter to set up
+    Django, import `validator` and run its first validation.
+
+    The validation runs on empty cleaned_data against the database of
+    alias `database`, used as the default one, and any error is
+    ignored; only the cold start is timed.
+    """
+    runs = []
+    for _ in range(repeat):
+        process = run_python('-c', FIRST_VALIDATION_SCRIPT.format(
+            package=package_name, validator=validator, database=database))
+        runs.append(json.loads(process.stdout.strip().splitlines()[-1]))
+    return {key: round(statistics.median(run[key] for run in runs), 3)
+            for key in runs[0]}
+
+
+def validator_modules():
+    """Returns the names of the modules the package exports from.
+    """
+    from .. import form_validators
+
+    return sorted({f'{package_name}.{module}'
+                   for module in form_validators._exports.values()})
+
+
+def startup_report(validators=None, database=None, repeat=3):
+    """Returns the cold start report: import times of the package and of
+    every validator module, and the time to the first validation of each
+    of `validators`.
+
+    The first validations query the database of alias `database`, which
+    must be given with `validators` so that they never run against the
+    configured database by default.
+    """
+    if validators and not database:
+        raise ValueError(
+            'Timing the first validation queries the database, '
+            'specify the alias of a database that is safe to query.')
+    return {
+        'python': sys.version.split()[0],
+        'repeat': repeat,
+        'package': measure_import(package_name, repeat=repeat),
+        'modules': {module: measure_import(module, repeat=repeat)
+                    for module in validator_modules()},
+        'first_validation': {
+            validator: measure_first_validation(
+                validator, database, repeat=repeat)
+            for validator in validators or []},
+    }
+
+
+def save_report(report, path):
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+
+
+def load_budget(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def check_budget(report, budget):
+    """Returns a list of messages for the times in `report` over
+    `budget`, a dict with any of:
+
+        {'package_ms': 50,
+         'module_ms': 300,
+         'modules': {'<module>': 800},
+         'first_validation_ms': 3000}
+
+    Import budgets apply to cumulative times and `modules` overrides
+    `module_ms` for the named modules.
+    """
+    messages = []
+    package_ms = budget.get('package_ms')
+    if package_ms is not None and report['package']['cumulative_ms'] > package_ms:
+        messages.append(
+            f'{package_name}: import took {report["package"]["cumulative_ms"]}ms, '
+            f'budget {package_ms}ms')
+    for module, times in report['modules'].items():
+        module_ms = budget.get('modules', {}).get(module, budget.get('module_ms'))
+        if module_ms is not None and times['cumulative_ms'] > module_ms:
+            messages.append(
+                f'{module}: import took {times["cumulative_ms"]}ms, '
+                f'budget {module_ms}ms')
+    first_validation_ms = budget.get('first_validation_ms')
+    if first_validation_ms is not None:
+        for validator, times in report['first_validation'].items():
+            if times['total_ms'] > first_validation_ms:
+                messages.append(
+                    f'{validator}: first validation after {times["total_ms"]}ms, '
+                    f'budget {first_validation_ms}ms')
+    return messages
@@ -1,94 +1,127 @@
-from .antenatal_enrollment_form_validation import \
-    AntenatalEnrollmentFormValidator
-from .arvs_pre_pregnancy_form_validation import ArvsPrePregnancyFormValidator
-from .breast_milk_crf_form_validator import BreastMilkCRFFormValidator, \
-    MastitisInlineFormValidator
-from .breastfeeding_questionnaire_form_validator import \
-    BreastFeedingQuestionnaireFormValidator
-from .brief_danger_assessment_form_validator import BriefDangerAssessmentFormValidator
-from .cage_aid_form_validator_mixin import CageAidFormValidatorMixin
-from .caregiver_cage_aid_form_validator import CaregiverCageAidFormValidator
-from .caregiver_child_consent_form_validator import \
-    CaregiverChildConsentFormValidator
-from .caregiver_clinical_measurements_form_validator import \
-    CaregiverClinicalMeasurementsFormValidator
-from .caregiver_contact_form_validator import CaregiverContactFormValidator
-from .caregiver_locator_form_validator import CaregiverLocatorFormValidator
-from .caregiver_prev_enrolled_form_validator import \
-    CaregiverPrevEnrolledFormValidator
-from .caregiver_referral_form_validator import CaregiverReferralFormValidator
-from .caregiver_referral_fu_form_validator import CaregiverReferralFUFormValidator
-from .caregiver_safi_stigma_validator import CaregiverSafiStigmaFormValidator
-from .caregiver_social_work_referral_form_validator import \
-    CaregiverSocialWorkReferralFormValidator
-from .caregiver_tb_referral_outcome_form_validator import \
-    CaregiverTBReferralOutcomeFormValidator
-from .caregiver_tb_screening_form_validator import CaregiverTBScreeningFormValidator
-from .childhood_lead_exposure_risk_form_validator import \
-    ChildhoodLeadExposureRiskFormValidator
-from .covid19_form_validation import Covid19FormValidator
-from .crf_form_validator import FormValidatorMixin
-from .food_security_questionnaire_form_validator import \
-    FoodSecurityQuestionnaireFormValidator
-from .hits_screening_form_validator import HITSScreeningFormValidator
-from .hiv_disclosure_status_form_validator import \
-    HIVDisclosureStatusFormValidator
-from .hiv_rapid_test_counseling_form_validator import \
-    HIVRapidTestCounselingFormValidator
-from .hiv_viralload_cd4_form_validator import HivViralLoadCd4FormValidator
-from .in_person_contact_attempt_form_validator import \
-    InPersonContactAttemptFormValidator
-from .interview_focus_group_interest_validation import \
-    InterviewFocusGroupInterestFormValidator
-from .interview_focus_group_interest_version_2_validation import \
-    InterviewFocusGroupInterestVersion2FormValidator
-from .locator_logs_validator import LocatorLogEntryFormValidator
-from .maternal_arv_adherence_form_validator import MaternalArvAdherenceFormValidator
-from .maternal_arv_at_delivery_form_validations import \
-    MaternalArvAtDeliveryFormValidations
-from .maternal_arv_during_preg_form_validation import \
-    MaternalArvDuringPregFormValidator
-from .maternal_arv_post_adherence_form_validator import \
-    MaternalArvPostAdherenceFormValidator
-from .maternal_delivery_form_validation import MaternalDeliveryFormValidator
-from .maternal_diagnoses_form_validation import MaternalDiagnosesFormValidator
-from .maternal_hiv_interim_hx_form_validation import \
-    MaternalHivInterimHxFormValidator
-from .maternal_interim_idcc_form_validation import \
-    MaternalIterimIdccFormValidator
-from .maternal_interim_idcc_form_version_2_validation import \
-    MaternalIterimIdccFormVersion2Validator
-from .medical_history_form_validation import MedicalHistoryFormValidator
-from .obsterical_history_form_validation import ObstericalHistoryFormValidator
-from .post_hiv_rapid_testing_and_conseling_form_validator import \
-    PostHIVRapidTestCounselingFormValidator
-from .relationship_father_involvement_form_validation import \
-    RelationshipFatherInvolvementFormValidator
-from .screening_prior_bhp_participants_form_validator import \
-    ScreeningPriorBhpParticipantsFormValidator
-from .social_work_referral_validator_mixin import SocialWorkReferralValidatorMixin
-from .socio_demographic_data_form_validator import \
-    SocioDemographicDataFormValidator
-from .subject_consent_form_validation import SubjectConsentFormValidator
-from .substance_use_during_form_validator import \
-    SubstanceUseDuringPregFormValidator
-from .substance_use_prior_form_validator import SubstanceUsePriorFormValidator
-from .tb_adol_consent_form_validator import TbAdolConsentFormValidator, \
-    TbChildAdolConsentFormValidator
-from .tb_adol_eligibility_form_validator import TbAdolEligibilityFormValidator
-from .tb_engagement_form_validator import TbEngagementFormValidator
-from .tb_history_preg_form_validator import TbHistoryPregFormValidator
-from .tb_interview_form_validator import TbInterviewFormValidator
-from .tb_knowledge_form_validator import TbKnowledgeFormValidator
-from .tb_presence_household_members_form_validator import \
-    TbPresenceHouseholdMembersFormValidator
-from .tb_referral_form_validator import TbReferralFormValidator
-from .tb_referral_outcomes_form_validator import TbReferralOutcomesFormValidator
-from .tb_routine_health_screen_form_validator import \
-    TbRoutineHealthScreenFormValidator
-from .tb_routine_health_screen_v2_form_validator import \
-    TbRoutineHealthScreenV2FormValidator
-from .tb_screen_preg_form_validator import TbScreenPregFormValidator
-from .tb_study_eligibility_form_validator import TbStudyEligibilityFormValidator
-from .tb_visit_screening_women_form_validator import TbVisitScreeningWomenFormValidator
-from .ultrasound_form_validator import UltrasoundFormValidator
+"""Exports the form validators and their building blocks.
+
+Names are imported from their module on first access, so importing the
+package, or one validator, does not import every validator module and
+their dependencies.
+"""
+from importlib import import_module
+
+_exports = {
+    'AntenatalEnrollmentFormValidator': 'antenatal_enrollment_form_validation',
+    'ArvsPrePregnancyFormValidator': 'arvs_pre_pregnancy_form_validation',
+    'AsyncValidationMixin': 'async_validation',
+    'BatchLookup': 'batch',
+    'BatchResult': 'batch',
+    'iter_validate_many': 'batch',
+    'validate_many': 'batch',
+    'BreastMilkCRFFormValidator': 'breast_milk_crf_form_validator',
+    'MastitisInlineFormValidator': 'breast_milk_crf_form_validator',
+    'BreastFeedingQuestionnaireFormValidator':
+        'breastfeeding_questionnaire_form_validator',
+    'BriefDangerAssessmentFormValidator': 'brief_danger_assessment_form_validator',
+    'CageAidFormValidatorMixin': 'cage_aid_form_validator_mixin',
+    'CaregiverCageAidFormValidator': 'caregiver_cage_aid_form_validator',
+    'CaregiverChildConsentFormValidator': 'caregiver_child_consent_form_validator',
+    'CaregiverClinicalMeasurementsFormValidator':
+        'caregiver_clinical_measurements_form_validator',
+    'CaregiverContactFormValidator': 'caregiver_contact_form_validator',
+    'CaregiverLocatorFormValidator': 'caregiver_locator_form_validator',
+    'CaregiverPrevEnrolledFormValidator': 'caregiver_prev_enrolled_form_validator',
+    'CaregiverReferralFormValidator': 'caregiver_referral_form_validator',
+    'CaregiverReferralFUFormValidator': 'caregiver_referral_fu_form_validator',
+    'CaregiverSafiStigmaFormValidator': 'caregiver_safi_stigma_validator',
+    'CaregiverSocialWorkReferralFormValidator':
+        'caregiver_social_work_referral_form_validator',
+    'CaregiverTBReferralOutcomeFormValidator':
+        'caregiver_tb_referral_outcome_form_validator',
+    'CaregiverTBScreeningFormValidator': 'caregiver_tb_screening_form_validator',
+    'ChildhoodLeadExposureRiskFormValidator':
+        'childhood_lead_exposure_risk_form_validator',
+    'Covid19FormValidator': 'covid19_form_validation',
+    'FormValidatorMixin': 'crf_form_validator',
+    'FoodSecurityQuestionnaireFormValidator':
+        'food_security_questionnaire_form_validator',
+    'HITSScreeningFormValidator': 'hits_screening_form_validator',
+    'HIVDisclosureStatusFormValidator': 'hiv_disclosure_status_form_validator',
+    'HIVRapidTestCounselingFormValidator': 'hiv_rapid_test_counseling_form_validator',
+    'HivViralLoadCd4FormValidator': 'hiv_viralload_cd4_form_validator',
+    'IdentityFormValidatorMixin': 'identity',
+    'check_identities': 'identity',
+    'check_names': 'identity',
+    'screen_records': 'identity',
+    'InPersonContactAttemptFormValidator': 'in_person_contact_attempt_form_validator',
+    'InterviewFocusGroupInterestMixin': 'interview_focus_group_interest_mixin',
+    'InterviewFocusGroupInterestFormValidator':
+        'interview_focus_group_interest_validation',
+    'InterviewFocusGroupInterestVersion2FormValidator':
+        'interview_focus_group_interest_version_2_validation',
+    'LocatorLogEntryFormValidator': 'locator_logs_validator',
+    'M2MSnapshotMixin': 'm2m_snapshot',
+    'MaternalArvAdherenceFormValidator': 'maternal_arv_adherence_form_validator',
+    'MaternalArvAtDeliveryFormValidations': 'maternal_arv_at_delivery_form_validations',
+    'MaternalArvDuringPregFormValidator': 'maternal_arv_during_preg_form_validation',
+    'MaternalArvPostAdherenceFormValidator': 'maternal_arv_post_adherence_form_validator',
+    'MaternalDeliveryFormValidator': 'maternal_delivery_form_validation',
+    'MaternalDiagnosesFormValidator': 'maternal_diagnoses_form_validation',
+    'MaternalHivInterimHxFormValidator': 'maternal_hiv_interim_hx_form_validation',
+    'MaternalIterimIdccFormValidator': 'maternal_interim_idcc_form_validation',
+    'MaternalIterimIdccFormVersion2Validator':
+        'maternal_interim_idcc_form_version_2_validation',
+    'MedicalHistoryFormValidator': 'medical_history_form_validation',
+    'ObstericalHistoryFormValidator': 'obsterical_history_form_validation',
+    'PostHIVRapidTestCounselingFormValidator':
+        'post_hiv_rapid_testing_and_conseling_form_validator',
+    'RelationshipFatherInvolvementFormValidator':
+        'relationship_father_involvement_form_validation',
+    'Applicable': 'requirements',
+    'NotRequired': 'requirements',
+    'Required': 'requirements',
+    'RequirementTable': 'requirements',
+    'ResultCacheMixin': 'result_cache',
+    'MULTI_QUERY': 'rules',
+    'PURE': 'rules',
+    'SINGLE_QUERY': 'rules',
+    'Rule': 'rules',
+    'RulesResult': 'rules',
+    'ValidationRulesMixin': 'rules',
+    'ScreeningPriorBhpParticipantsFormValidator':
+        'screening_prior_bhp_participants_form_validator',
+    'SocialWorkReferralValidatorMixin': 'social_work_referral_validator_mixin',
+    'SocioDemographicDataFormValidator': 'socio_demographic_data_form_validator',
+    'SubjectConsentFormValidator': 'subject_consent_form_validation',
+    'SubstanceUseDuringPregFormValidator': 'substance_use_during_form_validator',
+    'SubstanceUsePriorFormValidator': 'substance_use_prior_form_validator',
+    'TbAdolConsentFormValidator': 'tb_adol_consent_form_validator',
+    'TbChildAdolConsentFormValidator': 'tb_adol_consent_form_validator',
+    'TbAdolEligibilityFormValidator': 'tb_adol_eligibility_form_validator',
+    'TbEngagementFormValidator': 'tb_engagement_form_validator',
+    'TbHistoryPregFormValidator': 'tb_history_preg_form_validator',
+    'TbInterviewFormValidator': 'tb_interview_form_validator',
+    'TbKnowledgeFormValidator': 'tb_knowledge_form_validator',
+    'TbPresenceHouseholdMembersFormValidator':
+        'tb_presence_household_members_form_validator',
+    'TbReferralFormValidator': 'tb_referral_form_validator',
+    'TbReferralOutcomesFormValidator': 'tb_referral_outcomes_form_validator',
+    'TbRoutineHealthScreenFormValidator': 'tb_routine_health_screen_form_validator',
+    'TbRoutineHealthScreenV2FormValidator': 'tb_routine_health_screen_v2_form_validator',
+    'TbScreenPregFormValidator': 'tb_screen_preg_form_validator',
+    'TbStudyEligibilityFormValidator': 'tb_study_eligibility_form_validator',
+    'TbVisitScreeningWomenFormValidator': 'tb_visit_screening_women_form_validator',
+    'UltrasoundFormValidator': 'ultrasound_form_validator',
+}
+
+__all__ = list(_exports)
+
+
+def __getattr__(name):
+    try:
+        module_name = _exports[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
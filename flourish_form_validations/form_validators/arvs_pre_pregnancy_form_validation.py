@@ -1,10 +1,10 @@
 from django import forms
-from django.apps import apps as django_apps
 from django.core.exceptions import ValidationError
 from edc_constants.constants import YES, NO, RESTARTED, CONTINUOUS, STOPPED, NOT_APPLICABLE
 from edc_form_validators import FormValidator
 
 from .crf_form_validator import FormValidatorMixin
+from .model_registry import get_model
 from flourish_caregiver.constants import NEVER_RECEIVED_ART
 
 
@@ -14,11 +14,11 @@ class ArvsPrePregnancyFormValidator(FormValidatorMixin, FormValidator):
 
     @property
     def antenatal_enrollment_cls(self):
-        return django_apps.get_model(self.antenatal_enrollment_model)
+        return get_model(self.antenatal_enrollment_model)
 
     @property
     def caregiver_consent_model_cls(self):
-        return django_apps.get_model(self.caregiver_consent_model)
+        return get_model(self.caregiver_consent_model)
 
     def clean(self):
         self.subject_identifier = self.cleaned_data.get(
@@ -59,10 +59,9 @@ class ArvsPrePregnancyFormValidator(FormValidatorMixin, FormValidator):
             self._errors.update(msg)
             raise ValidationError(msg)
 
-        qs = self.cleaned_data.get('prior_arv', '')
+        selected = self.m2m_selections('prior_arv')
         prior_preg = self.cleaned_data.get('prior_preg', '')
-        if qs and qs.count() >= 1:
-            selected = {obj.short_name: obj.name for obj in qs}
+        if selected:
             if ((prior_preg != NOT_APPLICABLE and prior_preg != NEVER_RECEIVED_ART)
                 and 'prior_arv_na' in selected):
                 message = {
@@ -107,9 +106,7 @@ class ArvsPrePregnancyFormValidator(FormValidatorMixin, FormValidator):
 
     def validate_hiv_test_date_antenatal_enrollment(self):
         visit_instance = self.cleaned_data.get('maternal_visit', None)
-        onschedule_model_cls = self.visit_onschedule_model_cls(visit_instance)
-        onschedule_model_obj = self.get_onschedule_model_obj(
-            self.subject_identifier, onschedule_model_cls, visit_instance.schedule_name)
+        onschedule_model_obj = self.get_visit_onschedule_obj(visit_instance)
         try:
             antenatal_enrollment = self.antenatal_enrollment_cls.objects.get(
                 subject_identifier=self.cleaned_data.get(
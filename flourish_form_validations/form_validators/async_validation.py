@@ -0,0 +1,152 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import partial
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections, connection
+
+from .batch import PrefetchedLookupsMixin
+
+lookup_workers = getattr(settings, 'VALIDATION_LOOKUP_WORKERS', 4)
+
+_lookup_pool = None
+_lookup_pool_lock = threading.Lock()
+_lookup_thread = threading.local()
+
+
+def lookup_pool():
+    """Returns the bounded thread pool shared by the validators'
+    parallel lookups, created on first use.
+    """
+    global _lookup_pool
+    with _lookup_pool_lock:
+        if _lookup_pool is None:
+            _lookup_pool = ThreadPoolExecutor(
+                max_workers=lookup_workers,
+                thread_name_prefix='validation-lookup',
+                initializer=mark_lookup_thread)
+        return _lookup_pool
+
+
+def mark_lookup_thread():
+    _lookup_thread.active = True
+
+
+def run_lookup(lookup):
+    """Runs `lookup` in a pool thread, on the thread's own database
+    connection.
+
+    As at the start and end of a request, the connection is closed if
+    it is unusable or older than CONN_MAX_AGE. Set CONN_MAX_AGE to keep
+    the pool's connections open between validations.
+    """
+    close_old_connections()
+    try:
+        return lookup()
+    finally:
+        close_old_connections()
+
+
+class AsyncValidationMixin(PrefetchedLookupsMixin):
+    """Adds `aclean` and `avalidate` for use in async views.
+
+    The DB-bound lookups returned by `get_async_lookups` are run
+    concurrently in threads, then clean() runs as usual against the
+    warmed caches and prefetched values, so errors are raised exactly
+    as by validate().
+
+    With `parallel_lookups = True`, validate() runs the same lookups on
+    the shared `lookup_pool` first, see `prefetch_parallel`. Pool
+    threads use their own connections and cannot see rows not yet
+    committed by the calling thread, so inside an atomic block, e.g. an
+    admin save or with ATOMIC_REQUESTS, the lookups run in the calling
+    thread instead.
+
+    Set `async_thread_sensitive = True` to run the lookups in the
+    request thread, e.g. inside a test transaction.
+    """
+
+    async_thread_sensitive = False
+
+    parallel_lookups = False
+
+    def get_async_lookups(self):
+        """Returns a list of stages, each a list of callables that load
+        what clean() needs. Callables in a stage are independent and run
+        concurrently, stages run in order.
+        """
+        return [[self.prefetch(lookup.name, getattr(self, f'get_{lookup.name}'))
+                 for lookup in self.batch_lookups]]
+
+    def prefetch(self, name, loader):
+        """Returns a callable storing the value of `loader` as the
+        prefetched value for `name`.
+        """
+        def load():
+            self.prefetched[name] = loader()
+        return load
+
+    async def aprefetch(self):
+        """Runs the async lookups. A lookup that raises is ignored and
+        left for clean() to run and raise at the usual point.
+
+        Lookups not run in the request thread go through `run_lookup`,
+        as on the lookup pool.
+        """
+        self.reset_prefetched()
+        if self.prefetched is None:
+            self.prefetched = {}
+        for stage in self.get_async_lookups():
+            await asyncio.gather(
+                *[sync_to_async(lookup, thread_sensitive=True)()
+                  if self.async_thread_sensitive
+                  else sync_to_async(partial(run_lookup, lookup), thread_sensitive=False)()
+                  for lookup in stage],
+                return_exceptions=True)
+
+    def prefetch_parallel(self, executor=None):
+        """Runs the async lookups on `executor`, by default the shared
+        lookup pool. Stages run in order, the lookups of a stage run
+        concurrently. A lookup that raises is ignored and left for
+        clean() to run and raise at the usual point.
+
+        Lookups run in the calling thread if `async_thread_sensitive` is
+        set, if it is itself a pool thread, which must not wait on the
+        pool it is holding a thread of, or if it is in an atomic block,
+        whose uncommitted rows other connections cannot see.
+        """
+        self.reset_prefetched()
+        if self.prefetched is None:
+            self.prefetched = {}
+        inline = (self.async_thread_sensitive
+                  or getattr(_lookup_thread, 'active', False)
+                  or connection.in_atomic_block)
+        executor = None if inline else executor or lookup_pool()
+        for stage in self.get_async_lookups():
+            if executor:
+                wait([executor.submit(run_lookup, lookup) for lookup in stage])
+                continue
+            for lookup in stage:
+                try:
+                    lookup()
+                except Exception:
+                    pass
+
+    def validate(self):
+        self.reset_prefetched()
+        if self.parallel_lookups and self.prefetched is None:
+            self.prefetch_parallel()
+        return super().validate()
+
+    async def aclean(self):
+        await self.aprefetch()
+        try:
+            return await sync_to_async(self.clean)()
+        finally:
+            self._prefetched_pending = False
+
+    async def avalidate(self):
+        await self.aprefetch()
+        return await sync_to_async(self.validate)()
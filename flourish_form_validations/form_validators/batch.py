@@ -0,0 +1,155 @@
+from collections import namedtuple
+from itertools import islice
+
+from django.core.exceptions import NON_FIELD_ERRORS, ValidationError
+
+BatchResult = namedtuple('BatchResult', ['index', 'errors', 'error_codes'])
+
+
+class BatchLookup:
+    """A single object lookup that a validator runs once per record,
+    e.g. `model_cls.objects.get(screening_identifier=...)`, and which
+    `validate_many` runs once per batch as an `__in` query instead.
+
+    `model_cls_attr` names the validator property returning the model
+    class and `field` is both the model field and the cleaned_data key
+    holding its value.
+    """
+
+    def __init__(self, name, model_cls_attr, field):
+        self.name = name
+        self.model_cls_attr = model_cls_attr
+        self.field = field
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.name!r})'
+
+    def fetch(self, validator, values):
+        """Returns a dict of {value: obj} for `values` and the set of
+        values matching more than one object.
+        """
+        model_cls = getattr(validator, self.model_cls_attr)
+        objs, ambiguous = {}, set()
+        values = {value for value in values if value is not None}
+        if values:
+            for obj in model_cls.objects.filter(**{f'{self.field}__in': values}):
+                value = getattr(obj, self.field)
+                if value in objs:
+                    ambiguous.add(value)
+                objs[value] = obj
+        return objs, ambiguous
+
+
+class PrefetchedLookupsMixin:
+    """Serves a validator's single object lookups from values fetched
+    ahead of clean(), for example by `validate_many`.
+
+    Values are kept for the next validation only: those set ahead of
+    it are used, then dropped by the one after, as are values looked up
+    during it.
+    """
+
+    batch_lookups = []
+
+    _prefetched = None
+
+    _prefetched_pending = False
+
+    @property
+    def prefetched(self):
+        return self._prefetched
+
+    @prefetched.setter
+    def prefetched(self, values):
+        self._prefetched = values
+        self._prefetched_pending = values is not None
+
+    def reset_prefetched(self):
+        """Drops the values of an earlier validation, keeping those set
+        for the next one.
+        """
+        if not self._prefetched_pending:
+            self._prefetched = None
+
+    def validate(self):
+        self.reset_prefetched()
+        try:
+            return super().validate()
+        finally:
+            self._prefetched_pending = False
+
+    def get_prefetched(self, name, loader):
+        """Returns the prefetched value for `name` if there is one,
+        otherwise calls `loader`.
+        """
+        if self.prefetched and name in self.prefetched:
+            return self.prefetched[name]
+        return loader()
+
+
+def validation_errors(form_validator, e):
+    """Returns the errors of ValidationError `e` raised by
+    `form_validator`, from the exception if the failing rule did not
+    record them in `_errors`.
+    """
+    if form_validator._errors:
+        return form_validator._errors
+    if hasattr(e, 'error_dict'):
+        return e.message_dict
+    return {NON_FIELD_ERRORS: e.messages}
+
+
+def prefetch_lookups(validator_cls, records):
+    """Returns a list with a dict of prefetched lookup values for each
+    cleaned_data dict in `records`.
+
+    Values of a lookup matching more than one object are left out so
+    the validator's own lookup runs, and raises, as it does today.
+    """
+    probe = validator_cls(cleaned_data={})
+    prefetched = [{} for _ in records]
+    for lookup in validator_cls.batch_lookups:
+        values = [cleaned_data.get(lookup.field) for cleaned_data in records]
+        objs, ambiguous = lookup.fetch(probe, values)
+        for index, value in enumerate(values):
+            if value not in ambiguous:
+                prefetched[index][lookup.name] = objs.get(value)
+    return prefetched
+
+
+def iter_validate_many(validator_cls, records, batch_size=500):
+    """Validates each cleaned_data dict in the iterable `records` with
+    `validator_cls` and yields a BatchResult per record.
+
+    Lookups declared in `validator_cls.batch_lookups` are run once per
+    batch of `batch_size` records.
+    """
+    records = iter(records)
+    offset = 0
+    while True:
+        batch = list(islice(records, batch_size))
+        if not batch:
+            break
+        prefetched = prefetch_lookups(validator_cls, batch)
+        for index, cleaned_data in enumerate(batch):
+            form_validator = validator_cls(cleaned_data=cleaned_data)
+            form_validator.prefetched = prefetched[index]
+            try:
+                form_validator.validate()
+            except ValidationError as e:
+                yield BatchResult(
+                    index=offset + index,
+                    errors=validation_errors(form_validator, e),
+                    error_codes=form_validator._error_codes)
+            else:
+                yield BatchResult(index=offset + index, errors=None, error_codes=[])
+        offset += len(batch)
+
+
+def validate_many(validator_cls, records, batch_size=500):
+    """Returns a list of BatchResult, one per cleaned_data dict in
+    `records`, in order. A result's `errors` is None if the record is
+    valid.
+    """
+    return list(iter_validate_many(
+        validator_cls, records, batch_size=batch_size))
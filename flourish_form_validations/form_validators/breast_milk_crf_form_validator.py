@@ -1,4 +1,3 @@
-from django.apps import apps as django_apps
 from django.core.exceptions import ValidationError
 from edc_constants.constants import NO, OTHER, YES
 from edc_form_validators import FormValidator, INVALID_ERROR, NOT_REQUIRED_ERROR
@@ -6,6 +5,7 @@ from edc_form_validators import FormValidator, INVALID_ERROR, NOT_REQUIRED_ERROR
 from flourish_caregiver.constants import BREASTFEED_ONLY
 
 from .crf_form_validator import FormValidatorMixin
+from .model_registry import get_model
 
 
 class BreastMilkFormValidatorMixin(FormValidatorMixin, FormValidator):
@@ -32,20 +32,19 @@ class BreastMilkFormValidatorMixin(FormValidatorMixin, FormValidator):
 
     @property
     def birth_feeding_vaccine_model_cls(self):
-        return django_apps.get_model(self.birth_feeding_vaccine_model)
+        return get_model(self.birth_feeding_vaccine_model)
 
     def onschedule_model_cls(self, onschedule_model):
-        return django_apps.get_model(onschedule_model)
+        return get_model(onschedule_model)
 
     def validate_infection_type(self, m2m_field, infection_type):
 
         infection_type = self.cleaned_data.get(infection_type)
-        m2m_field_options = self.cleaned_data.get(m2m_field)
+        selected = self.m2m_selections(m2m_field)
 
-        if m2m_field_options and m2m_field_options.count() > 0:
-            selected = {obj.short_name: obj.name for obj in m2m_field_options}
+        if selected:
             if ((infection_type != 'unilateral' and 'uninfected_breast' in
-                 selected.keys())):
+                 selected)):
                 message = {
                     m2m_field: 'Breastfed from uninfected breast and pumped and dumped '
                                'from the affected breast” can only be selected if '
@@ -54,8 +53,8 @@ class BreastMilkFormValidatorMixin(FormValidatorMixin, FormValidator):
                 self._error_codes.append(NOT_REQUIRED_ERROR)
                 raise ValidationError(message, code=NOT_REQUIRED_ERROR)
 
-            if m2m_field_options.count() > 1:
-                if OTHER not in selected.keys() and m2m_field_options.count() < 3:
+            if len(selected) > 1:
+                if OTHER not in selected and len(selected) < 3:
                     message = {
                         m2m_field:
                             f'You can only select more than 1 options if you include '
@@ -64,7 +63,7 @@ class BreastMilkFormValidatorMixin(FormValidatorMixin, FormValidator):
                     self._errors.update(message)
                     self._error_codes.append(INVALID_ERROR)
                     raise ValidationError(message, code=INVALID_ERROR)
-                if m2m_field_options.count() > 2:
+                if len(selected) > 2:
                     message = {
                         m2m_field:
                             f'You can only select 1 option if you include \'Other\' '
@@ -75,16 +74,9 @@ class BreastMilkFormValidatorMixin(FormValidatorMixin, FormValidator):
 
     def get_child_subject_identifier_by_visit(self, visit):
         """Returns the child subject identifier by visit."""
-        onschedule_model_cls = self.onschedule_model_cls(
-            visit.schedule.onschedule_model)
-
-        if onschedule_model_cls:
-            onschedule_obj = self.get_onschedule_model_obj(
-                subject_identifier=visit.subject_identifier,
-                schedule_name=visit.schedule_name,
-                model_cls=onschedule_model_cls
-            )
-            return onschedule_obj.child_subject_identifier if onschedule_obj else None
+        if self.get_visit_context(visit).onschedule_model_cls:
+            onschedule_obj = self.get_visit_onschedule_obj(visit)
+            return onschedule_obj.child_subject_identifier
 
     def get_birth_feeding_vaccine(self, child_subject_identifier, visit_code):
         try:
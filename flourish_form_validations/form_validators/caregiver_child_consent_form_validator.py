@@ -1,15 +1,19 @@
 import datetime
-import re
 
-from django.apps import apps as django_apps
 from django.core.exceptions import ValidationError
 from edc_base.utils import age
 from edc_constants.choices import FEMALE, MALE, NO, NOT_APPLICABLE, YES
 from edc_form_validators import FormValidator
 from edc_form_validators.base_form_validator import NOT_APPLICABLE_ERROR
 
+from .identity import IdentityFormValidatorMixin
+from .model_registry import get_model
+
+
+class CaregiverChildConsentFormValidator(IdentityFormValidatorMixin, FormValidator):
+
+    identity_types = ['country_id', 'birth_cert']
 
-class CaregiverChildConsentFormValidator(FormValidator):
     child_dataset_model = 'flourish_child.childdataset'
 
     preg_women_screening_model = 'flourish_caregiver.screeningpregwomen'
@@ -18,15 +22,15 @@ class CaregiverChildConsentFormValidator(FormValidator):
 
     @property
     def child_dataset_cls(self):
-        return django_apps.get_model(self.child_dataset_model)
+        return get_model(self.child_dataset_model)
 
     @property
     def preg_screening_cls(self):
-        return django_apps.get_model(self.preg_women_screening_model)
+        return get_model(self.preg_women_screening_model)
 
     @property
     def delivery_model_cls(self):
-        return django_apps.get_model(self.delivery_model)
+        return get_model(self.delivery_model)
 
     def clean(self):
 
@@ -98,38 +102,6 @@ class CaregiverChildConsentFormValidator(FormValidator):
                     self._errors.update(message)
                     raise ValidationError(message)
 
-    def clean_full_name_syntax(self):
-        cleaned_data = self.cleaned_data
-        first_name = cleaned_data.get("first_name")
-        last_name = cleaned_data.get("last_name")
-
-        if first_name:
-            if not re.match(r'^[A-Z]+$|^([A-Z]+[ ][A-Z]+)$', first_name):
-                message = {'first_name': 'Ensure first name is letters (A-Z) in '
-                                         'upper case, no special characters, '
-                                         'except spaces. Maximum 2 first '
-                                         'names allowed.'}
-                self._errors.update(message)
-                raise ValidationError(message)
-
-        if last_name:
-            if not re.match(r'^[A-Z-]+$', last_name):
-                message = {'last_name': 'Ensure last name is letters (A-Z) in '
-                                        'upper case, no special characters, '
-                                        'except hyphens.'}
-                self._errors.update(message)
-                raise ValidationError(message)
-
-            if first_name and last_name:
-                if first_name != first_name.upper():
-                    message = {'first_name': 'First name must be in CAPS.'}
-                    self._errors.update(message)
-                    raise ValidationError(message)
-                elif last_name != last_name.upper():
-                    message = {'last_name': 'Last name must be in CAPS.'}
-                    self._errors.update(message)
-                    raise ValidationError(message)
-
     def validate_identity_number(self, cleaned_data=None):
         identity = cleaned_data.get('identity')
         required_fields = ['identity_type', 'confirm_identity', ]
@@ -137,37 +109,7 @@ class CaregiverChildConsentFormValidator(FormValidator):
             self.required_if_true(
                 identity is not None and identity != '',
                 field_required=required)
-        if identity:
-            if not re.match('[0-9]+$', identity):
-                message = {'identity': 'Identity number must be digits.'}
-                self._errors.update(message)
-                raise ValidationError(message)
-            if cleaned_data.get('identity') != cleaned_data.get(
-                    'confirm_identity'):
-                msg = {'identity':
-                       '\'Identity\' must match \'confirm identity\'.'}
-                self._errors.update(msg)
-                raise ValidationError(msg)
-            if cleaned_data.get('identity_type') in ['country_id',
-                                                     'birth_cert']:
-                if len(cleaned_data.get('identity')) != 9:
-                    msg = {'identity':
-                           'Country identity provided should contain 9 values. '
-                           'Please correct.'}
-                    self._errors.update(msg)
-                    raise ValidationError(msg)
-                gender = cleaned_data.get('gender')
-                if gender == FEMALE and cleaned_data.get('identity')[4] != '2':
-                    msg = {'identity':
-                           'Participant gender is Female. Please correct '
-                           'identity number.'}
-                    self._errors.update(msg)
-                    raise ValidationError(msg)
-                elif gender == MALE and cleaned_data.get('identity')[4] != '1':
-                    msg = {'identity':
-                           'Participant is Male. Please correct identity number.'}
-                    self._errors.update(msg)
-                    raise ValidationError(msg)
+        super().validate_identity_number(cleaned_data=cleaned_data)
 
     def validate_child_preg_test(self, cleaned_data=None):
         if (cleaned_data.get('gender') and cleaned_data.get('gender') == 'M'
@@ -3,11 +3,27 @@ from edc_constants.constants import NO, YES
 from edc_form_validators import FormValidator
 
 from .crf_form_validator import FormValidatorMixin
+from .rules import Rule, ValidationRulesMixin
 
 
 class CaregiverClinicalMeasurementsFormValidator(FormValidatorMixin,
+                                                 ValidationRulesMixin,
                                                  FormValidator):
 
+    rules = [
+        Rule('check_all_cm_tb_del_valid'),
+        Rule('check_all_cm_valid_1000M'),
+        Rule('check_all_cm_valid_2000M'),
+        Rule('check_all_cm_valid_3000M'),
+        Rule('validate_blood_pressure'),
+        Rule('validate_measurement_margins'),
+    ]
+
+    measurements = [
+        ('waist_circ', 'waist_circ_second', 'waist_circ_third'),
+        ('hip_circ', 'hip_circ_second', 'hip_circ_third'),
+    ]
+
     def clean(self):
 
         cleaned_data = self.cleaned_data
@@ -15,10 +31,10 @@ class CaregiverClinicalMeasurementsFormValidator(FormValidatorMixin,
             'maternal_visit').subject_identifier
         super().clean()
 
-        self.check_all_cm_tb_del_valid()
-        self.check_all_cm_valid_1000M()
-        self.check_all_cm_valid_2000M()
-        self.check_all_cm_valid_3000M()
+        self.run_rules()
+
+    def validate_blood_pressure(self):
+        cleaned_data = self.cleaned_data
 
         if (cleaned_data.get('systolic_bp') and cleaned_data.get('diastolic_bp')):
             if cleaned_data.get('systolic_bp') < cleaned_data.get('diastolic_bp'):
@@ -34,12 +50,8 @@ class CaregiverClinicalMeasurementsFormValidator(FormValidatorMixin,
                               and cleaned_data.get('diastolic_bp') is not None,
                               field_required='confirm_values')
 
-        measurements = [
-            ('waist_circ', 'waist_circ_second', 'waist_circ_third'),
-            ('hip_circ', 'hip_circ_second', 'hip_circ_third'),
-        ]
-
-        for fields in measurements:
+    def validate_measurement_margins(self):
+        for fields in self.measurements:
             self.validate_measurement_margin(*fields)
 
     @property
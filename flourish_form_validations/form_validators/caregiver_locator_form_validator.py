@@ -1,36 +1,72 @@
-from django.apps import apps as django_apps
 from django.core.exceptions import ValidationError
 from edc_constants.constants import YES, NO, NOT_APPLICABLE
 from edc_form_validators.form_validator import FormValidator
 
+from .model_registry import get_model
+from .requirements import NotRequired, Required, RequirementTable
+from .rules import Rule, ValidationRulesMixin
 
-class CaregiverLocatorFormValidator(FormValidator):
+
+class CaregiverLocatorFormValidator(ValidationRulesMixin, FormValidator):
 
     maternal_dataset_model = 'flourish_caregiver.maternaldataset'
 
     @property
     def maternal_dataset_model_cls(self):
-        return django_apps.get_model(self.maternal_dataset_model)
+        return get_model(self.maternal_dataset_model)
 
     @property
     def caregiver_child_consent_model_cls(self):
-        return django_apps.get_model(self.caregiver_child_consent_model)
+        return get_model(self.caregiver_child_consent_model)
+
+    rules = [
+        Rule('validate_physical_address'),
+        Rule('validate_subject_contacts'),
+        Rule('validate_work_contacts'),
+        Rule('validate_indirect_contacts'),
+        Rule('validate_caretaker'),
+        Rule('validate_is_locator_updated'),
+    ]
+
+    subject_contacts_requirements = RequirementTable(
+        NotRequired(NO, NOT_APPLICABLE, field='may_call',
+                    targets=['subject_cell', 'subject_cell_alt',
+                             'subject_phone', 'subject_phone_alt'],
+                    inverse=False),
+    )
+
+    work_contacts_requirements = RequirementTable(
+        NotRequired(NO, 'Doesnt_work', field='may_call_work',
+                    targets=['subject_work_place', 'subject_work_phone'],
+                    inverse=False),
+    )
+
+    indirect_contacts_requirements = RequirementTable(
+        NotRequired(NO, field='may_contact_indirectly',
+                    targets=['indirect_contact_physical_address',
+                             'indirect_contact_cell', 'indirect_contact_phone',
+                             'indirect_contact_name', 'indirect_contact_relation'],
+                    inverse=False),
+    )
+
+    caretaker_requirements = RequirementTable(
+        Required(YES, field='has_caretaker', targets=['caretaker_name']),
+        NotRequired(NO, field='has_caretaker',
+                    targets=['caretaker_cell', 'caretaker_tel'],
+                    inverse=False),
+    )
 
     def clean(self):
+        self.run_rules()
+
+    def validate_physical_address(self):
         self.required_if(
             YES,
             field='may_visit_home',
             field_required='physical_address')
 
-        not_required_fields = ['subject_cell', 'subject_cell_alt',
-                               'subject_phone', 'subject_phone_alt']
-
-        for not_required in not_required_fields:
-            self.not_required_if(
-                *[NO, NOT_APPLICABLE],
-                field='may_call',
-                field_required=not_required,
-                inverse=False)
+    def validate_subject_contacts(self):
+        self.subject_contacts_requirements.evaluate(self)
 
         may_call = self.cleaned_data.get('may_call')
         subject_cell = self.cleaned_data.get('subject_cell')
@@ -41,6 +77,7 @@ class CaregiverLocatorFormValidator(FormValidator):
             self._errors.update(msg)
             raise ValidationError(msg)
 
+    def validate_work_contacts(self):
         may_call_work = self.cleaned_data.get('may_call_work')
         workplace = self.cleaned_data.get('subject_work_place')
         work_phone = self.cleaned_data.get('subject_work_phone')
@@ -51,14 +88,9 @@ class CaregiverLocatorFormValidator(FormValidator):
             self._errors.update(msg)
             raise ValidationError(msg)
 
-        fields = ['subject_work_place', 'subject_work_phone']
-        for field in fields:
-            self.not_required_if(
-                *[NO, 'Doesnt_work'],
-                field='may_call_work',
-                field_required=field,
-                inverse=False)
+        self.work_contacts_requirements.evaluate(self)
 
+    def validate_indirect_contacts(self):
         contact_indirectly = self.cleaned_data.get('may_contact_indirectly')
         indirect_contact_cell = self.cleaned_data.get('indirect_contact_cell')
         indirect_contact_phone = self.cleaned_data.get('indirect_contact_phone')
@@ -71,29 +103,12 @@ class CaregiverLocatorFormValidator(FormValidator):
             self._errors.update(msg)
             raise ValidationError(msg)
 
-        not_required_fields = ['indirect_contact_physical_address',
-                               'indirect_contact_cell', 'indirect_contact_phone',
-                               'indirect_contact_name', 'indirect_contact_relation']
-        for not_required in not_required_fields:
-            self.not_required_if(
-                NO,
-                field='may_contact_indirectly',
-                field_required=not_required,
-                inverse=False)
-
-        self.required_if(
-            YES,
-            field='has_caretaker',
-            field_required='caretaker_name')
+        self.indirect_contacts_requirements.evaluate(self)
 
-        not_required_fields = ['caretaker_cell', 'caretaker_tel']
-        for not_required in not_required_fields:
-            self.not_required_if(
-                NO,
-                field='has_caretaker',
-                field_required=not_required,
-                inverse=False)
+    def validate_caretaker(self):
+        self.caretaker_requirements.evaluate(self)
 
+    def validate_is_locator_updated(self):
         self.required_if_true(
             self.cleaned_data.get('subject_identifier') and 'P' in self.cleaned_data.get('subject_identifier'),
             field_required='is_locator_updated'
@@ -1,11 +1,13 @@
 from dateutil.relativedelta import relativedelta
-from django.apps import apps as django_apps
 from django.core.exceptions import ValidationError
 from edc_constants.constants import IND, NEG, NO, POS, UNK, YES
 from edc_form_validators.form_validator import FormValidator
 
+from .async_validation import AsyncValidationMixin
+from .model_registry import get_model
 
-class CaregiverPrevEnrolledFormValidator(FormValidator):
+
+class CaregiverPrevEnrolledFormValidator(AsyncValidationMixin, FormValidator):
     maternal_dataset_model = 'flourish_caregiver.maternaldataset'
 
     subject_consent_model = 'flourish_caregiver.subjectconsent'
@@ -16,19 +18,19 @@ class CaregiverPrevEnrolledFormValidator(FormValidator):
 
     @property
     def maternal_dataset_model_cls(self):
-        return django_apps.get_model(self.maternal_dataset_model)
+        return get_model(self.maternal_dataset_model)
 
     @property
     def child_assent_cls(self):
-        return django_apps.get_model(self.child_assent_model)
+        return get_model(self.child_assent_model)
 
     @property
     def subject_consent_model_cls(self):
-        return django_apps.get_model(self.subject_consent_model)
+        return get_model(self.subject_consent_model)
 
     @property
     def bhp_prior_screening_model_cls(self):
-        return django_apps.get_model(self.bhp_prior_screening_model)
+        return get_model(self.bhp_prior_screening_model)
 
     def clean(self):
 
@@ -114,19 +116,30 @@ class CaregiverPrevEnrolledFormValidator(FormValidator):
                 field_required=field,
                 inverse=False)
 
+    def get_async_lookups(self):
+        return [
+            [self.prefetch('subject_consent_obj', self.get_subject_consent_obj)],
+            [self.prefetch('flourish_participation', self.get_flourish_participation),
+             self.prefetch('maternal_dataset_hiv_status',
+                           self.get_maternal_dataset_hiv_status)]]
+
     def flourish_participation_interest(self, flourish_participation):
+        return flourish_participation in self.get_prefetched(
+            'flourish_participation', self.get_flourish_participation)
 
+    def get_flourish_participation(self):
         bhp_prior_screenings = self.bhp_prior_screening_model_cls.objects.filter(
             subject_identifier=self.subject_consent_obj.subject_identifier)
 
-        if bhp_prior_screenings:
-            return flourish_participation in bhp_prior_screenings.values_list(
-                'flourish_participation', flat=True)
-
-        return False
+        return list(bhp_prior_screenings.values_list(
+            'flourish_participation', flat=True))
 
     @property
     def maternal_dataset_hiv_status(self):
+        return self.get_prefetched(
+            'maternal_dataset_hiv_status', self.get_maternal_dataset_hiv_status)
+
+    def get_maternal_dataset_hiv_status(self):
 
         maternal_dataset_objs = self.maternal_dataset_model_cls.objects.filter(
             subject_identifier=self.subject_consent_obj.subject_identifier)
@@ -143,6 +156,9 @@ class CaregiverPrevEnrolledFormValidator(FormValidator):
 
     @property
     def subject_consent_obj(self):
+        return self.get_prefetched('subject_consent_obj', self.get_subject_consent_obj)
+
+    def get_subject_consent_obj(self):
         try:
             subject_consent = self.subject_consent_model_cls.objects.filter(
                 subject_identifier=self.cleaned_data.get(
@@ -94,15 +94,8 @@ class CaregiverReferralFUFormValidator(FormValidatorMixin, FormValidator):
         """
         message = None
         if (self.cleaned_data.get(field) == response
-                and self.cleaned_data.get(m2m_field)):
+                and self.m2m_selections(m2m_field)):
             message = {m2m_field: 'This field is not required'}
-        elif (self.cleaned_data.get(field) == response
-              and self.cleaned_data.get(m2m_field).count() != 0):
-            message = {m2m_field: 'This field is not required'}
-        elif (self.cleaned_data.get(field) != response
-              and self.cleaned_data.get(m2m_field)
-              and self.cleaned_data.get(m2m_field).count() == 0):
-            message = {m2m_field: 'This field is required'}
         if message:
             self._errors.update(message)
             raise ValidationError(message)
@@ -0,0 +1,45 @@
+from django.conf import settings
+from django.core.cache import caches
+
+consent_version_cache_alias = getattr(settings, 'CONSENT_VERSION_CACHE', 'default')
+
+consent_version_cache_ttl = getattr(settings, 'CONSENT_VERSION_CACHE_TTL', 3600)
+
+# Model names of the consent version models, dropped from the cache on
+# save or delete.
+consent_version_models = getattr(
+    settings, 'CONSENT_VERSION_MODELS', ['flourishconsentversion'])
+
+# Cached for a screening identifier without a consent version.
+NO_CONSENT_VERSION = 'no_consent_version'
+
+
+def consent_version_key(consent_version_cls, screening_identifier):
+    return (f'flourish_form_validations.consent_version.'
+            f'{consent_version_cls._meta.label_lower}.{screening_identifier}')
+
+
+def get_consent_version(consent_version_cls, screening_identifier):
+    """Returns the consent version for `screening_identifier` or None,
+    read through the shared cache so all processes share one lookup.
+    """
+    cache = caches[consent_version_cache_alias]
+    key = consent_version_key(consent_version_cls, screening_identifier)
+    consent_version = cache.get(key)
+    if consent_version is None:
+        try:
+            consent_version = consent_version_cls.objects.get(
+                screening_identifier=screening_identifier)
+        except consent_version_cls.DoesNotExist:
+            consent_version = NO_CONSENT_VERSION
+        cache.set(key, consent_version, consent_version_cache_ttl)
+    if consent_version == NO_CONSENT_VERSION:
+        return None
+    return consent_version
+
+
+def invalidate_consent_version(consent_version_cls, screening_identifier):
+    """Drops the cached consent version of `screening_identifier`.
+    """
+    caches[consent_version_cache_alias].delete(
+        consent_version_key(consent_version_cls, screening_identifier))
@@ -1,7 +1,8 @@
-from django.apps import apps as django_apps
+from .batch import PrefetchedLookupsMixin
+from .model_registry import get_model
 
 
-class ConsentsFormValidatorMixin:
+class ConsentsFormValidatorMixin(PrefetchedLookupsMixin):
 
     maternal_dataset_model = 'flourish_caregiver.maternaldataset'
 
@@ -9,14 +10,17 @@ class ConsentsFormValidatorMixin:
 
     @property
     def maternal_dataset_cls(self):
-        return django_apps.get_model(self.maternal_dataset_model)
+        return get_model(self.maternal_dataset_model)
 
     @property
     def child_dataset_cls(self):
-        return django_apps.get_model(self.child_dataset_model)
+        return get_model(self.child_dataset_model)
 
     @property
     def maternal_dataset(self):
+        return self.get_prefetched('maternal_dataset', self.get_maternal_dataset)
+
+    def get_maternal_dataset(self):
         try:
             maternal_dataset = self.maternal_dataset_cls.objects.get(
                 screening_identifier=self.screening_identifier)
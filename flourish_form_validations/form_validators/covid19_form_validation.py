@@ -2,15 +2,28 @@ from django.core.exceptions import ValidationError
 from edc_constants.constants import YES, POS, NO
 from edc_form_validators import FormValidator
 
+from .rules import Rule, ValidationRulesMixin
 
-class Covid19FormValidator(FormValidator):
+
+class Covid19FormValidator(ValidationRulesMixin, FormValidator):
+
+    rules = [
+        Rule('validate_booster_vac'),
+        Rule('validate_covid_test'),
+        Rule('validate_member_test'),
+        Rule('validate_single_selections'),
+        Rule('validate_vaccination'),
+    ]
 
     def clean(self):
 
         self.validate_visit()
 
-        self.validate_booster_vac()
+        self.run_rules()
+
+        return super().clean()
 
+    def validate_covid_test(self):
         required_fields = [
             'date_of_test', 'is_test_estimated', 'reason_for_testing',
             'result_of_test'
@@ -34,10 +47,12 @@ class Covid19FormValidator(FormValidator):
         self.validate_other_specify(field='isolation_location',
                                     other_specify_field='other_isolation_location')
 
+    def validate_member_test(self):
         self.required_if(YES,
                          field='has_tested_positive',
                          field_required='date_of_test_member')
 
+    def validate_single_selections(self):
         single_selection_fields = {}
         if 'maternal_visit' in self.cleaned_data:
             single_selection_fields = {
@@ -51,6 +66,7 @@ class Covid19FormValidator(FormValidator):
         for field, response in single_selection_fields.items():
             self.m2m_single_selection_if(response, m2m_field=field)
 
+    def validate_vaccination(self):
         if self.cleaned_data.get('fully_vaccinated') == YES:
 
             if self.cleaned_data.get(
@@ -115,8 +131,6 @@ class Covid19FormValidator(FormValidator):
                                      field='fully_vaccinated',
                                      field_required=field)
 
-        return super().clean()
-
     def validate_booster_vac(self):
         self.required_if(
             YES,
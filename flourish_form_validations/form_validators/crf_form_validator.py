@@ -1,43 +1,106 @@
 from django import forms
-from django.apps import apps as django_apps
-from edc_action_item.site_action_items import site_action_items
-from edc_constants.constants import NO, NEW, NOT_APPLICABLE
-from flourish_caregiver.helper_classes import MaternalStatusHelper
-from flourish_prn.action_items import CAREGIVEROFF_STUDY_ACTION
+from edc_constants.constants import NO, NOT_APPLICABLE
 from django.core.exceptions import ValidationError
 from edc_base.utils import get_utcnow
 
+from .async_validation import AsyncValidationMixin
+from .hiv_status import get_hiv_status
+from .m2m_snapshot import M2MSnapshotMixin
+from .model_registry import get_model
+from .result_cache import ResultCacheMixin
+from .subject_context import SubjectContext
+from .visit_context import get_visit_context
 
-class FormValidatorMixin:
+
+class FormValidatorMixin(ResultCacheMixin, M2MSnapshotMixin, AsyncValidationMixin):
 
     consent_version_model = 'flourish_caregiver.flourishconsentversion'
     caregiver_offstudy_model = 'flourish_prn.caregiveroffstudy'
     subject_consent_model = 'flourish_caregiver.subjectconsent'
+    caregiver_child_consent_model = 'flourish_caregiver.caregiverchildconsent'
+
+    _subject_context_prefetched = False
 
     @property
     def consent_version_cls(self):
-        return django_apps.get_model(self.consent_version_model)
+        return get_model(self.consent_version_model)
 
     @property
     def caregiver_offstudy_cls(self):
-        return django_apps.get_model(self.caregiver_offstudy_model)
+        return get_model(self.caregiver_offstudy_model)
 
     @property
     def subject_consent_cls(self):
-        return django_apps.get_model(self.subject_consent_model)
+        return get_model(self.subject_consent_model)
+
+    @property
+    def caregiver_child_consent_cls(self):
+        return get_model(self.caregiver_child_consent_model)
 
     def onschedule_model(self, instance=None):
         schedule = getattr(instance, 'schedule', None)
         return getattr(schedule, 'onschedule_model', None)
 
     def onschedule_model_cls(self, onschedule_model):
-        return django_apps.get_model(onschedule_model)
+        return get_model(onschedule_model)
 
     def visit_onschedule_model_cls(self, instance=None):
         schedule = getattr(instance, 'schedule', None)
         return getattr(schedule, 'onschedule_model_cls', None)
 
+    @property
+    def subject_context(self):
+        """Returns the subject context for the current validation,
+        rebuilt if the subject identifier has changed.
+        """
+        subject_identifier = getattr(self, 'subject_identifier', None)
+        context = getattr(self, '_subject_context', None)
+        if context is None or context.subject_identifier != subject_identifier:
+            context = SubjectContext(
+                subject_identifier=subject_identifier,
+                subject_consent_cls=self.subject_consent_cls,
+                consent_version_cls=self.consent_version_cls,
+                caregiver_offstudy_cls=self.caregiver_offstudy_cls)
+            self._subject_context = context
+        return context
+
+    def prepare_subject_context(self):
+        """Returns the subject context of cleaned_data, kept by the next
+        clean().
+        """
+        if self.cleaned_data.get('maternal_visit', None):
+            self.subject_identifier = self.cleaned_data.get(
+                'maternal_visit').subject_identifier
+        else:
+            self.subject_identifier = self.cleaned_data.get(
+                'subject_identifier')
+        context = self.subject_context
+        self._subject_context_prefetched = True
+        return context
+
+    def result_cache_identifiers(self):
+        """Adds the screening identifier the subject's consent version
+        is stamped by.
+        """
+        identifiers = super().result_cache_identifiers()
+        consent = self.prepare_subject_context().latest_consent_obj
+        screening_identifier = getattr(consent, 'screening_identifier', None)
+        if screening_identifier and screening_identifier not in identifiers:
+            identifiers.append(screening_identifier)
+        return identifiers
+
+    def get_async_lookups(self):
+        context = self.prepare_subject_context()
+
+        lookups = super().get_async_lookups()
+        lookups[0].append(lambda: context.latest_consent_obj)
+        lookups.append([lambda: context.consent_version_obj])
+        return lookups
+
     def clean(self):
+        if not self._subject_context_prefetched:
+            self._subject_context = None
+        self._subject_context_prefetched = False
         if self.cleaned_data.get('maternal_visit', None):
             self.subject_identifier = self.cleaned_data.get(
                 'maternal_visit').subject_identifier
@@ -70,25 +133,10 @@ class FormValidatorMixin:
                 "Report datetime cannot be before visit datetime.")
 
     def validate_offstudy_model(self):
-
-        action_cls = site_action_items.get(
-            self.caregiver_offstudy_cls.action_name)
-        action_item_model_cls = action_cls.action_item_model_cls()
         report_datetime = self.cleaned_data.get('report_datetime', get_utcnow())
 
-        try:
-            action_item_model_cls.objects.get(
-                subject_identifier=self.subject_identifier,
-                action_type__name=CAREGIVEROFF_STUDY_ACTION,
-                status=NEW)
-        except action_item_model_cls.DoesNotExist:
-            try:
-                self.caregiver_offstudy_cls.objects.get(
-                    subject_identifier=self.subject_identifier,
-                    offstudy_date__lt=report_datetime.date())
-            except self.caregiver_offstudy_cls.DoesNotExist:
-                pass
-            else:
+        if not self.subject_context.pending_offstudy_action:
+            if self.subject_context.offstudy_before(report_datetime.date()):
                 raise forms.ValidationError(
                     'Participant has been taken offstudy. Cannot capture any '
                     'new data.')
@@ -102,30 +150,19 @@ class FormValidatorMixin:
 
     def validate_consent_version_obj(self):
 
-        if self.latest_consent_obj:
-            try:
-                self.consent_version_cls.objects.get(
-                    screening_identifier=self.latest_consent_obj.screening_identifier)
-            except self.consent_version_cls.DoesNotExist:
-                raise forms.ValidationError(
-                    'Consent version form has not been completed, kindly complete it before'
-                    ' continuing.')
+        if self.latest_consent_obj and not self.subject_context.consent_version_obj:
+            raise forms.ValidationError(
+                'Consent version form has not been completed, kindly complete it before'
+                ' continuing.')
 
     @property
     def latest_consent_obj(self):
-
-        subject_consents = self.subject_consent_cls.objects.filter(
-            subject_identifier=self.subject_identifier)
-
-        if subject_consents:
-            return subject_consents.latest('consent_datetime')
+        return self.subject_context.latest_consent_obj
 
     def m2m_applicable_if_true(self, field_check, m2m_field=None, ):
         message = None
-        qs = self.cleaned_data.get(m2m_field)
-        if qs and qs.count() > 0:
-            selected = {obj.short_name: obj.name for obj in qs}
-
+        selected = self.m2m_selections(m2m_field)
+        if selected:
             if field_check and NOT_APPLICABLE in selected:
                 message = {m2m_field: 'This field is applicable'}
             elif not field_check and NOT_APPLICABLE not in selected:
@@ -145,10 +182,37 @@ class FormValidatorMixin:
         else:
             return model_obj
 
+    @property
+    def visit_context(self):
+        """Returns the shared context of the maternal visit being
+        validated or None.
+        """
+        maternal_visit = self.cleaned_data.get('maternal_visit')
+        if maternal_visit:
+            return self.get_visit_context(maternal_visit)
+
+    def get_visit_context(self, visit):
+        onschedule_model = self.onschedule_model(instance=visit)
+        return get_visit_context(
+            visit,
+            onschedule_model_cls=self.onschedule_model_cls(onschedule_model),
+            caregiver_child_consent_cls=self.caregiver_child_consent_cls,
+            subject_consent_cls=self.subject_consent_cls)
+
+    def get_visit_onschedule_obj(self, visit):
+        """Returns the onschedule instance for the visit from the shared
+        visit context or raises.
+        """
+        onschedule_obj = self.get_visit_context(visit).onschedule_obj
+        if not onschedule_obj:
+            raise ValidationError(
+                f'OnSchedule instance does not exist. {visit.schedule_name}')
+        return onschedule_obj
+
     def get_child_subject_identifier(self, instance):
         return getattr(instance, 'child_subject_identifier', None)
 
     def caregiver_hiv_status(self, subject_identifier):
-        status_helper = MaternalStatusHelper(
-            subject_identifier=subject_identifier)
-        return getattr(status_helper, 'hiv_status', None)
+        if subject_identifier == getattr(self, 'subject_identifier', None):
+            return self.subject_context.hiv_status
+        return get_hiv_status(subject_identifier=subject_identifier)
@@ -1,4 +1,3 @@
-from django.apps import apps as django_apps
 from django.core.exceptions import ValidationError
 from edc_base.utils import age, get_utcnow
 from edc_constants.choices import YES
@@ -6,6 +5,7 @@ from edc_constants.constants import NO, OTHER
 from edc_form_validators import FormValidator
 
 from .crf_form_validator import FormValidatorMixin
+from .model_registry import get_model
 
 
 class HIVDisclosureStatusFormValidator(FormValidatorMixin, FormValidator):
@@ -78,7 +78,7 @@ class HIVDisclosureStatusFormValidator(FormValidatorMixin, FormValidator):
     def child_caregiver_consent_objs(self):
         child_identifier = self.cleaned_data.get('associated_child_identifier', None)
 
-        child_caregiver_consent_model_cls = django_apps.get_model(
+        child_caregiver_consent_model_cls = get_model(
             self.caregiver_child_consent_model)
         return child_caregiver_consent_model_cls.objects.filter(
             subject_identifier=child_identifier)
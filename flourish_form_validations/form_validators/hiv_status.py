@@ -0,0 +1,123 @@
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import caches
+
+from .timed_cache import TimedCache
+
+# Model names of the records MaternalStatusHelper derives HIV status from.
+hiv_status_source_models = getattr(
+    settings, 'HIV_STATUS_SOURCE_MODELS',
+    ['antenatalenrollment', 'caregiverpreviouslyenrolled',
+     'hivrapidtestcounseling', 'maternaldataset', 'maternalhivinterimhx',
+     'subjectconsent'])
+
+hiv_status_cache_alias = getattr(settings, 'HIV_STATUS_CACHE', 'default')
+
+hiv_status_cache_ttl = getattr(settings, 'HIV_STATUS_CACHE_TTL', 300)
+
+# The in-process index. The signals only drop entries of their own
+# process, so the ttl bounds how long another process serves a status
+# changed elsewhere.
+hiv_statuses = TimedCache(
+    maxsize=getattr(settings, 'HIV_STATUS_CACHE_MAXSIZE', 2048),
+    ttl=getattr(settings, 'HIV_STATUS_INDEX_TTL', 10))
+
+hiv_status_generation_key = 'flourish_form_validations.hiv_status.generation'
+
+
+def hiv_status_subject_key(subject_identifier):
+    return f'flourish_form_validations.hiv_status.subject.{subject_identifier}'
+
+
+def hiv_status_key(subject_identifier, visit_id=None):
+    """Returns the shared cache key of the subject's HIV status, as of
+    the visit if `visit_id`, in the current generation and version of
+    the subject, see invalidate_hiv_status().
+    """
+    cache = caches[hiv_status_cache_alias]
+    stamp_keys = [hiv_status_generation_key,
+                  hiv_status_subject_key(subject_identifier)]
+    stamps = cache.get_many(stamp_keys)
+    for stamp_key in stamp_keys:
+        if stamp_key not in stamps:
+            stamp = uuid4().hex
+            cache.add(stamp_key, stamp, hiv_status_cache_ttl)
+            stamps[stamp_key] = cache.get(stamp_key) or stamp
+    generation, version = (stamps[stamp_key] for stamp_key in stamp_keys)
+    return (f'flourish_form_validations.hiv_status.{generation}.{version}.'
+            f'{subject_identifier}.{visit_id}')
+
+
+def get_hiv_status(subject_identifier=None, visit=None):
+    """Returns the caregiver's HIV status from the in-process index,
+    else from the shared cache, else from MaternalStatusHelper.
+
+    A status derived from a visit is cached apart from the subject's
+    status and those of its other visits. Unknown (None) statuses and
+    statuses of unsaved visits are not cached.
+    """
+    subject_identifier = subject_identifier or getattr(
+        visit, 'subject_identifier', None)
+    visit_id = getattr(visit, 'pk', None)
+
+    def load():
+        # imported here so that the signals module stays cheap to import
+        from flourish_caregiver.helper_classes import MaternalStatusHelper
+
+        if visit:
+            status_helper = MaternalStatusHelper(visit)
+        else:
+            status_helper = MaternalStatusHelper(
+                subject_identifier=subject_identifier)
+        return getattr(status_helper, 'hiv_status', None)
+
+    if not subject_identifier or (visit and visit_id is None):
+        return load()
+    index_key = (subject_identifier, visit_id)
+    hiv_status = hiv_statuses.get(index_key)
+    if hiv_status is None:
+        shared_cache = caches[hiv_status_cache_alias]
+        key = hiv_status_key(subject_identifier, visit_id=visit_id)
+        hiv_status = shared_cache.get(key)
+        if hiv_status is None:
+            hiv_status = load()
+            if hiv_status is not None:
+                shared_cache.set(key, hiv_status, hiv_status_cache_ttl)
+        if hiv_status is not None:
+            hiv_statuses.set(index_key, hiv_status)
+    return hiv_status
+
+
+def invalidate_hiv_status(subject_identifier=None):
+    """Drops the HIV statuses of `subject_identifier`, those of its
+    visits included, or all of them if None, from the in-process index
+    and the shared cache.
+    """
+    cache = caches[hiv_status_cache_alias]
+    if subject_identifier:
+        hiv_statuses.invalidate_if(lambda key, value: key[0] == subject_identifier)
+        cache.set(hiv_status_subject_key(subject_identifier), uuid4().hex,
+                  hiv_status_cache_ttl)
+    else:
+        hiv_statuses.clear()
+        cache.set(hiv_status_generation_key, uuid4().hex, hiv_status_cache_ttl)
+
+
+class MaternalStatus:
+    """Stands in for MaternalStatusHelper where validators only read
+    `hiv_status`, serving it from the HIV status cache.
+    """
+
+    def __init__(self, visit=None, subject_identifier=None):
+        self.visit = visit
+        self.subject_identifier = subject_identifier
+
+    def __repr__(self):
+        return (f'{self.__class__.__name__}('
+                f'subject_identifier={self.subject_identifier!r})')
+
+    @property
+    def hiv_status(self):
+        return get_hiv_status(
+            subject_identifier=self.subject_identifier, visit=self.visit)
@@ -0,0 +1,148 @@
+import re
+
+from django.core.exceptions import ValidationError
+from edc_constants.constants import FEMALE, MALE
+
+first_name_pattern = re.compile(r'^[A-Z]+$|^([A-Z]+[ ][A-Z]+)$')
+last_name_pattern = re.compile(r'^[A-Z-]+$')
+identity_pattern = re.compile(r'[0-9]+$')
+
+# Identity types with a 9 digit number whose 5th digit encodes gender.
+country_identity_types = ['country_id']
+country_identity_length = 9
+gender_digits = {FEMALE: '2', MALE: '1'}
+
+first_name_message = ('Ensure first name is letters (A-Z) in upper case, no '
+                      'special characters, except spaces. Maximum 2 first '
+                      'names allowed.')
+last_name_message = ('Ensure last name is letters (A-Z) in upper case, no '
+                     'special characters, except hyphens.')
+identity_digits_message = 'Identity number must be digits.'
+identity_length_message = ('Country identity provided should contain 9 '
+                           'values. Please correct.')
+gender_digit_messages = {
+    FEMALE: 'Participant gender is Female. Please correct identity number.',
+    MALE: 'Participant is Male. Please correct identity number.'}
+
+
+def name_errors(first_name=None, last_name=None):
+    """Returns a dict of {field: message} for the names that are not
+    upper case letters, empty if both are valid or blank.
+    """
+    errors = {}
+    if first_name and not first_name_pattern.match(first_name):
+        errors['first_name'] = first_name_message
+    if last_name and not last_name_pattern.match(last_name):
+        errors['last_name'] = last_name_message
+    return errors
+
+
+def identity_digits_error(identity):
+    """Returns an error message if `identity` is not all digits.
+    """
+    if identity and not identity_pattern.match(identity):
+        return identity_digits_message
+
+
+def country_identity_error(identity, identity_type=None, gender=None,
+                           identity_types=None):
+    """Returns an error message if a country identity number is not 9
+    digits or its 5th digit does not match `gender`.
+    """
+    identity_types = country_identity_types if identity_types is None else identity_types
+    if identity and identity_type in identity_types:
+        if len(identity) != country_identity_length:
+            return identity_length_message
+        digit = gender_digits.get(gender)
+        if digit and identity[4] != digit:
+            return gender_digit_messages[gender]
+
+
+def identity_error(identity, identity_type=None, gender=None,
+                   identity_types=None):
+    """Returns the first error message for `identity` or None.
+    """
+    return (identity_digits_error(identity)
+            or country_identity_error(identity, identity_type, gender,
+                                      identity_types=identity_types))
+
+
+def check_names(names):
+    """Returns a list of dicts of {field: message}, one per
+    (first_name, last_name) pair in `names`.
+    """
+    return [name_errors(first_name, last_name) for first_name, last_name in names]
+
+
+def check_identities(identities, identity_types=None):
+    """Returns a list of error messages or None, one per (identity,
+    identity_type, gender) tuple in `identities`.
+    """
+    return [identity_error(identity, identity_type, gender,
+                           identity_types=identity_types)
+            for identity, identity_type, gender in identities]
+
+
+def screen_records(records, identity_types=None):
+    """Returns a list of (index, errors) for the records with invalid
+    names or identity numbers, where errors is a dict of
+    {field: message}.
+
+    Records are mappings with any of `first_name`, `last_name`,
+    `identity`, `identity_type` and `gender`, e.g. the rows of a
+    recruitment list from `.values()`:
+
+        screen_records(MaternalDataset.objects.values(
+            'first_name', 'last_name', 'identity', 'identity_type'))
+    """
+    records = list(records)
+    names = check_names(
+        (record.get('first_name'), record.get('last_name')) for record in records)
+    identities = check_identities(
+        ((record.get('identity'), record.get('identity_type'), record.get('gender'))
+         for record in records), identity_types=identity_types)
+    screened = []
+    for index, (errors, identity) in enumerate(zip(names, identities)):
+        if identity:
+            errors['identity'] = identity
+        if errors:
+            screened.append((index, errors))
+    return screened
+
+
+class IdentityFormValidatorMixin:
+    """Validates the full name syntax and identity number of a consent.
+    """
+
+    identity_types = country_identity_types
+
+    def clean_full_name_syntax(self):
+        cleaned_data = self.cleaned_data
+        errors = name_errors(
+            cleaned_data.get('first_name'), cleaned_data.get('last_name'))
+        for field in ['first_name', 'last_name']:
+            if field in errors:
+                message = {field: errors[field]}
+                self._errors.update(message)
+                raise ValidationError(message)
+
+    def validate_identity_number(self, cleaned_data=None):
+        identity = cleaned_data.get('identity')
+        if identity:
+            error = identity_digits_error(identity)
+            if error:
+                message = {'identity': error}
+                self._errors.update(message)
+                raise ValidationError(message)
+            if identity != cleaned_data.get('confirm_identity'):
+                msg = {'identity':
+                       '\'Identity\' must match \'confirm identity\'.'}
+                self._errors.update(msg)
+                raise ValidationError(msg)
+            error = country_identity_error(
+                identity, cleaned_data.get('identity_type'),
+                cleaned_data.get('gender'), identity_types=self.identity_types)
+            if error:
+                msg = {'identity': error}
+                self._errors.update(msg)
+                raise ValidationError(msg)
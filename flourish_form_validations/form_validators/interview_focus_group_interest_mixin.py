@@ -0,0 +1,38 @@
+from datetime import timedelta
+
+from django.core.exceptions import ValidationError
+from edc_base.utils import get_utcnow
+
+
+class InterviewFocusGroupInterestMixin:
+    """Reads the caregiver consent on behalf of the child for the
+    interview focus group interest validators, from the shared visit
+    context of FormValidatorMixin.
+    """
+
+    def get_visit_child_consent(self):
+        """Returns the latest caregiver consent on behalf of the child on
+        the visit's schedule from the shared visit context.
+        """
+        visit_context = self.visit_context
+        if not visit_context.onschedule_obj:
+            raise ValidationError('Onschedule does not exist.')
+        consent = visit_context.latest_child_consent
+        if not consent:
+            raise ValidationError(
+                'Caregiver consent on behalf of child does not exist.')
+        return consent
+
+    def is_preg_enroll(self):
+        return self.get_visit_child_consent().preg_enroll
+
+    def is_within_first_year_postpartum(self):
+        """Returns True if subject is currently in first year postpartum."""
+        consent = self.get_visit_child_consent()
+
+        today = get_utcnow().date()
+        child_dob = consent.child_dob
+        if child_dob:
+            return (today - child_dob) < timedelta(days=365)
+        else:
+            return False
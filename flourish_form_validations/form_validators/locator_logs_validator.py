@@ -1,13 +1,14 @@
-from django.apps import apps as django_apps
 from django.core.exceptions import ValidationError
 from edc_form_validators import FormValidator
 
+from .model_registry import get_model
+
 
 class LocatorLogEntryFormValidator(FormValidator):
 
     @property
     def locator_model_cls(self):
-        return django_apps.get_model('flourish_caregiver.caregiverlocator')
+        return get_model('flourish_caregiver.caregiverlocator')
 
     def clean(self):
         super().clean()
@@ -0,0 +1,40 @@
+class M2MSnapshotMixin:
+    """Serves the m2m rules of a validation from a snapshot of the
+    selected `short_name`s of each m2m field, taken once per field.
+
+    Taking the snapshot iterates the queryset in cleaned_data, which
+    also fills its result cache, so the edc m2m helpers reading the same
+    queryset (`if qs`, `qs.count()`, iteration) do not query again.
+    """
+
+    m2m_stored_field_name = 'short_name'
+
+    _m2m_snapshots = None
+
+    def m2m_selections(self, m2m_field):
+        """Returns a frozenset of the selected `short_name`s of
+        `m2m_field`.
+
+        The snapshot is retaken if cleaned_data holds a different
+        queryset for the field.
+        """
+        if self._m2m_snapshots is None:
+            self._m2m_snapshots = {}
+        qs = self.cleaned_data.get(m2m_field)
+        try:
+            snapshot_qs, selections = self._m2m_snapshots[m2m_field]
+        except KeyError:
+            pass
+        else:
+            if snapshot_qs is qs:
+                return selections
+        selections = frozenset(
+            getattr(obj, self.m2m_stored_field_name) for obj in qs or [])
+        self._m2m_snapshots[m2m_field] = (qs, selections)
+        return selections
+
+    def snapshot_m2m(self, *m2m_fields):
+        """Takes the snapshot of each of `m2m_fields` up front.
+        """
+        for m2m_field in m2m_fields:
+            self.m2m_selections(m2m_field)
@@ -1,10 +1,10 @@
 from django import forms
-from django.apps import apps as django_apps
 from django.core.exceptions import ValidationError
 
 from edc_constants.constants import YES, NO
 from edc_form_validators import FormValidator
 from .crf_form_validator import FormValidatorMixin
+from .model_registry import get_model
 
 
 class MaternalArvDuringPregFormValidator(FormValidatorMixin, FormValidator):
@@ -13,7 +13,7 @@ class MaternalArvDuringPregFormValidator(FormValidatorMixin, FormValidator):
 
     @property
     def arvs_pre_preg_cls(self):
-        return django_apps.get_model(self.arvs_pre_preg_model)
+        return get_model(self.arvs_pre_preg_model)
 
     def clean(self):
         self.subject_identifier = self.cleaned_data.get(
@@ -1,11 +1,11 @@
-from django.apps import apps as django_apps
 from django.core.exceptions import ValidationError
 from edc_base.utils import relativedelta
 from edc_constants.constants import POS, YES, NOT_APPLICABLE
 from edc_form_validators import FormValidator
-from flourish_caregiver.helper_classes import MaternalStatusHelper
 
 from .crf_form_validator import FormValidatorMixin
+from .hiv_status import MaternalStatus
+from .model_registry import get_model
 
 
 class MaternalDeliveryFormValidator(FormValidatorMixin,
@@ -17,19 +17,19 @@ class MaternalDeliveryFormValidator(FormValidatorMixin,
 
     @property
     def ultrasound_cls(self):
-        return django_apps.get_model(self.ultrasound_model)
+        return get_model(self.ultrasound_model)
 
     @property
     def maternal_visit_cls(self):
-        return django_apps.get_model(self.maternal_visit_model)
+        return get_model(self.maternal_visit_model)
 
     @property
     def maternal_arv_cls(self):
-        return django_apps.get_model(self.maternal_arv_model)
+        return get_model(self.maternal_arv_model)
 
     @property
     def arvs_during_pregnancy_cls(self):
-        return django_apps.get_model(self.arv_during_preg_model)
+        return get_model(self.arv_during_preg_model)
 
     def clean(self):
         self.subject_identifier = self.cleaned_data.get('subject_identifier')
@@ -156,7 +156,7 @@ class MaternalDeliveryFormValidator(FormValidatorMixin,
             subject_identifier=cleaned_data.get(
                 'subject_identifier')).order_by('-created').first()
         if latest_visit:
-            return MaternalStatusHelper(latest_visit)
+            return MaternalStatus(latest_visit)
         else:
             raise ValidationError(
                 'Please complete previous visits before filling in '
@@ -1,8 +1,8 @@
 from django.core.exceptions import ValidationError
 from edc_constants.constants import YES, POS, OTHER
 from edc_form_validators.form_validator import FormValidator
-from flourish_caregiver.helper_classes import MaternalStatusHelper
 from .crf_form_validator import FormValidatorMixin
+from .hiv_status import MaternalStatus
 
 
 class MaternalDiagnosesFormValidator(FormValidatorMixin, FormValidator):
@@ -49,9 +49,7 @@ class MaternalDiagnosesFormValidator(FormValidatorMixin, FormValidator):
 
     def m2m_na_validation(self, field=None, m2m_field=None, msg=None,
                           na_msg=None, na_response=None):
-        qs = self.cleaned_data.get(m2m_field).values_list(
-            'short_name', flat=True)
-        selection = list(qs.all())
+        selection = self.m2m_selections(m2m_field)
         if self.cleaned_data.get(field) == YES:
             if na_response in selection:
                 message = {m2m_field: msg}
@@ -71,6 +69,6 @@ class MaternalDiagnosesFormValidator(FormValidatorMixin, FormValidator):
     @property
     def maternal_status_helper(self):
         cleaned_data = self.cleaned_data
-        status_helper = MaternalStatusHelper(
+        status_helper = MaternalStatus(
             cleaned_data.get('maternal_visit'))
         return status_helper
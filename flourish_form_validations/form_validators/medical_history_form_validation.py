@@ -1,10 +1,10 @@
-from django.apps import apps as django_apps
 from django.core.exceptions import ValidationError
 from edc_constants.constants import NO, NOT_APPLICABLE, POS, YES, OTHER
 from edc_form_validators import FormValidator
 
-from flourish_caregiver.helper_classes import MaternalStatusHelper
 from .crf_form_validator import FormValidatorMixin
+from .hiv_status import MaternalStatus
+from .model_registry import get_model
 
 
 class MedicalHistoryFormValidator(FormValidatorMixin, FormValidator):
@@ -12,11 +12,11 @@ class MedicalHistoryFormValidator(FormValidatorMixin, FormValidator):
 
     @property
     def antenatal_enrollment_cls(self):
-        return django_apps.get_model(self.antenatal_enrollment_model)
+        return get_model(self.antenatal_enrollment_model)
 
     @property
     def maternal_visit_cls(self):
-        return django_apps.get_model(self.maternal_visit_model)
+        return get_model(self.maternal_visit_model)
 
     def clean(self):
         self.subject_identifier = self.cleaned_data.get(
@@ -71,15 +71,12 @@ class MedicalHistoryFormValidator(FormValidatorMixin, FormValidator):
         subject_status = self.maternal_status_helper.hiv_status
 
         if subject_status == POS and cleaned_data.get('who_diagnosis') == YES:
-            qs = self.cleaned_data.get('who')
-            if qs and qs.count() > 0:
-                selected = {obj.short_name: obj.name for obj in qs}
-                if 'who_na' in selected:
-                    msg = {'who':
-                           'Participant indicated that they had WHO stage III '
-                           'and IV, list of diagnosis cannot be N/A'}
-                    self._errors.update(msg)
-                    raise ValidationError(msg)
+            if 'who_na' in self.m2m_selections('who'):
+                msg = {'who':
+                       'Participant indicated that they had WHO stage III '
+                       'and IV, list of diagnosis cannot be N/A'}
+                self._errors.update(msg)
+                raise ValidationError(msg)
         elif cleaned_data.get('who_diagnosis') != YES:
             m2m = 'who'
             message = ('Participant did not indicate that they have WHO stage'
@@ -92,10 +89,7 @@ class MedicalHistoryFormValidator(FormValidatorMixin, FormValidator):
             field_other='who_other')
 
     def validate_caregiver_chronic_multiple_selection(self, cleaned_data=None):
-        selected = {}
-        qs = self.cleaned_data.get('caregiver_chronic')
-        if qs and qs.count() > 0:
-            selected = {obj.short_name: obj.name for obj in qs}
+        selected = self.m2m_selections('caregiver_chronic')
         if cleaned_data.get('chronic_since') == YES:
             if 'mhist_na' in selected:
                 msg = {'caregiver_chronic':
@@ -133,10 +127,9 @@ class MedicalHistoryFormValidator(FormValidatorMixin, FormValidator):
             field_other='caregiver_medications_other')
 
     def validate_m2m_na(self, m2m_field, response=NOT_APPLICABLE, message=None):
-        qs = self.cleaned_data.get(m2m_field)
+        selected = self.m2m_selections(m2m_field)
         message = message or 'This field is not applicable.'
-        if qs and qs.count() > 0:
-            selected = {obj.short_name: obj.name for obj in qs}
+        if selected:
             if response not in selected:
                 msg = {m2m_field: message}
                 self._errors.update(msg)
@@ -151,4 +144,4 @@ class MedicalHistoryFormValidator(FormValidatorMixin, FormValidator):
         cleaned_data = self.cleaned_data
         visit_obj = cleaned_data.get('maternal_visit')
         if visit_obj:
-            return MaternalStatusHelper(visit_obj)
+            return MaternalStatus(visit_obj)
@@ -0,0 +1,45 @@
+from threading import Lock
+
+from django.apps import apps as django_apps
+
+
+class ModelRegistry:
+    """Resolves model labels to model classes once and caches them.
+
+    Classes are cached by label, not by validator attribute, so the
+    label overrides set on validator classes (e.g. by the tests) always
+    resolve to the model of the current label.
+    """
+
+    def __init__(self, apps=None):
+        self.apps = apps or django_apps
+        self._models = {}
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._models)
+
+    def get_model(self, label):
+        """Returns the model class for `label`, e.g. 'app_label.model'.
+
+        Raises LookupError or ValueError for an invalid label, as
+        `django_apps.get_model` does; failures are not cached.
+        """
+        try:
+            return self._models[label]
+        except KeyError:
+            model_cls = self.apps.get_model(label)
+            with self._lock:
+                self._models[label] = model_cls
+            return model_cls
+
+    def clear(self):
+        with self._lock:
+            self._models.clear()
+
+
+model_registry = ModelRegistry()
+
+
+def get_model(label):
+    return model_registry.get_model(label)
@@ -1,8 +1,8 @@
-from django.apps import apps as django_apps
 from django.core.exceptions import ValidationError
 from edc_form_validators.form_validator import FormValidator
 
 from .crf_form_validator import FormValidatorMixin
+from .model_registry import get_model
 
 
 class ObstericalHistoryFormValidator(FormValidatorMixin, FormValidator):
@@ -13,37 +13,49 @@ class ObstericalHistoryFormValidator(FormValidatorMixin, FormValidator):
 
     @property
     def maternal_ultrasound_cls(self):
-        return django_apps.get_model(self.ultrasound_model)
+        return get_model(self.ultrasound_model)
 
     @property
     def preg_women_screening_cls(self):
-        return django_apps.get_model(self.preg_women_screening_model)
+        return get_model(self.preg_women_screening_model)
 
     @property
     def antenatal_enrollment_cls(self):
-        return django_apps.get_model(self.antenatal_enrollment_model)
+        return get_model(self.antenatal_enrollment_model)
 
     @property
     def maternal_delivery_cls(self):
-        return django_apps.get_model(self.maternal_delivery_model)
+        return get_model(self.maternal_delivery_model)
 
     def clean(self):
         super().clean()
-        self.subject_identifier = self.cleaned_data.get(
-            'maternal_visit').subject_identifier
-        visit_instance = self.cleaned_data.get('maternal_visit', None)
-        onschedule_model_cls = self.visit_onschedule_model_cls(visit_instance)
-        onschedule_model_obj = self.get_onschedule_model_obj(
-            self.subject_identifier, onschedule_model_cls, visit_instance.schedule_name)
-        self.child_subject_identifier = self.get_child_subject_identifier(onschedule_model_obj)
+        self.set_identifiers()
 
         self.validate_ultrasound(cleaned_data=self.cleaned_data)
         self.validate_prev_pregnancies(cleaned_data=self.cleaned_data)
         self.validate_children_delivery(cleaned_data=self.cleaned_data)
         self.validate_pregs_lt_24weeks()
 
+    def get_async_lookups(self):
+        lookups = super().get_async_lookups()
+        lookups[0].append(self.set_identifiers)
+        lookups[1].extend([
+            self.prefetch('anc_exists', self.get_anc_exists),
+            self.prefetch('ultrasound', self.get_ultrasound),
+            self.prefetch('delivery_exists', self.get_delivery_exists)])
+        return lookups
+
+    def set_identifiers(self):
+        visit_instance = self.cleaned_data.get('maternal_visit', None)
+        onschedule_model_obj = self.get_visit_onschedule_obj(visit_instance)
+        self.subject_identifier = visit_instance.subject_identifier
+        self.child_subject_identifier = self.get_child_subject_identifier(onschedule_model_obj)
+
     @property
     def anc_exists(self):
+        return self.get_prefetched('anc_exists', self.get_anc_exists)
+
+    def get_anc_exists(self):
         try:
             self.antenatal_enrollment_cls.objects.get(
                 subject_identifier=self.subject_identifier,
@@ -54,25 +66,37 @@ class ObstericalHistoryFormValidator(FormValidatorMixin, FormValidator):
             return True
 
     @property
-    def ultrasound_ga_confirmed(self):
+    def ultrasound(self):
+        return self.get_prefetched('ultrasound', self.get_ultrasound)
+
+    def get_ultrasound(self):
         maternal_visit = self.cleaned_data.get('maternal_visit')
         subject_identifier = maternal_visit.subject_identifier
-
-        if not self.anc_exists:
-            return 0
-
         try:
             ultrasound = self.maternal_ultrasound_cls.objects.get(
                 maternal_visit__subject_identifier=subject_identifier,
                 child_subject_identifier=self.child_subject_identifier)
         except self.maternal_ultrasound_cls.DoesNotExist:
+            return None
+        else:
+            return ultrasound
+
+    @property
+    def ultrasound_ga_confirmed(self):
+        if not self.anc_exists:
+            return 0
+
+        ultrasound = self.ultrasound
+        if not ultrasound:
             message = 'Please complete ultrasound form first.'
             raise ValidationError(message)
-        else:
-            return ultrasound.ga_confirmed
+        return ultrasound.ga_confirmed
 
     @property
-    def has_delivered(self):
+    def delivery_exists(self):
+        return self.get_prefetched('delivery_exists', self.get_delivery_exists)
+
+    def get_delivery_exists(self):
         report_datetime = self.cleaned_data.get('report_datetime', None)
         try:
             self.maternal_delivery_cls.objects.get(
@@ -80,9 +104,15 @@ class ObstericalHistoryFormValidator(FormValidatorMixin, FormValidator):
                 child_subject_identifier=self.child_subject_identifier,
                 report_datetime__lte=report_datetime)
         except self.maternal_delivery_cls.DoesNotExist:
-            return not self.anc_exists
+            return False
         else:
+            return True
+
+    @property
+    def has_delivered(self):
+        if self.delivery_exists:
             return self.anc_exists
+        return not self.anc_exists
 
     def validate_pregs_lt_24weeks(self):
         pregs_lt_24wks = self.cleaned_data.get('pregs_lt_24wks', 0)
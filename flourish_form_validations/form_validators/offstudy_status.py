@@ -0,0 +1,83 @@
+from collections import namedtuple
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import Min
+from edc_constants.constants import NEW
+
+from .timed_cache import TimedCache
+
+# Model names of the records the offstudy status is derived from.
+offstudy_status_source_models = getattr(
+    settings, 'OFFSTUDY_STATUS_SOURCE_MODELS', ['caregiveroffstudy', 'actionitem'])
+
+offstudy_status_cache_alias = getattr(settings, 'OFFSTUDY_STATUS_CACHE', 'default')
+
+offstudy_status_cache_ttl = getattr(settings, 'OFFSTUDY_STATUS_CACHE_TTL', 3600)
+
+# The in-process index. The signals only drop entries of their own
+# process, so the ttl bounds how long another process serves a status
+# changed elsewhere.
+offstudy_statuses = TimedCache(
+    maxsize=getattr(settings, 'OFFSTUDY_STATUS_INDEX_MAXSIZE', 4096),
+    ttl=getattr(settings, 'OFFSTUDY_STATUS_INDEX_TTL', 10))
+
+
+class OffstudyStatus(namedtuple('OffstudyStatus', ['pending_action', 'offstudy_date'])):
+    """A caregiver's offstudy status: whether a NEW caregiver offstudy
+    action item exists and the earliest offstudy date, or None.
+    """
+
+    __slots__ = ()
+
+    def offstudy_before(self, report_date):
+        return self.offstudy_date is not None and self.offstudy_date < report_date
+
+
+def load_offstudy_status(subject_identifier, caregiver_offstudy_cls):
+    # imported here so that the signals module stays cheap to import
+    from edc_action_item.site_action_items import site_action_items
+    from flourish_prn.action_items import CAREGIVEROFF_STUDY_ACTION
+
+    action_cls = site_action_items.get(caregiver_offstudy_cls.action_name)
+    action_item_model_cls = action_cls.action_item_model_cls()
+    pending_action = action_item_model_cls.objects.filter(
+        subject_identifier=subject_identifier,
+        action_type__name=CAREGIVEROFF_STUDY_ACTION,
+        status=NEW).exists()
+    offstudy_date = caregiver_offstudy_cls.objects.filter(
+        subject_identifier=subject_identifier).aggregate(
+        offstudy_date=Min('offstudy_date'))['offstudy_date']
+    return OffstudyStatus(pending_action, offstudy_date)
+
+
+def offstudy_status_key(subject_identifier):
+    return f'flourish_form_validations.offstudy_status.{subject_identifier}'
+
+
+def get_offstudy_status(subject_identifier, caregiver_offstudy_cls):
+    """Returns the caregiver's OffstudyStatus from the in-process index,
+    else from the shared cache, else from the database.
+    """
+    if not subject_identifier:
+        return load_offstudy_status(subject_identifier, caregiver_offstudy_cls)
+    status = offstudy_statuses.get(subject_identifier)
+    if status is None:
+        shared_cache = caches[offstudy_status_cache_alias]
+        key = offstudy_status_key(subject_identifier)
+        values = shared_cache.get(key)
+        if values is None:
+            status = load_offstudy_status(subject_identifier, caregiver_offstudy_cls)
+            shared_cache.set(key, tuple(status), offstudy_status_cache_ttl)
+        else:
+            status = OffstudyStatus(*values)
+        offstudy_statuses.set(subject_identifier, status)
+    return status
+
+
+def invalidate_offstudy_status(subject_identifier):
+    """Drops the offstudy status of `subject_identifier` from the
+    in-process index and the shared cache.
+    """
+    offstudy_statuses.invalidate(subject_identifier)
+    caches[offstudy_status_cache_alias].delete(offstudy_status_key(subject_identifier))
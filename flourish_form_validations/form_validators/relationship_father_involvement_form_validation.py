@@ -1,12 +1,13 @@
-from django.apps import apps as django_apps
 from django.forms import ValidationError
 from django.conf import settings
 from edc_constants.constants import YES, POS, NEG, NO, NOT_APPLICABLE,\
     DONT_KNOW
 from edc_form_validators import FormValidator
-from flourish_caregiver.helper_classes import MaternalStatusHelper
 from flourish_caregiver.constants import PNTA
 from .crf_form_validator import FormValidatorMixin
+from .hiv_status import MaternalStatus
+from .model_registry import get_model
+from .requirements import Required, RequirementTable
 
 
 class RelationshipFatherInvolvementFormValidator(FormValidatorMixin, FormValidator):
@@ -14,16 +15,61 @@ class RelationshipFatherInvolvementFormValidator(FormValidatorMixin, FormValidat
     maternal_delivery_model = 'flourish_caregiver.maternaldelivery'
     caregiver_child_consent_model = 'flourish_caregiver.caregiverchildconsent'
 
+    partner_present_requirements = RequirementTable(
+        Required(YES, field='partner_present', targets=[
+            'is_partner_the_father',
+            'duration_with_partner',
+            'partner_age_in_years',
+            'living_with_partner',
+            'partners_support',
+            'ever_separated',
+            'separation_consideration',
+            'leave_after_fight',
+            'relationship_progression',
+            'confide_in_partner',
+            'relationship_regret',
+            'quarrel_frequency',
+            'bothering_partner',
+            'kissing_partner',
+            'engage_in_interests',
+            'happiness_in_relationship',
+            'future_relationship',
+        ]),
+    )
+
+    m2m_fields = ['read_books', 'told_stories', 'sang_songs',
+                  'took_child_outside', 'played_with_child',
+                  'named_with_child', ]
+
+    # The order of the responses correlates to the m2m_fields order, and
+    # validator code block below assumes that.
+    noone_responses = ['read_noone', 'stories_noone', 'sang_noone',
+                       'outside_noone', 'played_noone', 'named_noone']
+
+    na_responses = ['read_na', 'stories_na', 'sang_na', 'outside_na',
+                    'played_na', 'named_na']
+
+    pnta_responses = ['read_pnta', 'stories_pnta', 'sang_pnta',
+                      'outside_pnta', 'played_pnta', 'named_pnta']
+
+    other_responses = ['read_oth', 'stories_oth', 'sang_oth',
+                       'outside_oth', 'played_oth', 'named_oth']
+
+    _delivered = None
+
     @property
     def maternal_delivery_model_cls(self):
-        return django_apps.get_model(self.maternal_delivery_model)
+        return get_model(self.maternal_delivery_model)
 
     @property
     def caregiver_child_consent_cls(self):
-        return django_apps.get_model(self.caregiver_child_consent_model)
+        return get_model(self.caregiver_child_consent_model)
 
     def clean(self):
 
+        self._delivered = None
+        self.prefetch()
+
         self.validate_required_fields()
 
         self.required_if(NO,
@@ -57,33 +103,16 @@ class RelationshipFatherInvolvementFormValidator(FormValidatorMixin, FormValidat
 
         self.validate_father_involvement()
 
-        m2m_fields = ['read_books', 'told_stories', 'sang_songs',
-                      'took_child_outside', 'played_with_child',
-                      'named_with_child', ]
-
-        # The order of the responses correlates to the m2m_fields order, and
-        # validator code block below assumes that.
-        noone_responses = ['read_noone', 'stories_noone', 'sang_noone',
-                           'outside_noone', 'played_noone', 'named_noone']
-
-        na_responses = ['read_na', 'stories_na', 'sang_na', 'outside_na',
-                        'played_na', 'named_na']
-
-        pnta_responses = ['read_pnta', 'stories_pnta', 'sang_pnta',
-                          'outside_pnta', 'played_pnta', 'named_pnta']
-
-        other_responses = ['read_oth', 'stories_oth', 'sang_oth',
-                           'outside_oth', 'played_oth', 'named_oth']
-
-        condition = self.has_delivered
-        for _count, field in enumerate(m2m_fields):
+        condition = self.delivered
+        for _count, field in enumerate(self.m2m_fields):
             self.m2m_applicable_if_true(condition, m2m_field=field)
             self.m2m_single_selection_if(
-                *[na_responses[_count], pnta_responses[_count], noone_responses[_count]],
+                *[self.na_responses[_count], self.pnta_responses[_count],
+                  self.noone_responses[_count]],
                 m2m_field=field)
 
             self.m2m_other_specify(
-                *[other_responses[_count]],
+                *[self.other_responses[_count]],
                 m2m_field=field,
                 field_other=f'{field}_other')
 
@@ -95,30 +124,28 @@ class RelationshipFatherInvolvementFormValidator(FormValidatorMixin, FormValidat
 
         super().clean()
 
-    def validate_required_fields(self):
-        required_fields = [
-            'is_partner_the_father',
-            'duration_with_partner',
-            'partner_age_in_years',
-            'living_with_partner',
-            'partners_support',
-            'ever_separated',
-            'separation_consideration',
-            'leave_after_fight',
-            'relationship_progression',
-            'confide_in_partner',
-            'relationship_regret',
-            'quarrel_frequency',
-            'bothering_partner',
-            'kissing_partner',
-            'engage_in_interests',
-            'happiness_in_relationship',
-            'future_relationship',
-        ]
+    def prefetch(self):
+        """Loads the delivery status and the m2m selections up front so
+        that the rules below run in memory.
 
-        for field in required_fields:
-            self.required_if(YES, field='partner_present',
-                             field_required=field)
+        A ValidationError loading the delivery status is raised where
+        the status is first used, as before.
+        """
+        if self.cleaned_data.get('maternal_visit'):
+            try:
+                self.delivered
+            except ValidationError:
+                pass
+        self.snapshot_m2m(*self.m2m_fields)
+
+    @property
+    def delivered(self):
+        if self._delivered is None:
+            self._delivered = self.has_delivered
+        return self._delivered
+
+    def validate_required_fields(self):
+        self.partner_present_requirements.evaluate(self)
 
     def validate_father_involvement(self):
 
@@ -127,7 +154,7 @@ class RelationshipFatherInvolvementFormValidator(FormValidatorMixin, FormValidat
             'fathers_financial_support',
         ]
 
-        condition = self.has_delivered
+        condition = self.delivered
         father_alive = self.cleaned_data.get('biological_father_alive', None)
 
         for field in required_fields:
@@ -165,7 +192,7 @@ class RelationshipFatherInvolvementFormValidator(FormValidatorMixin, FormValidat
         # Checker when running tests so it does require addition modules
         if settings.APP_NAME != 'flourish_form_validations':
             maternal_visit = self.cleaned_data.get('maternal_visit')
-            helper = MaternalStatusHelper(
+            helper = MaternalStatus(
                 maternal_visit, maternal_visit.subject_identifier)
 
             self.required_if_true(helper.hiv_status == POS,
@@ -181,44 +208,39 @@ class RelationshipFatherInvolvementFormValidator(FormValidatorMixin, FormValidat
         cleaned_data = self.cleaned_data
         visit_obj = cleaned_data.get('maternal_visit')
         if visit_obj:
-            return MaternalStatusHelper(visit_obj)
+            return MaternalStatus(visit_obj)
 
     @property
     def has_delivered(self):
         maternal_visit = self.cleaned_data.get('maternal_visit')
         subject_identifier = maternal_visit.subject_identifier
-        onschedule_model = self.onschedule_model(instance=maternal_visit)
-        model_cls = self.onschedule_model_cls(onschedule_model)
-        try:
-            model_obj = model_cls.objects.get(
-                subject_identifier=subject_identifier,
-                schedule_name=maternal_visit.schedule_name)
-        except model_cls.DoesNotExist:
+        visit_context = self.get_visit_context(maternal_visit)
+        if not visit_context.onschedule_obj:
             raise ValidationError('Onschedule does not exist.')
-        else:
-            child_subject_identifier = model_obj.child_subject_identifier
-            if self.is_preg_enrol(child_subject_identifier):
-                return self.maternal_delivery_model_cls.objects.filter(
-                    subject_identifier=subject_identifier,
-                    child_subject_identifier=child_subject_identifier).exists()
-            return True
+        child_subject_identifier = visit_context.child_subject_identifier
+        if self.is_preg_enrol(child_subject_identifier):
+            return self.maternal_delivery_model_cls.objects.filter(
+                subject_identifier=subject_identifier,
+                child_subject_identifier=child_subject_identifier).exists()
+        return True
 
     def is_preg_enrol(self, child_subject_identifier):
-        consents = self.caregiver_child_consent_cls.objects.filter(
-            subject_identifier=child_subject_identifier)
-        try:
-            consent = consents.latest('consent_datetime')
-        except self.caregiver_child_consent_cls.DoesNotExist:
-            raise ValidationError('Caregiver consent on behalf of child does not exist.')
+        visit_context = self.visit_context
+        if (visit_context
+                and visit_context.child_subject_identifier == child_subject_identifier):
+            consent = visit_context.latest_child_consent
         else:
-            return consent.preg_enroll
+            consent = self.caregiver_child_consent_cls.objects.filter(
+                subject_identifier=child_subject_identifier).order_by(
+                '-consent_datetime').first()
+        if not consent:
+            raise ValidationError('Caregiver consent on behalf of child does not exist.')
+        return consent.preg_enroll
 
     def m2m_applicable_if_true(self, field_check, m2m_field=None, ):
         message = None
-        qs = self.cleaned_data.get(m2m_field)
-        if qs and qs.count() > 0:
-            selected = {obj.short_name: obj.name for obj in qs}
-
+        selected = self.m2m_selections(m2m_field)
+        if selected:
             if field_check and NOT_APPLICABLE in selected:
                 message = {m2m_field: 'This field is applicable'}
 #             elif not field_check and NOT_APPLICABLE not in selected:
@@ -230,10 +252,8 @@ class RelationshipFatherInvolvementFormValidator(FormValidatorMixin, FormValidat
 
     def m2m_response_na(self, responses, na_response, field=None, m2m_field=None):
         if self.cleaned_data.get(field) in responses:
-            qs = self.cleaned_data.get(m2m_field)
-            if qs and qs.count() > 0:
-                selected = {obj.short_name: obj.name for obj in qs}
-
+            selected = self.m2m_selections(m2m_field)
+            if selected:
                 if na_response in selected:
                     message = {m2m_field:
                                f'Can not select {na_response} as a response.'
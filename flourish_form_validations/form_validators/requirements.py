@@ -0,0 +1,152 @@
+from django.core.exceptions import ImproperlyConfigured
+from edc_constants.constants import NOT_APPLICABLE
+
+
+class Requirement:
+    """A conditional requirement of `targets` on the response to
+    `field`, declared once and evaluated by a `RequirementTable`.
+
+    A failing requirement is re-checked with the validator method named
+    by `method`, so messages and error codes are those of the form
+    validator helpers.
+    """
+
+    method = None
+
+    target_kwarg = None
+
+    # Options that change the messages but not the outcome of a check.
+    message_options = ['required_msg', 'not_required_msg', 'msg',
+                       'applicable_msg', 'not_applicable_msg', 'inverse']
+
+    def __init__(self, *responses, field=None, targets=None, **options):
+        if not field:
+            raise ImproperlyConfigured(
+                f'{self.__class__.__name__} requires a field. Got {field}.')
+        if not responses:
+            raise ImproperlyConfigured(
+                f'{self.__class__.__name__} requires at least one response '
+                f'for field \'{field}\'.')
+        if not targets:
+            raise ImproperlyConfigured(
+                f'{self.__class__.__name__} requires targets for field \'{field}\'.')
+        self.responses = tuple(responses)
+        self.field = field
+        self.targets = tuple(targets)
+        self.options = options
+        self.inverse = options.get('inverse', True)
+        self.checked = all(
+            option in self.message_options for option in options)
+
+    def __repr__(self):
+        return (f'{self.__class__.__name__}({self.field!r}, '
+                f'targets={list(self.targets)!r})')
+
+    def passes(self, cleaned_data, value, target):
+        """Returns True if the validator method cannot raise for
+        `target`. False means the method has to be called, which may
+        still pass.
+
+        A missing field is read as None, so a check edc skips for
+        missing fields is called rather than skipped here.
+        """
+        raise NotImplementedError
+
+    def raise_for(self, validator, target):
+        getattr(validator, self.method)(
+            *self.responses, field=self.field, **{self.target_kwarg: target},
+            **self.options)
+
+    @staticmethod
+    def has_value(value):
+        return bool(value) and value != NOT_APPLICABLE
+
+
+class Required(Requirement):
+    """`targets` are required if `field` is in `responses`, and not
+    required otherwise unless `inverse=False`.
+    """
+
+    method = 'required_if'
+    target_kwarg = 'field_required'
+
+    def passes(self, cleaned_data, value, target):
+        has_value = self.has_value(cleaned_data.get(target))
+        if value in self.responses:
+            return has_value
+        return not self.inverse or not has_value
+
+
+class NotRequired(Requirement):
+    """`targets` are not required if `field` is in `responses`, and
+    required otherwise unless `inverse=False`.
+    """
+
+    method = 'not_required_if'
+    target_kwarg = 'field_required'
+
+    def passes(self, cleaned_data, value, target):
+        has_value = self.has_value(cleaned_data.get(target))
+        if value in self.responses:
+            return not has_value
+        return not self.inverse or has_value
+
+
+class Applicable(Requirement):
+    """`targets` are applicable if `field` is in `responses`, and not
+    applicable otherwise unless `inverse=False`.
+    """
+
+    method = 'applicable_if'
+    target_kwarg = 'field_applicable'
+
+    def passes(self, cleaned_data, value, target):
+        target_value = cleaned_data.get(target)
+        if value in self.responses:
+            return target_value is not None and target_value != NOT_APPLICABLE
+        return not self.inverse or target_value == NOT_APPLICABLE
+
+
+class RequirementTable:
+    """A table of requirements declared once, when the validator class
+    is defined.
+
+    `evaluate` checks the requirements and their targets in declared
+    order, so the first error raised is that of the equivalent sequence
+    of helper calls, and only calls the validator helper for a target
+    whose requirement does not hold.
+    """
+
+    def __init__(self, *requirements):
+        self.requirements = requirements
+
+    def __iter__(self):
+        return iter(self.requirements)
+
+    @property
+    def fields(self):
+        """Returns the set of trigger and target fields.
+        """
+        fields = set()
+        for requirement in self.requirements:
+            fields.add(requirement.field)
+            fields.update(requirement.targets)
+        return fields
+
+    def dependencies(self):
+        """Returns a dict of {target: set of trigger fields}.
+        """
+        dependencies = {}
+        for requirement in self.requirements:
+            for target in requirement.targets:
+                dependencies.setdefault(target, set()).add(requirement.field)
+        return dependencies
+
+    def evaluate(self, validator):
+        cleaned_data = validator.cleaned_data
+        for requirement in self.requirements:
+            value = cleaned_data.get(requirement.field)
+            for target in requirement.targets:
+                if (not requirement.checked
+                        or not requirement.passes(cleaned_data, value, target)):
+                    requirement.raise_for(validator, target)
@@ -0,0 +1,249 @@
+import hashlib
+import json
+import threading
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import NON_FIELD_ERRORS, FieldDoesNotExist, ValidationError
+from django.db.models import Model, QuerySet
+
+result_cache_alias = getattr(settings, 'VALIDATION_RESULT_CACHE', 'default')
+
+result_cache_ttl = getattr(settings, 'VALIDATION_RESULT_CACHE_TTL', 300)
+
+# Names of the validator classes to cache the results of, in addition to
+# those setting `cache_results = True`.
+cached_validator_names = getattr(settings, 'VALIDATION_RESULT_CACHE_VALIDATORS', [])
+
+# Whether results may be cached at all. The signals stamping saved
+# records are only connected if set.
+result_caching_enabled = getattr(
+    settings, 'VALIDATION_RESULT_CACHE_ENABLED', bool(cached_validator_names))
+
+# A stamp that expires is created anew, so the results read with it are
+# no longer found. Keep it at least as long as the results.
+dependency_version_ttl = getattr(
+    settings, 'VALIDATION_RESULT_CACHE_STAMP_TTL', result_cache_ttl)
+
+# The cleaned_data and instance fields holding the identifiers of the
+# subjects whose records a validator reads.
+identifier_fields = ['subject_identifier', 'screening_identifier',
+                     'child_subject_identifier']
+
+visit_fields = ['maternal_visit', 'child_visit']
+
+# Labels of the models without a subject identifier that validators
+# read. A change to one of their records stamps all subjects, changes to
+# other records without a subject identifier are ignored.
+unscoped_models = getattr(
+    settings, 'VALIDATION_RESULT_CACHE_UNSCOPED_MODELS',
+    ['flourish_child.childdataset'])
+
+# Stands for the records without a subject identifier.
+ALL_SUBJECTS = '*'
+
+
+class ResultCacheStats:
+    """Thread safe hit and miss counts of the result cache, per
+    validator class name.
+    """
+
+    def __init__(self):
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def record(self, validator, hit):
+        with self._lock:
+            counts = self._counts.setdefault(validator, {'hits': 0, 'misses': 0})
+            counts['hits' if hit else 'misses'] += 1
+
+    def summary(self):
+        """Returns a dict of {validator: {'hits', 'misses', 'hit_ratio'}}.
+        """
+        with self._lock:
+            return {
+                validator: dict(
+                    counts,
+                    hit_ratio=round(counts['hits'] / (counts['hits'] + counts['misses']), 3))
+                for validator, counts in self._counts.items()}
+
+    def clear(self):
+        with self._lock:
+            self._counts.clear()
+
+
+result_cache_stats = ResultCacheStats()
+
+
+def canonical(value):
+    """Returns `value` as JSON serializable data equal for equal values,
+    with model instances reduced to their label and primary key.
+
+    Querysets, e.g. of m2m selections, are reduced to their sorted
+    primary keys, which runs a query unless already evaluated.
+    """
+    if isinstance(value, Model):
+        return ['model', value._meta.label_lower, str(value.pk)]
+    if isinstance(value, QuerySet):
+        return ['queryset', value.model._meta.label_lower,
+                sorted(str(obj.pk) for obj in value)]
+    if isinstance(value, dict):
+        return ['dict', sorted([[str(key), canonical(item)] for key, item in value.items()],
+                               key=lambda item: item[0])]
+    if isinstance(value, (list, tuple)):
+        return [type(value).__name__, [canonical(item) for item in value]]
+    if isinstance(value, (set, frozenset)):
+        return ['set', sorted((canonical(item) for item in value), key=repr)]
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return [type(value).__name__, str(value)]
+
+
+def content_hash(cleaned_data):
+    data = json.dumps(canonical(cleaned_data), separators=(',', ':'))
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def dependency_key(identifier):
+    return f'flourish_form_validations.validation_dependency.{identifier}'
+
+
+def dependency_versions(identifiers):
+    """Returns the version stamps of the records of `identifiers`, in
+    order. A missing stamp is created.
+    """
+    cache = caches[result_cache_alias]
+    keys = [dependency_key(identifier) for identifier in identifiers]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            version = uuid4().hex
+            cache.add(key, version, dependency_version_ttl)
+            versions[key] = cache.get(key, version)
+    return [versions[key] for key in keys]
+
+
+def bump_dependency_versions(identifiers):
+    """Gives the records of `identifiers` new version stamps, so the
+    cached results that read them are no longer found.
+    """
+    caches[result_cache_alias].set_many(
+        {dependency_key(identifier): uuid4().hex for identifier in identifiers},
+        dependency_version_ttl)
+
+
+def visit_identifier(field, visit_id):
+    """Stands for the records of a visit, for records saved without
+    their visit loaded.
+    """
+    return f'{field}:{visit_id}'
+
+
+def instance_identifiers(instance):
+    """Returns the subject and visit identifiers of a model instance,
+    else [ALL_SUBJECTS] for an instance of `unscoped_models`, else [].
+
+    A visit is identified by its id, read without loading it, and by its
+    subject if it is already loaded, as when saved from a form.
+    """
+    identifiers = {getattr(instance, field, None) for field in identifier_fields}
+    for field in visit_fields:
+        try:
+            visit_field = instance._meta.get_field(field)
+        except FieldDoesNotExist:
+            continue
+        visit_id = getattr(instance, visit_field.attname, None)
+        if visit_id is not None:
+            identifiers.add(visit_identifier(field, visit_id))
+        if visit_field.is_cached(instance):
+            identifiers.add(getattr(
+                visit_field.get_cached_value(instance), 'subject_identifier', None))
+    identifiers.discard(None)
+    if identifiers:
+        return sorted(identifiers)
+    if instance._meta.label_lower in unscoped_models:
+        return [ALL_SUBJECTS]
+    return []
+
+
+class ResultCacheMixin:
+    """Serves the outcome of validate() from a cache shared by all
+    processes when the same cleaned_data is validated again and the
+    records of its subjects are unchanged.
+
+    Results are keyed by the validator class, a hash of cleaned_data and
+    the version stamps of the subjects and visits in cleaned_data, see
+    `result_cache_identifiers`. Saving or deleting any record of a
+    subject or visit gives it a new stamp, in every process, and a
+    record of `unscoped_models` stamps all subjects. Cached results
+    expire after VALIDATION_RESULT_CACHE_TTL.
+
+    Off by default. Set VALIDATION_RESULT_CACHE_ENABLED, which connects
+    the signals stamping saved records, and enable per class with
+    `cache_results = True` or VALIDATION_RESULT_CACHE_VALIDATORS, for
+    validators that only read records of the subjects and visits in
+    cleaned_data, or add the identifiers of the other records they read
+    in `result_cache_identifiers`. They must not change cleaned_data
+    or depend on the current time. A cached error is raised with the
+    messages and codes of the original one.
+    """
+
+    cache_results = False
+
+    @classmethod
+    def result_cache_enabled(cls):
+        return result_caching_enabled and (
+            cls.cache_results or cls.__name__ in cached_validator_names)
+
+    def result_cache_identifiers(self):
+        """Returns the identifiers of the subjects and visits whose
+        records the validator reads.
+        """
+        identifiers = {self.cleaned_data.get(field) for field in identifier_fields}
+        for field in visit_fields:
+            visit = self.cleaned_data.get(field)
+            if visit is not None:
+                identifiers.add(visit_identifier(field, visit.pk))
+                identifiers.add(getattr(visit, 'subject_identifier', None))
+        identifiers.discard(None)
+        return sorted(identifiers) + [ALL_SUBJECTS]
+
+    def result_cache_key(self):
+        cls = self.__class__
+        versions = dependency_versions(self.result_cache_identifiers())
+        key = '.'.join([cls.__module__, cls.__qualname__,
+                        content_hash(self.cleaned_data)] + versions)
+        return ('flourish_form_validations.validation_result.'
+                f'{hashlib.sha256(key.encode()).hexdigest()}')
+
+    def validate(self):
+        if (not self.result_cache_enabled()
+                or getattr(self, 'rules_result', None) is not None):
+            return super().validate()
+
+        cache = caches[result_cache_alias]
+        key = self.result_cache_key()
+        result = cache.get(key)
+        result_cache_stats.record(self.__class__.__name__, hit=result is not None)
+        if result is not None:
+            # values prefetched for this validation are not used
+            self._prefetched_pending = False
+            errors, error_codes = result
+            if not errors:
+                return self.cleaned_data
+            self._errors.update(errors)
+            self._error_codes.extend(error_codes)
+            raise ValidationError(errors)
+
+        try:
+            cleaned_data = super().validate()
+        except ValidationError as e:
+            if hasattr(e, 'error_dict'):
+                errors = e.message_dict
+            else:
+                errors = {NON_FIELD_ERRORS: e.messages}
+            cache.set(key, (errors, list(self._error_codes)), result_cache_ttl)
+            raise
+        cache.set(key, ({}, []), result_cache_ttl)
+        return cleaned_data
@@ -0,0 +1,286 @@
+from django.core.exceptions import NON_FIELD_ERRORS, ValidationError
+
+# Rule cost classes, cheapest first.
+PURE = 'pure'
+SINGLE_QUERY = 'single_query'
+MULTI_QUERY = 'multi_query'
+
+costs = [PURE, SINGLE_QUERY, MULTI_QUERY]
+
+
+class FieldReadRecorder(dict):
+    """A cleaned_data dict that records the fields read from it.
+
+    Iterating over it records `all_fields`, as a rule doing so may
+    depend on any field.
+    """
+
+    all_fields = '__all__'
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.reads = set()
+
+    def __getitem__(self, key):
+        self.reads.add(key)
+        return super().__getitem__(key)
+
+    def __contains__(self, key):
+        self.reads.add(key)
+        return super().__contains__(key)
+
+    def __iter__(self):
+        self.reads.add(self.all_fields)
+        return super().__iter__()
+
+    def get(self, key, default=None):
+        self.reads.add(key)
+        return super().get(key, default)
+
+    def keys(self):
+        self.reads.add(self.all_fields)
+        return super().keys()
+
+    def values(self):
+        self.reads.add(self.all_fields)
+        return super().values()
+
+    def items(self):
+        self.reads.add(self.all_fields)
+        return super().items()
+
+
+class RulesResult:
+    """The outcome of `ValidationRulesMixin.revalidate`.
+
+    Holds the errors and the cleaned_data fields read by each rule,
+    from which the field to rule dependency graph is derived.
+    """
+
+    def __init__(self):
+        self.errors = {}
+        self.rule_errors = {}
+        self.rule_fields = {}
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(errors={self.errors!r})'
+
+    @property
+    def is_valid(self):
+        return not self.errors
+
+    def affected_rules(self, changed_fields):
+        """Returns the set of rules that read any of `changed_fields`.
+        """
+        changed_fields = set(changed_fields)
+        return {
+            method for method, fields in self.rule_fields.items()
+            if FieldReadRecorder.all_fields in fields or fields & changed_fields}
+
+    def dependency_graph(self):
+        """Returns a dict of {field: set of rules reading it}.
+        """
+        graph = {}
+        for method, fields in self.rule_fields.items():
+            for field in fields:
+                graph.setdefault(field, set()).add(method)
+        return graph
+
+
+class Rule:
+    """A named step of a validator's clean(), run by
+    `ValidationRulesMixin.run_rules`.
+
+    `method` is the name of the validator method to call and
+    `depends_on` the names of earlier rules that must pass for this
+    rule to be run when collecting errors. `cost` is the rule's cost
+    class, one of `costs`; rules are assumed to query the database
+    unless annotated otherwise.
+    """
+
+    def __init__(self, method, depends_on=None, with_cleaned_data=False,
+                 cost=MULTI_QUERY):
+        if cost not in costs:
+            raise ValueError(
+                f'Invalid cost for rule {method!r}. Expected one of {costs}. '
+                f'Got {cost!r}.')
+        self.method = method
+        self.depends_on = tuple(depends_on or ())
+        self.with_cleaned_data = with_cleaned_data
+        self.cost = cost
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.method!r})'
+
+    def __call__(self, validator):
+        func = getattr(validator, self.method)
+        if self.with_cleaned_data:
+            return func(cleaned_data=validator.cleaned_data)
+        return func()
+
+
+class ValidationRulesMixin:
+    """Runs a validator's rules.
+
+    Rules are run cheapest cost class first, see `schedule`, but errors
+    keep the precedence of the declared order. By default the first
+    failing rule in declared order raises, as in a plain clean(), and
+    costlier rules declared after a failed cheaper one are not run.
+    With `collect_errors = True` every rule is run, except those that
+    depend on a failed or skipped rule, and the errors of all failing
+    rules are raised together. `revalidate` collects errors and only
+    re-runs the rules affected by the changed fields.
+    """
+
+    collect_errors = False
+
+    rules = []
+
+    rules_result = None
+
+    def run_rules(self, rules=None):
+        rules = self.rules if rules is None else rules
+        if self.rules_result is not None:
+            return self.run_rules_incremental(rules)
+        if not self.collect_errors:
+            return self.run_rules_first_error(rules)
+
+        rule_errors = {}
+        failed = set()
+        for group in self.schedule(rules):
+            for index, rule in group:
+                if failed.intersection(rule.depends_on):
+                    failed.add(rule.method)
+                    continue
+                try:
+                    rule(self)
+                except ValidationError as e:
+                    failed.add(rule.method)
+                    rule_errors[index] = {}
+                    self.collect_error(rule_errors[index], e)
+        errors = {}
+        for index in sorted(rule_errors):
+            for field, error_list in rule_errors[index].items():
+                errors.setdefault(field, []).extend(error_list)
+        if errors:
+            self._errors.update(errors)
+            raise ValidationError(errors)
+
+    def schedule(self, rules):
+        """Returns the rules grouped by cost class, cheapest first, as
+        lists of (declared index, rule) in declared order.
+
+        A rule is never scheduled in a cheaper class than a rule it
+        depends on.
+        """
+        ranks = {}
+        for rule in rules:
+            rank = costs.index(rule.cost)
+            for method in rule.depends_on:
+                rank = max(rank, ranks.get(method, rank))
+            ranks[rule.method] = rank
+        return [[(index, rule) for index, rule in enumerate(rules)
+                 if ranks[rule.method] == rank]
+                for rank in sorted(set(ranks.values()))]
+
+    def run_rules_first_error(self, rules):
+        """Raises the error of the first failing rule in declared order.
+
+        Once a rule fails, only the rules declared before it are still
+        run, cheapest first. The errors recorded by a failing rule that
+        loses precedence are discarded.
+        """
+        errors, error_codes = dict(self._errors), list(self._error_codes)
+        failure = None
+        for group in self.schedule(rules):
+            for index, rule in group:
+                if failure and index > failure[0]:
+                    break
+                try:
+                    rule(self)
+                except Exception as e:
+                    failure = (index, e, dict(self._errors), list(self._error_codes))
+                    self.reset_errors(errors, error_codes)
+                    break
+        if failure:
+            _, e, errors, error_codes = failure
+            self.reset_errors(errors, error_codes)
+            raise e
+
+    def reset_errors(self, errors, error_codes):
+        self._errors.clear()
+        self._errors.update(errors)
+        self._error_codes[:] = error_codes
+
+    def collect_error(self, errors, e):
+        """Adds the messages of ValidationError `e` to the `errors`
+        dictionary of lists.
+        """
+        if hasattr(e, 'error_dict'):
+            for field, error_list in e.error_dict.items():
+                errors.setdefault(field, []).extend(error_list)
+        else:
+            errors.setdefault(NON_FIELD_ERRORS, []).extend(e.error_list)
+
+    def revalidate(self, previous=None, changed_fields=None):
+        """Validates, collecting errors, and returns a RulesResult.
+
+        Given the `previous` RulesResult and the names of the
+        `changed_fields`, only the rules that read a changed field, or
+        that depend on a re-run rule, are run again. The other rules
+        keep their previous errors.
+        """
+        rules_result = RulesResult()
+        self.rules_result = rules_result
+        self.previous_result = previous
+        self.changed_fields = set(changed_fields or [])
+        try:
+            self.validate()
+        except ValidationError:
+            pass
+        finally:
+            self.rules_result = None
+            self.previous_result = None
+            self.changed_fields = None
+        rules_result.errors = dict(self._errors)
+        return rules_result
+
+    def run_rules_incremental(self, rules):
+        previous = self.previous_result
+        affected = (previous.affected_rules(self.changed_fields)
+                    if previous else set())
+        cleaned_data = self.cleaned_data
+        errors = {}
+        failed = set()
+        rerun = set()
+        for rule in rules:
+            if failed.intersection(rule.depends_on):
+                failed.add(rule.method)
+                continue
+            if (previous and rule.method in previous.rule_fields
+                    and rule.method not in affected
+                    and not rerun.intersection(rule.depends_on)):
+                rule_errors = previous.rule_errors.get(rule.method)
+                self.rules_result.rule_fields[rule.method] = \
+                    previous.rule_fields[rule.method]
+            else:
+                rerun.add(rule.method)
+                rule_errors = {}
+                self.cleaned_data = FieldReadRecorder(cleaned_data)
+                try:
+                    rule(self)
+                except ValidationError as e:
+                    self.collect_error(rule_errors, e)
+                finally:
+                    cleaned_data.update(self.cleaned_data)
+                    self.rules_result.rule_fields[rule.method] = frozenset(
+                        self.cleaned_data.reads)
+                    self.cleaned_data = cleaned_data
+            if rule_errors:
+                failed.add(rule.method)
+                self.rules_result.rule_errors[rule.method] = rule_errors
+                for field, error_list in rule_errors.items():
+                    errors.setdefault(field, []).extend(error_list)
+        if errors:
+            self._errors.update(errors)
+            raise ValidationError(errors)
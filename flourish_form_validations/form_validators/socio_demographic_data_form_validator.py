@@ -1,9 +1,9 @@
-from django.apps import apps as django_apps
 from django.forms import ValidationError
 from edc_constants.constants import OTHER, YES
 from edc_form_validators import FormValidator
 
 from .crf_form_validator import FormValidatorMixin
+from .model_registry import get_model
 
 
 class SocioDemographicDataFormValidator(FormValidatorMixin, FormValidator):
@@ -15,32 +15,30 @@ class SocioDemographicDataFormValidator(FormValidatorMixin, FormValidator):
 
     @property
     def maternal_dataset_cls(self):
-        return django_apps.get_model(self.maternal_dataset_model)
+        return get_model(self.maternal_dataset_model)
 
     @property
     def antenatal_enrollment_cls(self):
-        return django_apps.get_model(self.antenatal_enrollment_model)
+        return get_model(self.antenatal_enrollment_model)
 
     @property
     def preg_screening_cls(self):
-        return django_apps.get_model(self.preg_women_screening_model)
+        return get_model(self.preg_women_screening_model)
 
     @property
     def delivery_model_cls(self):
-        return django_apps.get_model(self.delivery_model)
+        return get_model(self.delivery_model)
 
     @property
     def child_socio_demographic_cls(self):
-        return django_apps.get_model(self.child_socio_demographic_model)
+        return get_model(self.child_socio_demographic_model)
 
     def clean(self):
         self.maternal_visit = self.cleaned_data.get(
             'maternal_visit', None)
         self.subject_identifier = getattr(
             self.maternal_visit, 'subject_identifier', None)
-        onschedule_model_cls = self.visit_onschedule_model_cls(self.maternal_visit)
-        onschedule_model_obj = self.get_onschedule_model_obj(
-            self.subject_identifier, onschedule_model_cls, self.maternal_visit.schedule_name)
+        onschedule_model_obj = self.get_visit_onschedule_obj(self.maternal_visit)
         self.child_subject_identifier = self.get_child_subject_identifier(
             onschedule_model_obj)
 
@@ -93,7 +91,7 @@ class SocioDemographicDataFormValidator(FormValidatorMixin, FormValidator):
     @property
     def onschedule_cls(self):
         maternal_visit = self.cleaned_data.get('maternal_visit')
-        return django_apps.get_model(
+        return get_model(
             maternal_visit.appointment.schedule.onschedule_model
         )
 
@@ -1,18 +1,25 @@
-import re
-
 from django import forms
-from django.apps import apps as django_apps
 from django.core.exceptions import ValidationError
+from django.db.models import Q
 from edc_base.utils import age, relativedelta
 from edc_constants.constants import FEMALE, MALE, NO, NOT_APPLICABLE, YES
 from edc_form_validators import FormValidator
 
+from .async_validation import AsyncValidationMixin
+from .batch import BatchLookup
 from .consents_form_validator_mixin import ConsentsFormValidatorMixin
+from .identity import IdentityFormValidatorMixin
+from .model_registry import get_model
+from .result_cache import ResultCacheMixin
+from .rules import PURE, SINGLE_QUERY, Rule, ValidationRulesMixin
 from .subject_consent_eligibilty import SubjectConsentEligibility
 
 
 class SubjectConsentFormValidator(ConsentsFormValidatorMixin,
-                                  SubjectConsentEligibility, FormValidator):
+                                  IdentityFormValidatorMixin,
+                                  SubjectConsentEligibility,
+                                  ValidationRulesMixin, ResultCacheMixin,
+                                  AsyncValidationMixin, FormValidator):
     prior_screening_model = 'flourish_caregiver.screeningpriorbhpparticipants'
 
     subject_consent_model = 'flourish_caregiver.subjectconsent'
@@ -23,54 +30,138 @@ class SubjectConsentFormValidator(ConsentsFormValidatorMixin,
 
     delivery_model = 'flourish_caregiver.maternaldelivery'
 
+    # Declared in the order of the original clean(), which decides the
+    # error raised first. The scheduler runs the PURE name checks before
+    # clean_gender but still runs clean_gender when a name is invalid,
+    # as its error takes precedence.
+    rules = [
+        Rule('clean_gender', cost=SINGLE_QUERY),
+        Rule('clean_full_name_syntax', cost=PURE),
+        Rule('validate_prior_participant_names'),
+        Rule('clean_initials_with_full_name',
+             depends_on=['clean_full_name_syntax'], cost=PURE),
+        Rule('validate_recruit_source', cost=PURE),
+        Rule('validate_recruitment_clinic'),
+        Rule('validate_is_literate', cost=PURE),
+        Rule('validate_dob', with_cleaned_data=True, cost=SINGLE_QUERY),
+        Rule('validate_identity_number', with_cleaned_data=True, cost=PURE),
+        Rule('validate_hiv_testing'),
+        Rule('validate_child_consent'),
+        Rule('validate_reconsent', cost=SINGLE_QUERY),
+        Rule('validate_age', depends_on=['validate_dob'], cost=PURE),
+    ]
+
+    batch_lookups = [
+        BatchLookup('bhp_prior_screening', 'bhp_prior_screening_cls',
+                    'screening_identifier'),
+        BatchLookup('caregiver_locator', 'caregiver_locator_cls',
+                    'screening_identifier'),
+        BatchLookup('preg_women_screening', 'preg_women_screening_cls',
+                    'screening_identifier'),
+        BatchLookup('maternal_dataset', 'maternal_dataset_cls',
+                    'screening_identifier'),
+    ]
+
     @property
     def bhp_prior_screening_cls(self):
-        return django_apps.get_model(self.prior_screening_model)
+        return get_model(self.prior_screening_model)
 
     @property
     def subject_consent_cls(self):
-        return django_apps.get_model(self.subject_consent_model)
+        return get_model(self.subject_consent_model)
 
     @property
     def caregiver_locator_cls(self):
-        return django_apps.get_model(self.caregiver_locator_model)
+        return get_model(self.caregiver_locator_model)
 
     @property
     def preg_women_screening_cls(self):
-        return django_apps.get_model(self.preg_women_screening_model)
+        return get_model(self.preg_women_screening_model)
 
     @property
     def delivery_cls(self):
-        return django_apps.get_model(self.delivery_model)
+        return get_model(self.delivery_model)
+
+    def get_async_lookups(self):
+        self.subject_identifier = self.cleaned_data.get('subject_identifier')
+        self.screening_identifier = self.cleaned_data.get('screening_identifier')
+        lookups = super().get_async_lookups()
+        lookups[0].append(self.load_consents)
+        return lookups
 
     def clean(self):
         cleaned_data = self.cleaned_data
         self.subject_identifier = cleaned_data.get('subject_identifier')
         self.screening_identifier = cleaned_data.get('screening_identifier')
         super().clean()
+        self.run_rules()
+
+    def get_prefetched(self, name, loader):
+        """Returns the prefetched value for `name`, otherwise calls
+        `loader` and keeps its value, so each lookup runs at most once
+        and only when a rule first reads it.
+        """
+        if self.prefetched is None:
+            self.prefetched = {}
+        if name not in self.prefetched:
+            self.prefetched[name] = loader()
+        return self.prefetched[name]
+
+    def load_consents(self):
+        """Prefetches, in one query, the consents at this version of the
+        subject and of the screening identifier. A lookup matching more
+        than one consent is left for its loader to run, and raise.
+        """
+        if self.prefetched is None:
+            self.prefetched = {}
+        consents = list(self.subject_consent_cls.objects.filter(
+            Q(subject_identifier=self.subject_identifier)
+            | Q(screening_identifier=self.screening_identifier),
+            version=self.cleaned_data.get('version')))
+        for name, field, value in [
+                ('subject_consent', 'subject_identifier', self.subject_identifier),
+                ('screening_consent', 'screening_identifier', self.screening_identifier)]:
+            matches = [consent for consent in consents
+                       if getattr(consent, field) == value]
+            if len(matches) <= 1:
+                self.prefetched[name] = matches[0] if matches else None
+
+    def get_consent(self, name, loader):
+        if self.prefetched is None or name not in self.prefetched:
+            self.load_consents()
+        return self.get_prefetched(name, loader)
 
-        self.clean_gender()
-        self.clean_full_name_syntax()
-        self.validate_prior_participant_names()
-        self.clean_initials_with_full_name()
-        self.validate_recruit_source()
-        self.validate_recruitment_clinic()
-        self.validate_is_literate()
-        self.validate_dob(cleaned_data=self.cleaned_data)
-        self.validate_identity_number(cleaned_data=self.cleaned_data)
-        self.validate_hiv_testing()
-        self.validate_child_consent()
-        self.validate_reconsent()
-        self.validate_age()
+    @property
+    def subject_consent(self):
+        return self.get_consent('subject_consent', self.get_subject_consent)
 
-    def validate_reconsent(self):
+    def get_subject_consent(self):
         try:
-            consent_obj = self.subject_consent_cls.objects.get(
+            subject_consent = self.subject_consent_cls.objects.get(
                 subject_identifier=self.cleaned_data.get('subject_identifier'),
                 version=self.cleaned_data.get('version'))
         except self.subject_consent_cls.DoesNotExist:
-            pass
+            return None
+        else:
+            return subject_consent
+
+    @property
+    def screening_consent(self):
+        return self.get_consent('screening_consent', self.get_screening_consent)
+
+    def get_screening_consent(self):
+        try:
+            screening_consent = self.subject_consent_cls.objects.get(
+                screening_identifier=self.cleaned_data.get('screening_identifier'),
+                version=self.cleaned_data.get('version'))
+        except self.subject_consent_cls.DoesNotExist:
+            return None
         else:
+            return screening_consent
+
+    def validate_reconsent(self):
+        consent_obj = self.subject_consent
+        if consent_obj:
             consent_dict = consent_obj.__dict__
             consent_fields = [
                 'first_name', 'last_name', 'dob', 'recruit_source',
@@ -85,34 +176,6 @@ class SubjectConsentFormValidator(ConsentsFormValidatorMixin,
                     self._errors.update(message)
                     raise ValidationError(message)
 
-    def clean_full_name_syntax(self):
-        cleaned_data = self.cleaned_data
-        first_name = cleaned_data.get("first_name")
-        last_name = cleaned_data.get("last_name")
-
-        if first_name and not re.match(r'^[A-Z]+$|^([A-Z]+[ ][A-Z]+)$', first_name):
-            message = {'first_name': 'Ensure first name is letters (A-Z) in '
-                                     'upper case, no special characters, except spaces. '
-                                     'Maximum 2 first '
-                                     'names allowed.'}
-            self._errors.update(message)
-            raise ValidationError(message)
-
-        if last_name and not re.match(r'^[A-Z-]+$', last_name):
-            message = {'last_name': 'Ensure last name is letters (A-Z) in '
-                                    'upper case, no special characters, except hyphens.'}
-            self._errors.update(message)
-            raise ValidationError(message)
-
-        if first_name and first_name != first_name.upper():
-            message = {'first_name': 'First name must be in CAPS.'}
-            self._errors.update(message)
-            raise ValidationError(message)
-        if last_name and last_name != last_name.upper():
-            message = {'last_name': 'Last name must be in CAPS.'}
-            self._errors.update(message)
-            raise ValidationError(message)
-
     def clean_gender(self):
 
         if self.preg_women_screening and self.cleaned_data.get('gender') == MALE:
@@ -189,40 +252,6 @@ class SubjectConsentFormValidator(ConsentsFormValidatorMixin,
             self.preg_women_screening is not None and not self.bhp_prior_screening,
             field_applicable='hiv_testing')
 
-    def validate_identity_number(self, cleaned_data=None):
-        identity = cleaned_data.get('identity')
-        if identity:
-            if not re.match('[0-9]+$', identity):
-                message = {'identity': 'Identity number must be digits.'}
-                self._errors.update(message)
-                raise ValidationError(message)
-            if cleaned_data.get('identity') != cleaned_data.get(
-                    'confirm_identity'):
-                msg = {'identity':
-                       '\'Identity\' must match \'confirm identity\'.'}
-                self._errors.update(msg)
-                raise ValidationError(msg)
-            if cleaned_data.get('identity_type') == 'country_id':
-                if len(cleaned_data.get('identity')) != 9:
-                    msg = {'identity':
-                           'Country identity provided should contain 9 values.'
-                           ' Please correct.'}
-                    self._errors.update(msg)
-                    raise ValidationError(msg)
-                gender = cleaned_data.get('gender')
-                if gender == FEMALE and cleaned_data.get('identity')[4] != '2':
-                    msg = {'identity':
-                           'Participant gender is Female. Please correct '
-                           'identity number.'}
-                    self._errors.update(msg)
-                    raise ValidationError(msg)
-                elif gender == MALE and cleaned_data.get('identity')[4] != '1':
-                    msg = {'identity':
-                           'Participant is Male. Please correct identity '
-                           'number.'}
-                    self._errors.update(msg)
-                    raise ValidationError(msg)
-
     def validate_dob(self, cleaned_data=None):
         consent_datetime = cleaned_data.get('consent_datetime')
 
@@ -231,12 +260,8 @@ class SubjectConsentFormValidator(ConsentsFormValidatorMixin,
                 consent_datetime.date(), cleaned_data.get('dob')).years
             age_in_years = None
 
-            try:
-                consent_obj = self.subject_consent_cls.objects.get(
-                    screening_identifier=self.cleaned_data.get(
-                        'screening_identifier'),
-                    version=self.cleaned_data.get('version'))
-            except self.subject_consent_cls.DoesNotExist:
+            consent_obj = self.screening_consent
+            if not consent_obj:
                 if consent_age and consent_age < 18:
                     message = {'dob':
                                'Participant is less than 18 years, age derived '
@@ -305,7 +330,9 @@ class SubjectConsentFormValidator(ConsentsFormValidatorMixin,
 
     @property
     def bhp_prior_screening(self):
+        return self.get_prefetched('bhp_prior_screening', self.get_bhp_prior_screening)
 
+    def get_bhp_prior_screening(self):
         try:
             bhp_prior_screening = self.bhp_prior_screening_cls.objects.get(
                 screening_identifier=self.screening_identifier)
@@ -316,6 +343,9 @@ class SubjectConsentFormValidator(ConsentsFormValidatorMixin,
 
     @property
     def caregiver_locator(self):
+        return self.get_prefetched('caregiver_locator', self.get_caregiver_locator)
+
+    def get_caregiver_locator(self):
         if self.caregiver_locator_cls:
             try:
                 caregiver_locator = self.caregiver_locator_cls.objects.get(
@@ -327,6 +357,9 @@ class SubjectConsentFormValidator(ConsentsFormValidatorMixin,
 
     @property
     def preg_women_screening(self):
+        return self.get_prefetched('preg_women_screening', self.get_preg_women_screening)
+
+    def get_preg_women_screening(self):
         try:
             preg_women_screening = self.preg_women_screening_cls.objects.get(
                 screening_identifier=self.screening_identifier)
@@ -0,0 +1,66 @@
+from django.utils.functional import cached_property
+
+from .consent_version import get_consent_version
+from .hiv_status import get_hiv_status
+from .offstudy_status import get_offstudy_status
+
+
+class SubjectContext:
+    """Resolves the subject level facts shared by CRF validations.
+
+    Each fact is looked up at most once for the lifetime of the context,
+    which is created per validation by `FormValidatorMixin`.
+    """
+
+    def __init__(self, subject_identifier=None, subject_consent_cls=None,
+                 consent_version_cls=None, caregiver_offstudy_cls=None):
+        self.subject_identifier = subject_identifier
+        self.subject_consent_cls = subject_consent_cls
+        self.consent_version_cls = consent_version_cls
+        self.caregiver_offstudy_cls = caregiver_offstudy_cls
+
+    def __repr__(self):
+        return (f'{self.__class__.__name__}('
+                f'subject_identifier={self.subject_identifier!r})')
+
+    @cached_property
+    def latest_consent_obj(self):
+        """Returns the latest caregiver consent or None.
+        """
+        if not self.subject_identifier:
+            return None
+        return self.subject_consent_cls.objects.filter(
+            subject_identifier=self.subject_identifier).order_by(
+            '-consent_datetime').first()
+
+    @cached_property
+    def consent_version_obj(self):
+        """Returns the consent version for the latest consent's screening
+        identifier or None.
+        """
+        if self.latest_consent_obj:
+            return get_consent_version(
+                self.consent_version_cls,
+                self.latest_consent_obj.screening_identifier)
+        return None
+
+    @cached_property
+    def hiv_status(self):
+        return get_hiv_status(subject_identifier=self.subject_identifier)
+
+    @cached_property
+    def offstudy_status(self):
+        return get_offstudy_status(
+            self.subject_identifier, self.caregiver_offstudy_cls)
+
+    @property
+    def pending_offstudy_action(self):
+        """Returns True if a NEW caregiver offstudy action item exists.
+        """
+        return self.offstudy_status.pending_action
+
+    def offstudy_before(self, report_date):
+        """Returns True if the subject was taken offstudy before
+        `report_date`.
+        """
+        return self.offstudy_status.offstudy_before(report_date)
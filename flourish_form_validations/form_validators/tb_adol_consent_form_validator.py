@@ -1,7 +1,8 @@
-from django.apps import apps as django_apps
 from django.core.exceptions import ValidationError
 from edc_form_validators import FormValidatorMixin, FormValidator
 
+from .model_registry import get_model
+
 
 class TbChildAdolConsentFormValidator(FormValidator, FormValidatorMixin):
 
@@ -9,7 +10,7 @@ class TbChildAdolConsentFormValidator(FormValidator, FormValidatorMixin):
 
     @property
     def child_consent_cls(self):
-        return django_apps.get_model(self.child_consent_model)
+        return get_model(self.child_consent_model)
 
     # def equality_validator(self, current_field_data, child_consent_data):
 
@@ -53,7 +54,7 @@ class TbAdolConsentFormValidator(FormValidator, FormValidatorMixin):
 
     @property
     def subject_consent_cls(self):
-        return django_apps.get_model(self.subject_consent_model)
+        return get_model(self.subject_consent_model)
 
     def clean(self):
         super().clean()
@@ -2,11 +2,74 @@ from edc_constants.constants import YES, NO, UNKNOWN, DWTA
 from edc_form_validators import FormValidator
 
 from .crf_form_validator import FormValidatorMixin
+from .requirements import Required, RequirementTable
 
 
 class TbVisitScreeningWomenFormValidator(FormValidatorMixin, FormValidator):
     responses = [NO, UNKNOWN, DWTA]
 
+    fever_requirements = RequirementTable(
+        Required(YES, field='fever_during_preg',
+                 targets=['fever_illness_times', 'fever_illness_preg']),
+        Required(YES, field='fever_illness_postpartum',
+                 targets=['fever_illness_postpartum_times',
+                          'fever_illness_postpartum_preg']),
+    )
+
+    night_sweats_requirements = RequirementTable(
+        Required(YES, field='night_sweats_during_preg',
+                 targets=['night_sweats_during_preg_times',
+                          'night_sweats_during_preg_clinic']),
+        Required(YES, field='night_sweats_postpartum',
+                 targets=['night_sweats_postpartum_times',
+                          'night_sweats_postpartum_clinic']),
+    )
+
+    weight_loss_requirements = RequirementTable(
+        Required(YES, field='weight_loss_during_preg',
+                 targets=['weight_loss_during_preg_times',
+                          'weight_loss_during_preg_clinic']),
+        Required(YES, field='weight_loss_postpartum',
+                 targets=['weight_loss_postpartum_times',
+                          'weight_loss_postpartum_clinic']),
+    )
+
+    cough_blood_requirements = RequirementTable(
+        Required(YES, field='cough_blood_during_preg',
+                 targets=['cough_blood_during_preg_times',
+                          'cough_blood_during_preg_clinic']),
+        Required(YES, field='cough_blood_postpartum',
+                 targets=['cough_blood_postpartum_times',
+                          'cough_blood_postpartum_clinic']),
+    )
+
+    enlarged_lymph_nodes_requirements = RequirementTable(
+        Required(YES, field='enlarged_lymph_nodes_during_preg',
+                 targets=['enlarged_lymph_nodes_during_preg_times',
+                          'enlarged_lymph_nodes_during_preg_clinic']),
+        Required(YES, field='enlarged_lymph_nodes_postpartum',
+                 targets=['enlarged_lymph_nodes_postpartum_times',
+                          'enlarged_lymph_nodes_postpartum_clinic']),
+    )
+
+    cough_requirements = RequirementTable(
+        Required(YES, field='have_cough', targets=['cough_duration']),
+        Required(YES, field='cough_intersects_preg',
+                 targets=['cough_duration_preg', 'seek_med_help', 'cough_num']),
+        Required(YES, field='cough_illness',
+                 targets=['cough_illness_times', 'cough_illness_preg',
+                          'cough_illness_med_help']),
+    )
+
+    unexplained_fatigue_requirements = RequirementTable(
+        Required(YES, field='unexplained_fatigue_during_preg',
+                 targets=['unexplained_fatigue_during_preg_times',
+                          'unexplained_fatigue_during_preg_clinic']),
+        Required(YES, field='unexplained_fatigue_postpartum',
+                 targets=['unexplained_fatigue_postpartum_times',
+                          'unexplained_fatigue_postpartum_clinic']),
+    )
+
     def clean(self):
         super().clean()
 
@@ -21,162 +84,22 @@ class TbVisitScreeningWomenFormValidator(FormValidatorMixin, FormValidator):
         self.validate_cough()
 
     def validate_cough(self):
-        have_cough_required_field = [
-            'cough_duration_preg',
-            'seek_med_help',
-            'cough_num'
-        ]
-        cough_illness_required_field = [
-            'cough_illness_times',
-            'cough_illness_preg',
-            'cough_illness_med_help'
-        ]
-        self.required_if(
-            YES,
-            field='have_cough',
-            field_required='cough_duration'
-        )
-        for field in have_cough_required_field:
-            self.required_if(
-                YES,
-                field='cough_intersects_preg',
-                field_required=field
-            )
-        for field in cough_illness_required_field:
-            self.required_if(
-                YES,
-                field='cough_illness',
-                field_required=field
-            )
+        self.cough_requirements.evaluate(self)
 
     def validate_fever(self):
-        fever_during_preg_required_fields = [
-            'fever_illness_times',
-            'fever_illness_preg',
-        ]
-        fever_illness_postpartum_required_fields = [
-            'fever_illness_postpartum_times',
-            'fever_illness_postpartum_preg',
-        ]
-        for field in fever_during_preg_required_fields:
-            self.required_if(
-                YES,
-                field='fever_during_preg',
-                field_required=field
-            )
-        for field in fever_illness_postpartum_required_fields:
-            self.required_if(
-                YES,
-                field='fever_illness_postpartum',
-                field_required=field
-            )
+        self.fever_requirements.evaluate(self)
 
     def validate_night_sweats(self):
-        night_sweats_during_preg_required_fields = [
-            'night_sweats_during_preg_times',
-            'night_sweats_during_preg_clinic',
-        ]
-        night_sweats_postpartum_required_fields = [
-            'night_sweats_postpartum_times',
-            'night_sweats_postpartum_clinic',
-        ]
-        for field in night_sweats_during_preg_required_fields:
-            self.required_if(
-                YES,
-                field='night_sweats_during_preg',
-                field_required=field
-            )
-        for field in night_sweats_postpartum_required_fields:
-            self.required_if(
-                YES,
-                field='night_sweats_postpartum',
-                field_required=field
-            )
+        self.night_sweats_requirements.evaluate(self)
 
     def validate_weight_loss(self):
-        weight_loss_during_preg_required_fields = [
-            'weight_loss_during_preg_times',
-            'weight_loss_during_preg_clinic',
-        ]
-        weight_loss_postpartum_required_fields = [
-            'weight_loss_postpartum_times',
-            'weight_loss_postpartum_clinic',
-        ]
-        for field in weight_loss_during_preg_required_fields:
-            self.required_if(
-                YES,
-                field='weight_loss_during_preg',
-                field_required=field
-            )
-        for field in weight_loss_postpartum_required_fields:
-            self.required_if(
-                YES,
-                field='weight_loss_postpartum',
-                field_required=field
-            )
+        self.weight_loss_requirements.evaluate(self)
 
     def validate_enlarged_lymph_nodes(self):
-        enlarged_lymph_nodes_during_preg_required_fields = [
-            'enlarged_lymph_nodes_during_preg_times',
-            'enlarged_lymph_nodes_during_preg_clinic',
-        ]
-        enlarged_lymph_nodes_postpartum_required_fields = [
-            'enlarged_lymph_nodes_postpartum_times',
-            'enlarged_lymph_nodes_postpartum_clinic',
-        ]
-        for field in enlarged_lymph_nodes_during_preg_required_fields:
-            self.required_if(
-                YES,
-                field='enlarged_lymph_nodes_during_preg',
-                field_required=field
-            )
-        for field in enlarged_lymph_nodes_postpartum_required_fields:
-            self.required_if(
-                YES,
-                field='enlarged_lymph_nodes_postpartum',
-                field_required=field
-            )
+        self.enlarged_lymph_nodes_requirements.evaluate(self)
 
     def validate_cough_blood(self):
-        cough_blood_during_preg_required_fields = [
-            'cough_blood_during_preg_times',
-            'cough_blood_during_preg_clinic',
-        ]
-        cough_blood_postpartum_required_fields = [
-            'cough_blood_postpartum_times',
-            'cough_blood_postpartum_clinic',
-        ]
-        for field in cough_blood_during_preg_required_fields:
-            self.required_if(
-                YES,
-                field='cough_blood_during_preg',
-                field_required=field
-            )
-        for field in cough_blood_postpartum_required_fields:
-            self.required_if(
-                YES,
-                field='cough_blood_postpartum',
-                field_required=field
-            )
+        self.cough_blood_requirements.evaluate(self)
 
     def validate_unexplained_fatigues(self):
-        unexplained_fatigue_during_preg_required_fields = [
-            'unexplained_fatigue_during_preg_times',
-            'unexplained_fatigue_during_preg_clinic',
-        ]
-        unexplained_fatigue_postpartum_required_fields = [
-            'unexplained_fatigue_postpartum_times',
-            'unexplained_fatigue_postpartum_clinic',
-        ]
-        for field in unexplained_fatigue_during_preg_required_fields:
-            self.required_if(
-                YES,
-                field='unexplained_fatigue_during_preg',
-                field_required=field
-            )
-        for field in unexplained_fatigue_postpartum_required_fields:
-            self.required_if(
-                YES,
-                field='unexplained_fatigue_postpartum',
-                field_required=field
-            )
+        self.unexplained_fatigue_requirements.evaluate(self)
@@ -0,0 +1,77 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class TimedCache:
+    """A thread safe, size bounded LRU cache whose entries expire
+    `ttl` seconds after they were set.
+
+    Used for the in-process caches shared between validations.
+    """
+
+    def __init__(self, maxsize=1024, ttl=300, timer=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer or time.monotonic
+        self._data = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
+
+    def __contains__(self, key):
+        return self.get(key, default=_missing) is not _missing
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                expires, value = self._data[key]
+            except KeyError:
+                return default
+            if expires is not None and expires <= self.timer():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        ttl = self.ttl if ttl is None else ttl
+        expires = self.timer() + ttl if ttl else None
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_set(self, key, loader, ttl=None):
+        """Returns the cached value for `key` or calls `loader`, caches
+        and returns its result.
+        """
+        value = self.get(key, default=_missing)
+        if value is _missing:
+            value = loader()
+            self.set(key, value, ttl=ttl)
+        return value
+
+    def invalidate(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def invalidate_if(self, predicate):
+        """Removes every entry for which `predicate(key, value)` is True.
+        """
+        with self._lock:
+            stale = [key for key, (_, value) in self._data.items()
+                     if predicate(key, value)]
+            for key in stale:
+                del self._data[key]
+        return len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+_missing = object()
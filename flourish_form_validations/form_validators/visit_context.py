@@ -0,0 +1,120 @@
+from django.conf import settings
+
+from .timed_cache import TimedCache
+
+
+class VisitContext:
+    """Facts about a maternal visit shared by every CRF entered for it.
+
+    Lookups that find nothing are not cached so that a later save of
+    the missing record is picked up on the next validation.
+    """
+
+    def __init__(self, visit=None, onschedule_model_cls=None,
+                 caregiver_child_consent_cls=None, subject_consent_cls=None):
+        self.visit_id = getattr(visit, 'pk', None)
+        self.subject_identifier = getattr(visit, 'subject_identifier', None)
+        self.schedule_name = getattr(visit, 'schedule_name', None)
+        self.onschedule_model_cls = onschedule_model_cls
+        self.caregiver_child_consent_cls = caregiver_child_consent_cls
+        self.subject_consent_cls = subject_consent_cls
+        self._cache = {}
+
+    def __repr__(self):
+        return (f'{self.__class__.__name__}(visit_id={self.visit_id!r}, '
+                f'subject_identifier={self.subject_identifier!r})')
+
+    def _get(self, name, loader):
+        try:
+            return self._cache[name]
+        except KeyError:
+            value = loader()
+            if value is not None:
+                self._cache[name] = value
+            return value
+
+    @property
+    def onschedule_obj(self):
+        """Returns the onschedule instance for the visit's schedule or
+        None.
+        """
+        def loader():
+            if not self.onschedule_model_cls:
+                return None
+            try:
+                return self.onschedule_model_cls.objects.get(
+                    subject_identifier=self.subject_identifier,
+                    schedule_name=self.schedule_name)
+            except self.onschedule_model_cls.DoesNotExist:
+                return None
+        return self._get('onschedule_obj', loader)
+
+    @property
+    def child_subject_identifier(self):
+        return getattr(self.onschedule_obj, 'child_subject_identifier', None)
+
+    @property
+    def latest_child_consent(self):
+        """Returns the latest caregiver consent on behalf of the child
+        on the visit's schedule or None.
+        """
+        def loader():
+            if not self.child_subject_identifier:
+                return None
+            return self.caregiver_child_consent_cls.objects.filter(
+                subject_identifier=self.child_subject_identifier).order_by(
+                '-consent_datetime').first()
+        return self._get('latest_child_consent', loader)
+
+    @property
+    def latest_consent_obj(self):
+        def loader():
+            return self.subject_consent_cls.objects.filter(
+                subject_identifier=self.subject_identifier).order_by(
+                '-consent_datetime').first()
+        return self._get('latest_consent_obj', loader)
+
+    def concerns(self, subject_identifier):
+        """Returns True if the context holds facts about
+        `subject_identifier`, as caregiver or as child.
+        """
+        return subject_identifier in (
+            self.subject_identifier,
+            getattr(self._cache.get('onschedule_obj'),
+                    'child_subject_identifier', None))
+
+
+# In-process only, contexts hold model instances. The signals only drop
+# contexts of their own process, so the ttl bounds how long another
+# process serves onschedule or consent data changed elsewhere.
+visit_contexts = TimedCache(
+    maxsize=getattr(settings, 'VISIT_CONTEXT_MAXSIZE', 512),
+    ttl=getattr(settings, 'VISIT_CONTEXT_TTL', 10))
+
+
+def get_visit_context(visit, onschedule_model_cls=None,
+                      caregiver_child_consent_cls=None, subject_consent_cls=None):
+    """Returns the shared VisitContext for `visit`, creating it if
+    it is not cached.
+    """
+    key = (visit.pk,
+           *[model_cls._meta.label_lower if model_cls else None for model_cls in [
+               onschedule_model_cls, caregiver_child_consent_cls,
+               subject_consent_cls]])
+    return visit_contexts.get_or_set(key, lambda: VisitContext(
+        visit=visit,
+        onschedule_model_cls=onschedule_model_cls,
+        caregiver_child_consent_cls=caregiver_child_consent_cls,
+        subject_consent_cls=subject_consent_cls))
+
+
+def invalidate_visit_context(visit=None, subject_identifier=None):
+    """Drops cached contexts for `visit` and/or for every visit
+    concerning `subject_identifier`.
+    """
+    visit_id = getattr(visit, 'pk', None)
+    return visit_contexts.invalidate_if(
+        lambda key, context: (
+            (visit_id is not None and context.visit_id == visit_id)
+            or (subject_identifier is not None
+                and context.concerns(subject_identifier))))
@@ -0,0 +1,262 @@
+"""Opt-in instrumentation of form validator `clean()` calls.
+
+Enable for every exported validator with:
+
+    FORM_VALIDATOR_INSTRUMENTATION = {
+        'sink': 'flourish_form_validations.instrumentation.LoggingSink',
+        'options': {}}
+
+or call `instrument_validators(sink)` directly.
+"""
+import atexit
+import logging
+import os
+import threading
+import time
+from collections import Counter, deque, namedtuple
+from functools import wraps
+
+from django.core.exceptions import ValidationError
+from django.db import connection
+from edc_base.utils import get_utcnow
+
+logger = logging.getLogger(__name__)
+
+ValidationMetric = namedtuple(
+    'ValidationMetric', [
+        'validator', 'wall_time', 'query_count', 'duplicate_query_count',
+        'error_code', 'timestamp'])
+
+
+class QueryCounter:
+    """Counts the queries, and repeats of an identical query, run on
+    the default connection while the context is open.
+    """
+
+    def __init__(self, using=None):
+        self.connection = connection if using is None else using
+        self.queries = Counter()
+        self._wrapper = None
+
+    def __call__(self, execute, sql, params, many, context):
+        self.queries[(sql, repr(params))] += 1
+        return execute(sql, params, many, context)
+
+    def __enter__(self):
+        self._wrapper = self.connection.execute_wrapper(self)
+        self._wrapper.__enter__()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._wrapper.__exit__(*exc_info)
+
+    @property
+    def count(self):
+        return sum(self.queries.values())
+
+    @property
+    def duplicate_count(self):
+        return self.count - len(self.queries)
+
+
+class LoggingSink:
+    """Writes one log line per validation.
+    """
+
+    def __init__(self, logger_name=None, level=logging.INFO):
+        self.logger = logging.getLogger(logger_name or __name__)
+        self.level = level
+
+    def record(self, metric):
+        self.logger.log(
+            self.level,
+            '%s clean() took %.2fms, %s queries (%s duplicate), error=%s',
+            metric.validator, metric.wall_time * 1000, metric.query_count,
+            metric.duplicate_query_count, metric.error_code)
+
+
+class RingBufferSink:
+    """Keeps the last `maxlen` metrics in memory.
+    """
+
+    def __init__(self, maxlen=1000):
+        self.buffer = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def record(self, metric):
+        with self._lock:
+            self.buffer.append(metric)
+
+    def records(self, validator=None):
+        with self._lock:
+            return [metric for metric in self.buffer
+                    if validator is None or metric.validator == validator]
+
+    def summary(self):
+        """Returns per validator totals sorted by total wall time, most
+        expensive first.
+        """
+        totals = {}
+        for metric in self.records():
+            total = totals.setdefault(metric.validator, {
+                'validator': metric.validator, 'count': 0, 'errors': 0,
+                'wall_time': 0.0, 'queries': 0, 'duplicate_queries': 0})
+            total['count'] += 1
+            total['errors'] += 1 if metric.error_code else 0
+            total['wall_time'] += metric.wall_time
+            total['queries'] += metric.query_count
+            total['duplicate_queries'] += metric.duplicate_query_count
+        return sorted(totals.values(), key=lambda t: t['wall_time'], reverse=True)
+
+    def clear(self):
+        with self._lock:
+            self.buffer.clear()
+
+
+class PrometheusTextFileSink:
+    """Aggregates metrics and writes them in the Prometheus text
+    exposition format for the node exporter textfile collector.
+
+    Each process writes its own totals, labelled with its pid, to
+    `path` with the pid inserted before the extension, e.g.
+    validators.prom to validators.1234.prom, and rewrites it at most
+    every `interval` seconds. A process removes its file when it exits,
+    so the collector stops exporting its series; the file of a process
+    that is killed is left until removed.
+    """
+
+    prefix = 'flourish_form_validator'
+
+    def __init__(self, path, interval=15):
+        self.path = path
+        self.interval = interval
+        self.totals = {}
+        self._written = 0
+        self._lock = threading.Lock()
+        atexit.register(self.remove)
+
+    def record(self, metric):
+        with self._lock:
+            total = self.totals.setdefault(metric.validator, Counter())
+            total['validations'] += 1
+            total['errors'] += 1 if metric.error_code else 0
+            total['seconds'] += metric.wall_time
+            total['queries'] += metric.query_count
+            total['duplicate_queries'] += metric.duplicate_query_count
+            if time.monotonic() - self._written >= self.interval:
+                self.write()
+
+    def render(self):
+        lines = []
+        for name, help_text in [
+                ('validations', 'Number of clean() calls.'),
+                ('errors', 'Number of clean() calls that raised.'),
+                ('seconds', 'Total wall time spent in clean().'),
+                ('queries', 'Total database queries run by clean().'),
+                ('duplicate_queries', 'Total repeated identical queries.')]:
+            metric_name = f'{self.prefix}_{name}_total'
+            lines.append(f'# HELP {metric_name} {help_text}')
+            lines.append(f'# TYPE {metric_name} counter')
+            for validator, total in sorted(self.totals.items()):
+                lines.append(
+                    f'{metric_name}{{validator="{validator}",pid="{os.getpid()}"}} '
+                    f'{total[name]}')
+        return '\n'.join(lines) + '\n'
+
+    def process_path(self):
+        root, ext = os.path.splitext(self.path)
+        return f'{root}.{os.getpid()}{ext}'
+
+    def write(self):
+        path = self.process_path()
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w') as f:
+            f.write(self.render())
+        os.replace(tmp_path, path)
+        self._written = time.monotonic()
+
+    def remove(self):
+        """Removes this process's file, if written.
+        """
+        try:
+            os.remove(self.process_path())
+        except FileNotFoundError:
+            pass
+
+
+def instrumented_clean(clean, sink):
+
+    @wraps(clean)
+    def wrapper(self, *args, **kwargs):
+        # nested calls through super().clean() are part of the outer call
+        if getattr(self, '_instrumentation_active', False):
+            return clean(self, *args, **kwargs)
+        self._instrumentation_active = True
+        error_code = None
+        queries = QueryCounter()
+        start = time.perf_counter()
+        try:
+            with queries:
+                return clean(self, *args, **kwargs)
+        except ValidationError as e:
+            error_code = (getattr(e, 'code', None)
+                          or (self._error_codes[-1] if self._error_codes else None)
+                          or 'invalid')
+            raise
+        except Exception as e:
+            error_code = e.__class__.__name__
+            raise
+        finally:
+            self._instrumentation_active = False
+            metric = ValidationMetric(
+                validator=self.__class__.__name__,
+                wall_time=time.perf_counter() - start,
+                query_count=queries.count,
+                duplicate_query_count=queries.duplicate_count,
+                error_code=error_code,
+                timestamp=get_utcnow())
+            try:
+                sink.record(metric)
+            except Exception as e:
+                logger.warning(f'Instrumentation sink failed. Got {e}')
+
+    wrapper._original_clean = clean
+    return wrapper
+
+
+def instrument(validator_cls, sink):
+    """Wraps `clean()` of `validator_cls` to send a ValidationMetric to
+    `sink` for every call.
+    """
+    if not getattr(validator_cls.__dict__.get('clean'), '_original_clean', None):
+        wrapper = instrumented_clean(validator_cls.clean, sink)
+        wrapper._inherited = 'clean' not in validator_cls.__dict__
+        validator_cls.clean = wrapper
+    return validator_cls
+
+
+def uninstrument(validator_cls):
+    wrapper = validator_cls.__dict__.get('clean')
+    if getattr(wrapper, '_original_clean', None):
+        if wrapper._inherited:
+            del validator_cls.clean
+        else:
+            validator_cls.clean = wrapper._original_clean
+    return validator_cls
+
+
+def exported_validators():
+    """Returns the validator classes exported by `form_validators`,
+    importing every validator module.
+    """
+    from edc_form_validators import FormValidator
+    from . import form_validators
+
+    exported = [getattr(form_validators, name) for name in form_validators.__all__]
+    return [obj for obj in exported
+            if isinstance(obj, type) and issubclass(obj, FormValidator)]
+
+
+def instrument_validators(sink, validator_classes=None):
+    for validator_cls in validator_classes or exported_validators():
+        instrument(validator_cls, sink)
@@ -0,0 +1,130 @@
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_datetime
+from edc_base.utils import get_utcnow
+
+from ...audit import audit_targets, iter_audit, write_report
+from ...audit.incremental import AuditState, audit_queryset_since
+from ...audit.shards import merge_reports, run_sharded_audit, shard_paths
+
+
+class Command(BaseCommand):
+
+    help = ('Re-validates every stored instance of the models with a form '
+            'validator and writes the violations to a JSONL report.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'models', nargs='*',
+            help='Model labels to audit, e.g. flourish_caregiver.maternaldelivery. '
+                 'Defaults to all models with a validator.')
+        parser.add_argument(
+            '--output', default='validation_audit.jsonl',
+            help='Path of the JSONL report.')
+        parser.add_argument(
+            '--chunk-size', dest='chunk_size', type=int, default=2000,
+            help='Rows read and validated at a time.')
+        parser.add_argument(
+            '--processes', type=int, default=1,
+            help='Audit in this many processes, each taking the subjects of '
+                 'one shard of the subject identifiers.')
+        parser.add_argument(
+            '--checkpoint-dir', dest='checkpoint_dir',
+            help='Directory for the shard checkpoints and reports. An '
+                 'interrupted run with the same directory and process count '
+                 'resumes where it stopped, they are removed once the run '
+                 'completes. Defaults to <output>.checkpoints '
+                 'when auditing in more than one process.')
+        parser.add_argument(
+            '--restart', action='store_true',
+            help='Discard the checkpoints and audit from the start.')
+        parser.add_argument(
+            '--incremental', action='store_true',
+            help='Only audit the instances modified, or whose subject has an '
+                 'upstream instance modified, since the last incremental audit '
+                 'of their model.')
+        parser.add_argument(
+            '--state', default='validation_audit_state.json',
+            help='Path of the high-water marks of the incremental audit.')
+
+    def handle(self, *args, **options):
+        try:
+            targets = audit_targets(models=options['models'])
+        except LookupError as e:
+            raise CommandError(e)
+
+        if options['processes'] > 1 or options['checkpoint_dir']:
+            self.audit_sharded(targets, **options)
+        else:
+            self.audit(targets, **options)
+
+    def audit(self, targets, **options):
+        state = AuditState(options['state']) if options['incremental'] else None
+        total = total_violations = 0
+        with open(options['output'], 'w') as fp:
+            for target in targets:
+                started = get_utcnow()
+                since = state.since(target.model) if state else None
+                count, violations = write_report(
+                    iter_audit(target, queryset=audit_queryset_since(target, since),
+                               chunk_size=options['chunk_size']), fp)
+                if state:
+                    state.update(target.model, started)
+                total += count
+                total_violations += violations
+                self.stdout.write(
+                    f'{target.model:<60} {target.validator_cls.__name__:<50} '
+                    f'{count:>8} rows {violations:>8} violations')
+        self.stdout.write(self.style.SUCCESS(
+            f'Audited {total} rows, {total_violations} violations written to '
+            f'{options["output"]}.'))
+
+    def audit_sharded(self, targets, **options):
+        shards = options['processes']
+        checkpoint_dir = (options['checkpoint_dir']
+                          or f'{options["output"]}.checkpoints')
+        paths = [shard_paths(checkpoint_dir, shard, shards)
+                 for shard in range(shards)]
+        started_path = os.path.join(checkpoint_dir, f'started-of-{shards}')
+        if options['restart']:
+            self.remove([started_path] + [path for shard in paths for path in shard])
+
+        # The start of the first attempt, kept across resumed attempts.
+        os.makedirs(checkpoint_dir, exist_ok=True)
+        if not os.path.exists(started_path):
+            with open(started_path, 'w') as f:
+                f.write(get_utcnow().isoformat())
+        with open(started_path) as f:
+            started = parse_datetime(f.read())
+
+        state = AuditState(options['state']) if options['incremental'] else None
+        since = ({target.model: state.since(target.model) for target in targets}
+                 if state else None)
+        checkpoints = run_sharded_audit(
+            shards, checkpoint_dir, targets, chunk_size=options['chunk_size'],
+            since=since)
+
+        for target in targets:
+            count = sum(checkpoint.position(target.model)['count']
+                        for checkpoint in checkpoints)
+            violations = sum(checkpoint.position(target.model)['violations']
+                             for checkpoint in checkpoints)
+            self.stdout.write(
+                f'{target.model:<60} {target.validator_cls.__name__:<50} '
+                f'{count:>8} rows {violations:>8} violations')
+        with open(options['output'], 'w') as fp:
+            total_violations = merge_reports(
+                [report_path for _, report_path in paths], fp)
+        if state:
+            for target in targets:
+                state.update(target.model, started)
+        self.remove([started_path] + [path for shard in paths for path in shard])
+        self.stdout.write(self.style.SUCCESS(
+            f'Audited in {shards} shard(s), {total_violations} violations '
+            f'written to {options["output"]}.'))
+
+    def remove(self, paths):
+        for path in paths:
+            if os.path.exists(path):
+                os.remove(path)
@@ -0,0 +1,60 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ...benchmarks.startup import check_budget, load_budget, save_report, startup_report
+
+
+class Command(BaseCommand):
+
+    help = ('Measures the import time of the form validators package and '
+            'of each validator module, and the time to the first validation, '
+            'each in a fresh interpreter.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'validators', nargs='*',
+            help='Validator class names to time the first validation of, '
+                 'requires --database.')
+        parser.add_argument(
+            '--database',
+            help='Alias of the database the first validations query, e.g. a '
+                 'test or copy database. Never the production database.')
+        parser.add_argument(
+            '--repeat', type=int, default=3,
+            help='Fresh interpreters per measurement, the median is reported.')
+        parser.add_argument(
+            '--output', default='startup_benchmark.json',
+            help='Path of the JSON report.')
+        parser.add_argument(
+            '--budget',
+            help='Check the report against the budgets in this JSON file.')
+
+    def handle(self, *args, **options):
+        if options['validators'] and not options['database']:
+            raise CommandError(
+                'Timing the first validation queries the database, '
+                'specify one that is safe to query with --database.')
+        report = startup_report(
+            validators=options['validators'], database=options['database'],
+            repeat=options['repeat'])
+        save_report(report, options['output'])
+
+        self.stdout.write(
+            f'{"package":<90} {report["package"]["cumulative_ms"]:>10}ms')
+        for module, times in sorted(
+                report['modules'].items(),
+                key=lambda item: item[1]['cumulative_ms'], reverse=True):
+            self.stdout.write(f'{module:<90} {times["cumulative_ms"]:>10}ms')
+        for validator, times in report['first_validation'].items():
+            self.stdout.write(
+                f'{validator:<50} setup {times["setup_ms"]:>10}ms '
+                f'import {times["import_ms"]:>10}ms '
+                f'validation {times["validation_ms"]:>10}ms')
+        self.stdout.write(f'Report written to {options["output"]}.')
+
+        if options['budget']:
+            messages = check_budget(report, load_budget(options['budget']))
+            for message in messages:
+                self.stderr.write(message)
+            if messages:
+                raise CommandError(f'{len(messages)} budget(s) exceeded.')
+            self.stdout.write(self.style.SUCCESS('Within budget.'))
@@ -0,0 +1,88 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import get_runner
+
+from ...benchmarks import (BenchmarkFixture, ValidatorBenchmark, compare_to_baseline,
+                           load_baseline, save_baseline, validator_payloads)
+from ...benchmarks.payloads import benchmark_model_labels_applied, missing_payloads
+from ...instrumentation import exported_validators
+
+
+class Command(BaseCommand):
+
+    help = ('Benchmarks every exported form validator against its valid and invalid '
+            'benchmark payloads on a test database.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'validators', nargs='*',
+            help='Validator class names to run. Defaults to all exported validators.')
+        parser.add_argument(
+            '--iterations', type=int, default=50,
+            help='Timed validations per payload.')
+        parser.add_argument(
+            '--warm', action='store_true',
+            help='Keep the shared in-process caches between iterations.')
+        parser.add_argument(
+            '--save-baseline', dest='save_baseline',
+            help='Write the results to this baseline JSON file.')
+        parser.add_argument(
+            '--baseline',
+            help='Compare the results against this baseline JSON file.')
+        parser.add_argument(
+            '--tolerance', type=float, default=0.2,
+            help='Allowed p50 slow down relative to the baseline, e.g. 0.2 for 20%%.')
+
+    def handle(self, *args, **options):
+        if settings.APP_NAME != 'flourish_form_validations':
+            raise CommandError(
+                'Benchmarks use the test models, run them with the '
+                'flourish_form_validations settings.')
+
+        validator_classes = [
+            validator_cls for validator_cls in exported_validators()
+            if not options['validators']
+            or validator_cls.__name__ in options['validators']]
+
+        missing = missing_payloads(validator_classes)
+        if missing:
+            raise CommandError(
+                f'No benchmark payloads for {len(missing)} validator(s): '
+                f'{", ".join(missing)}. Add a valid and an invalid payload to '
+                'benchmarks.payloads.payload_factories, or name the validators to run.')
+
+        runner = get_runner(settings)(verbosity=0, interactive=False)
+        old_config = runner.setup_databases()
+        try:
+            fixture = BenchmarkFixture().create()
+            results = []
+            for validator_cls in validator_classes:
+                with benchmark_model_labels_applied(validator_cls):
+                    for case, cleaned_data in validator_payloads(validator_cls, fixture):
+                        result = ValidatorBenchmark(
+                            validator_cls, cleaned_data, case=case,
+                            iterations=options['iterations'],
+                            cold=not options['warm']).run()
+                        results.append(result)
+                        self.stdout.write(
+                            f'{result.validator:<50} {result.case:<8} '
+                            f'{result.ops_per_sec:>10} ops/s '
+                            f'p50 {result.p50_ms:>9}ms p99 {result.p99_ms:>9}ms '
+                            f'{result.queries:>3} queries '
+                            f'{result.peak_memory_kb:>9}KB {result.outcome}')
+        finally:
+            runner.teardown_databases(old_config)
+
+        if options['save_baseline']:
+            save_baseline(results, options['save_baseline'])
+            self.stdout.write(f'Baseline written to {options["save_baseline"]}.')
+
+        if options['baseline']:
+            regressions = compare_to_baseline(
+                results, load_baseline(options['baseline']),
+                tolerance=options['tolerance'])
+            for regression in regressions:
+                self.stderr.write(regression)
+            if regressions:
+                raise CommandError(f'{len(regressions)} regression(s) found.')
+            self.stdout.write(self.style.SUCCESS('No regressions found.'))
@@ -153,6 +153,8 @@ STATIC_URL = '/static/'
 
 DASHBOARD_URL_NAMES = {}
 
+VALIDATION_RESULT_CACHE_ENABLED = True
+
 if 'test' in sys.argv:
 
     class DisableMigrations:
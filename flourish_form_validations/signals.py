@@ -0,0 +1,97 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .form_validators.consent_version import (consent_version_models,
+                                              invalidate_consent_version)
+from .form_validators.hiv_status import hiv_status_source_models, invalidate_hiv_status
+from .form_validators.offstudy_status import (invalidate_offstudy_status,
+                                              offstudy_status_source_models)
+from .form_validators.result_cache import (bump_dependency_versions, instance_identifiers,
+                                           result_caching_enabled)
+from .form_validators.visit_context import invalidate_visit_context
+
+visit_context_models = ['caregiverchildconsent', 'subjectconsent', 'maternalvisit']
+
+
+def is_visit_context_model(sender):
+    model_name = sender._meta.model_name
+    return 'onschedule' in model_name or model_name in visit_context_models
+
+
+@receiver(post_save, weak=False, dispatch_uid='visit_context_on_post_save')
+@receiver(post_delete, weak=False, dispatch_uid='visit_context_on_post_delete')
+def visit_context_on_change(sender, instance, **kwargs):
+    """Drops cached visit contexts that may hold stale onschedule or
+    consent data for the saved or deleted instance.
+    """
+    if is_visit_context_model(sender):
+        subject_identifier = getattr(instance, 'subject_identifier', None)
+        if sender._meta.model_name == 'maternalvisit':
+            invalidate_visit_context(visit=instance)
+        if subject_identifier:
+            invalidate_visit_context(subject_identifier=subject_identifier)
+
+
+@receiver(post_save, weak=False, dispatch_uid='hiv_status_on_post_save')
+@receiver(post_delete, weak=False, dispatch_uid='hiv_status_on_post_delete')
+def hiv_status_on_change(sender, instance, **kwargs):
+    """Drops the cached HIV status of the subject of a saved or deleted
+    record that the status is derived from, or all cached statuses if
+    the record has no subject identifier, now and again on commit.
+    """
+    if sender._meta.model_name in hiv_status_source_models:
+        subject_identifier = getattr(instance, 'subject_identifier', None)
+        if not subject_identifier:
+            maternal_visit = getattr(instance, 'maternal_visit', None)
+            subject_identifier = getattr(maternal_visit, 'subject_identifier', None)
+        invalidate_hiv_status(subject_identifier=subject_identifier)
+        transaction.on_commit(
+            lambda: invalidate_hiv_status(subject_identifier=subject_identifier))
+
+
+@receiver(post_save, weak=False, dispatch_uid='offstudy_status_on_post_save')
+@receiver(post_delete, weak=False, dispatch_uid='offstudy_status_on_post_delete')
+def offstudy_status_on_change(sender, instance, **kwargs):
+    """Drops the indexed offstudy status of the subject of a saved or
+    deleted offstudy record or action item, now and again on commit so
+    a status read by a concurrent transaction is not kept.
+    """
+    if sender._meta.model_name in offstudy_status_source_models:
+        subject_identifier = getattr(instance, 'subject_identifier', None)
+        if subject_identifier:
+            invalidate_offstudy_status(subject_identifier)
+            transaction.on_commit(
+                lambda: invalidate_offstudy_status(subject_identifier))
+
+
+@receiver(post_save, weak=False, dispatch_uid='consent_version_on_post_save')
+@receiver(post_delete, weak=False, dispatch_uid='consent_version_on_post_delete')
+def consent_version_on_change(sender, instance, **kwargs):
+    """Drops the cached consent version of the screening identifier of a
+    saved or deleted consent version, now and again on commit.
+    """
+    if sender._meta.model_name in consent_version_models:
+        screening_identifier = instance.screening_identifier
+        invalidate_consent_version(sender, screening_identifier)
+        transaction.on_commit(
+            lambda: invalidate_consent_version(sender, screening_identifier))
+
+
+def validation_results_on_change(sender, instance, **kwargs):
+    """Gives the subjects and visits of a saved or deleted record new
+    version stamps, now and again on commit.
+
+    Only connected if VALIDATION_RESULT_CACHE_ENABLED is set.
+    """
+    identifiers = instance_identifiers(instance)
+    if identifiers:
+        bump_dependency_versions(identifiers)
+        transaction.on_commit(lambda: bump_dependency_versions(identifiers))
+
+
+if result_caching_enabled:
+    post_save.connect(validation_results_on_change, weak=False,
+                      dispatch_uid='validation_results_on_post_save')
+    post_delete.connect(validation_results_on_change, weak=False,
+                        dispatch_uid='validation_results_on_post_delete')
@@ -259,12 +259,18 @@ class RegisteredSubject(BaseUuidModel):
         blank=True)
 
 
-class UltraSound(models.Model):
+class UltraSound(BaseUuidModel):
     maternal_visit = models.OneToOneField(MaternalVisit, on_delete=PROTECT)
 
     ga_confirmed = models.IntegerField()
 
 
+class ObstericalHistory(BaseUuidModel):
+    maternal_visit = models.OneToOneField(MaternalVisit, on_delete=PROTECT)
+
+    prev_pregnancies = models.IntegerField(null=True)
+
+
 class MaternalDataset(BaseUuidModel):
     screening_identifier = models.CharField(max_length=36)
 
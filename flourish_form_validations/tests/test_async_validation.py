@@ -0,0 +1,146 @@
+import threading
+
+from asgiref.sync import async_to_sync
+from django.core.exceptions import ValidationError
+from django.test import SimpleTestCase, TestCase, tag
+from edc_base.utils import get_utcnow, relativedelta
+from edc_constants.constants import FEMALE, MALE, YES
+from edc_form_validators import FormValidator
+
+from ..form_validators import SubjectConsentFormValidator
+from ..form_validators.async_validation import AsyncValidationMixin
+from .models import FlourishConsentVersion, ScreeningPregWomen
+from .test_model_mixin import TestModeMixin
+
+
+@tag('async')
+class TestAsyncValidation(TestModeMixin, TestCase):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(SubjectConsentFormValidator, *args, **kwargs)
+
+    def setUp(self):
+        SubjectConsentFormValidator.prior_screening_model = \
+            'flourish_form_validations.screeningpriorbhpparticipants'
+        SubjectConsentFormValidator.preg_women_screening_model = \
+            'flourish_form_validations.screeningpregwomen'
+        SubjectConsentFormValidator.async_thread_sensitive = True
+
+        FlourishConsentVersion.objects.create(
+            screening_identifier='ABC12345')
+        ScreeningPregWomen.objects.create(
+            screening_identifier='ABC12345',
+            mother_alive=YES)
+
+        self.consent_options = {
+            'screening_identifier': 'ABC12345',
+            'consent_datetime': get_utcnow(),
+            'version': 1,
+            'gender': FEMALE,
+            'dob': (get_utcnow() - relativedelta(years=25)).date(),
+            'first_name': 'TEST ONE',
+            'last_name': 'TEST',
+            'initials': 'TOT',
+            'identity': '123425678',
+            'confirm_identity': '123425678',
+            'citizen': YES}
+
+    def tearDown(self):
+        SubjectConsentFormValidator.async_thread_sensitive = False
+
+    def test_avalidate_prefetches(self):
+        form_validator = SubjectConsentFormValidator(
+            cleaned_data=self.consent_options)
+        async_to_sync(form_validator.avalidate)()
+        self.assertEqual(
+            form_validator.prefetched['preg_women_screening'].screening_identifier,
+            'ABC12345')
+        self.assertIsNone(form_validator.prefetched['bhp_prior_screening'])
+
+    def test_avalidate_same_errors(self):
+        self.consent_options.update(gender=MALE)
+        form_validator = SubjectConsentFormValidator(
+            cleaned_data=self.consent_options)
+        self.assertRaises(
+            ValidationError, async_to_sync(form_validator.avalidate))
+        self.assertIn('gender', form_validator._errors)
+
+
+class ParallelLookupsFormValidator(AsyncValidationMixin, FormValidator):
+
+    def get_async_lookups(self):
+        return [[self.prefetch('first', self.get_thread_name),
+                 self.prefetch('second', self.get_thread_name)],
+                [self.prefetch('after', self.get_first),
+                 self.prefetch('failing', self.get_failing)]]
+
+    def get_thread_name(self):
+        return threading.current_thread().name
+
+    def get_first(self):
+        return self.prefetched['first']
+
+    def get_failing(self):
+        raise ValueError
+
+
+@tag('async')
+class TestParallelLookups(SimpleTestCase):
+
+    def test_prefetch_parallel_on_pool(self):
+        form_validator = ParallelLookupsFormValidator(cleaned_data={})
+        form_validator.prefetch_parallel()
+        self.assertTrue(
+            form_validator.prefetched['first'].startswith('validation-lookup'))
+        self.assertEqual(form_validator.prefetched['after'],
+                         form_validator.prefetched['first'])
+        self.assertNotIn('failing', form_validator.prefetched)
+
+    def test_prefetch_parallel_thread_sensitive(self):
+        form_validator = ParallelLookupsFormValidator(cleaned_data={})
+        form_validator.async_thread_sensitive = True
+        form_validator.prefetch_parallel()
+        self.assertEqual(form_validator.prefetched['first'],
+                         threading.current_thread().name)
+
+    def test_aprefetch_in_threads(self):
+        form_validator = ParallelLookupsFormValidator(cleaned_data={})
+        async_to_sync(form_validator.aprefetch)()
+        self.assertNotEqual(form_validator.prefetched['first'],
+                            threading.current_thread().name)
+        self.assertEqual(form_validator.prefetched['after'],
+                         form_validator.prefetched['first'])
+        self.assertNotIn('failing', form_validator.prefetched)
+
+    def test_validate_parallel_lookups(self):
+        form_validator = ParallelLookupsFormValidator(cleaned_data={})
+        form_validator.parallel_lookups = True
+        form_validator.validate()
+        self.assertIn('second', form_validator.prefetched)
+
+    def test_validate_keeps_prefetched(self):
+        form_validator = ParallelLookupsFormValidator(cleaned_data={})
+        form_validator.parallel_lookups = True
+        form_validator.prefetched = {'first': 'batch'}
+        form_validator.validate()
+        self.assertEqual(form_validator.prefetched, {'first': 'batch'})
+
+    def test_validate_again_drops_prefetched(self):
+        form_validator = ParallelLookupsFormValidator(cleaned_data={})
+        form_validator.prefetched = {'first': 'batch'}
+        form_validator.validate()
+        form_validator.validate()
+        self.assertIsNone(form_validator.prefetched)
+        form_validator.parallel_lookups = True
+        form_validator.validate()
+        self.assertNotEqual(form_validator.prefetched['first'], 'batch')
+
+
+@tag('async')
+class TestParallelLookupsInTransaction(TestCase):
+
+    def test_prefetch_parallel_in_atomic_block(self):
+        form_validator = ParallelLookupsFormValidator(cleaned_data={})
+        form_validator.prefetch_parallel()
+        self.assertEqual(form_validator.prefetched['first'],
+                         threading.current_thread().name)
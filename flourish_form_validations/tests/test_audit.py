@@ -0,0 +1,204 @@
+import io
+import json
+import os
+import shutil
+import tempfile
+
+from django.core.exceptions import ValidationError
+from django.test import TestCase, tag
+from edc_base.utils import get_utcnow
+from edc_constants.constants import YES
+from edc_form_validators import FormValidator
+
+from ..audit import (AuditState, AuditTarget, audit_queryset_since,
+                     cleaned_data_from_instance, iter_audit, upstream_models,
+                     write_report)
+from ..audit.shards import (ShardCheckpoint, audit_shard, merge_reports, shard_for,
+                            shard_paths, shard_queryset)
+from ..form_validators import ObstericalHistoryFormValidator
+from .models import AntenatalEnrollment, CaregiverLocator, FlourishConsentVersion
+from .models import Appointment, MaternalVisit, ObstericalHistory, UltraSound
+
+
+class ConsentVersionFormValidator(FormValidator):
+
+    def clean(self):
+        if self.cleaned_data.get('version') not in ['1', '2']:
+            message = {'version': 'Invalid consent version.'}
+            self._errors.update(message)
+            raise ValidationError(message)
+
+
+@tag('audit')
+class TestAudit(TestCase):
+
+    def setUp(self):
+        self.target = AuditTarget(
+            model='flourish_form_validations.flourishconsentversion',
+            validator_cls=ConsentVersionFormValidator)
+        for screening_identifier, version in [('S1', '1'), ('S2', '4'), ('S3', '2')]:
+            FlourishConsentVersion.objects.create(
+                screening_identifier=screening_identifier, version=version)
+
+    def test_cleaned_data_from_instance(self):
+        obj = FlourishConsentVersion.objects.get(screening_identifier='S1')
+        cleaned_data = cleaned_data_from_instance(obj)
+        self.assertEqual(cleaned_data['screening_identifier'], 'S1')
+        self.assertEqual(cleaned_data['version'], '1')
+        self.assertNotIn('id', cleaned_data)
+
+    def test_iter_audit(self):
+        results = list(iter_audit(self.target, chunk_size=2))
+        self.assertEqual(len(results), 3)
+        self.assertEqual([result.is_valid for result in results],
+                         [True, False, True])
+        self.assertEqual(results[1].errors,
+                         {'version': 'Invalid consent version.'})
+
+    def test_write_report(self):
+        fp = io.StringIO()
+        count, violations = write_report(iter_audit(self.target, chunk_size=2), fp)
+        self.assertEqual((count, violations), (3, 1))
+        lines = fp.getvalue().splitlines()
+        self.assertEqual(len(lines), 1)
+        report = json.loads(lines[0])
+        self.assertEqual(report['validator'], 'ConsentVersionFormValidator')
+        self.assertEqual(report['errors'], {'version': 'Invalid consent version.'})
+
+
+@tag('audit')
+class TestShardedAudit(TestCase):
+
+    def setUp(self):
+        self.checkpoint_dir = tempfile.mkdtemp()
+        self.targets = [AuditTarget(
+            model='flourish_form_validations.flourishconsentversion',
+            validator_cls=ConsentVersionFormValidator)]
+        for index in range(10):
+            FlourishConsentVersion.objects.create(
+                screening_identifier=f'S{index}', version='4' if index % 2 else '1')
+
+    def tearDown(self):
+        shutil.rmtree(self.checkpoint_dir)
+
+    def test_shard_for(self):
+        self.assertEqual(shard_for('B142-040990462-1', 4),
+                         shard_for('B142-040990462-1', 4))
+        self.assertIn(shard_for(None, 4), range(4))
+
+    def test_shard_queryset_matches_shard_for(self):
+        for index in range(20):
+            CaregiverLocator.objects.create(
+                subject_identifier=f'B{index}', screening_identifier=f'S{index}',
+                may_call=YES, may_visit_home=YES)
+        for shard in range(3):
+            self.assertEqual(
+                sorted(shard_queryset(CaregiverLocator.objects.all(), shard, 3).values_list(
+                    'subject_identifier', flat=True)),
+                sorted(f'B{index}' for index in range(20)
+                       if shard_for(f'B{index}', 3) == shard))
+
+    def test_shards_cover_all_rows(self):
+        checkpoints = [
+            audit_shard(shard, shards=3, targets=self.targets,
+                        checkpoint_dir=self.checkpoint_dir, chunk_size=3)
+            for shard in range(3)]
+        position = checkpoints[0].position(self.targets[0].model)
+        self.assertTrue(position['done'])
+        self.assertEqual(
+            sum(checkpoint.position(self.targets[0].model)['count']
+                for checkpoint in checkpoints), 10)
+        fp = io.StringIO()
+        paths = [shard_paths(self.checkpoint_dir, shard, 3)[1] for shard in range(3)]
+        self.assertEqual(merge_reports(paths, fp), 5)
+
+    def test_resumes_from_checkpoint(self):
+        model = self.targets[0].model
+        checkpoint_path, report_path = shard_paths(self.checkpoint_dir, 0, 1)
+        first = FlourishConsentVersion.objects.order_by('pk')[3]
+        ShardCheckpoint(checkpoint_path).update(
+            model, last_pk=first.pk, count=4, violations=2)
+        checkpoint = audit_shard(
+            0, targets=self.targets, checkpoint_dir=self.checkpoint_dir,
+            chunk_size=3)
+        self.assertEqual(checkpoint.position(model)['count'], 10)
+        with open(report_path) as f:
+            self.assertEqual(len(f.readlines()), 3)
+        checkpoint = audit_shard(
+            0, targets=self.targets, checkpoint_dir=self.checkpoint_dir)
+        self.assertEqual(checkpoint.position(model)['count'], 10)
+
+
+class LocatorFormValidator(FormValidator):
+    pass
+
+
+@tag('audit')
+class TestIncrementalAudit(TestCase):
+
+    def setUp(self):
+        self.target = AuditTarget(
+            model='flourish_form_validations.caregiverlocator',
+            validator_cls=LocatorFormValidator)
+        self.dependencies = {
+            'flourish_form_validations.antenatalenrollment': ['LocatorFormValidator']}
+        self.locators = [
+            CaregiverLocator.objects.create(
+                subject_identifier=subject_identifier,
+                screening_identifier=f'S{subject_identifier}',
+                may_call=YES, may_visit_home=YES)
+            for subject_identifier in ['B1', 'B2', 'B3']]
+
+    def audited(self, since):
+        queryset = audit_queryset_since(
+            self.target, since, dependencies=self.dependencies)
+        return sorted(queryset.values_list('subject_identifier', flat=True))
+
+    def test_upstream_models(self):
+        self.assertEqual(
+            upstream_models(self.target, dependencies=self.dependencies),
+            ['flourish_form_validations.antenatalenrollment'])
+        self.assertEqual(upstream_models(self.target, dependencies={}), [])
+
+    def test_all_instances_without_mark(self):
+        self.assertEqual(self.audited(None), ['B1', 'B2', 'B3'])
+
+    def test_changed_instances_since_mark(self):
+        since = get_utcnow()
+        self.assertEqual(self.audited(since), [])
+        self.locators[0].save()
+        AntenatalEnrollment.objects.create(subject_identifier='B2')
+        self.assertEqual(self.audited(since), ['B1', 'B2'])
+
+    def test_changed_ultrasound_audits_obsterical_history(self):
+        target = AuditTarget(
+            model='flourish_form_validations.obstericalhistory',
+            validator_cls=ObstericalHistoryFormValidator)
+        self.assertIn('flourish_caregiver.ultrasound', upstream_models(target))
+        dependencies = {
+            'flourish_form_validations.ultrasound': ['ObstericalHistoryFormValidator']}
+        visits = []
+        for subject_identifier in ['B1', 'B2']:
+            appointment = Appointment.objects.create(
+                subject_identifier=subject_identifier,
+                appt_datetime=get_utcnow(),
+                visit_code='1000')
+            visit = MaternalVisit.objects.create(
+                appointment=appointment, subject_identifier=subject_identifier)
+            ObstericalHistory.objects.create(maternal_visit=visit)
+            visits.append(visit)
+        since = get_utcnow()
+        UltraSound.objects.create(maternal_visit=visits[1], ga_confirmed=20)
+        queryset = audit_queryset_since(target, since, dependencies=dependencies)
+        self.assertEqual(
+            list(queryset.values_list('maternal_visit__subject_identifier', flat=True)),
+            ['B2'])
+
+    def test_state(self):
+        path = os.path.join(tempfile.mkdtemp(), 'state.json')
+        state = AuditState(path)
+        self.assertIsNone(state.since(self.target.model))
+        mark = get_utcnow()
+        state.update(self.target.model, mark)
+        self.assertEqual(AuditState(path).since(self.target.model), mark)
+        shutil.rmtree(os.path.dirname(path))
@@ -0,0 +1,78 @@
+from django.core.exceptions import ValidationError
+from django.test import TestCase, tag
+from edc_base.utils import get_utcnow, relativedelta
+from edc_constants.constants import FEMALE, MALE, YES
+
+from ..form_validators import SubjectConsentFormValidator, validate_many
+from ..form_validators.batch import prefetch_lookups
+from .models import FlourishConsentVersion, ScreeningPregWomen
+from .test_model_mixin import TestModeMixin
+
+
+@tag('batch')
+class TestValidateMany(TestModeMixin, TestCase):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(SubjectConsentFormValidator, *args, **kwargs)
+
+    def setUp(self):
+        SubjectConsentFormValidator.prior_screening_model = \
+            'flourish_form_validations.screeningpriorbhpparticipants'
+        SubjectConsentFormValidator.preg_women_screening_model = \
+            'flourish_form_validations.screeningpregwomen'
+
+        self.records = []
+        for index in range(3):
+            screening_identifier = f'ABC1234{index}'
+            FlourishConsentVersion.objects.create(
+                screening_identifier=screening_identifier)
+            ScreeningPregWomen.objects.create(
+                screening_identifier=screening_identifier,
+                mother_alive=YES)
+            self.records.append({
+                'screening_identifier': screening_identifier,
+                'consent_datetime': get_utcnow(),
+                'version': 1,
+                'gender': FEMALE,
+                'dob': (get_utcnow() - relativedelta(years=25)).date(),
+                'first_name': 'TEST ONE',
+                'last_name': 'TEST',
+                'initials': 'TOT',
+                'identity': '123425678',
+                'confirm_identity': '123425678',
+                'citizen': YES})
+
+    def test_prefetch_lookups(self):
+        prefetched = prefetch_lookups(SubjectConsentFormValidator, self.records)
+        self.assertEqual(len(prefetched), 3)
+        self.assertEqual(
+            prefetched[1]['preg_women_screening'].screening_identifier, 'ABC12341')
+        self.assertIsNone(prefetched[1]['bhp_prior_screening'])
+
+    def test_validate_many(self):
+        self.records[1].update(gender=MALE)
+        results = validate_many(
+            SubjectConsentFormValidator, self.records, batch_size=2)
+        self.assertEqual([result.index for result in results], [0, 1, 2])
+        self.assertIsNone(results[0].errors)
+        self.assertIn('gender', results[1].errors)
+        self.assertIsNone(results[2].errors)
+
+    def test_validate_many_error_not_in_errors(self):
+        self.records[1].update(dob=None)
+        results = validate_many(SubjectConsentFormValidator, self.records)
+        self.assertIsNone(results[0].errors)
+        self.assertEqual(results[1].errors,
+                         {'dob': ['Please specify the date of birth']})
+
+    def test_validate_many_same_as_validate(self):
+        self.records[2].update(first_name='Test one')
+        results = validate_many(SubjectConsentFormValidator, self.records)
+        for cleaned_data, result in zip(self.records, results):
+            form_validator = SubjectConsentFormValidator(cleaned_data=cleaned_data)
+            try:
+                form_validator.validate()
+            except ValidationError:
+                pass
+            self.assertEqual(
+                bool(result.errors), bool(form_validator._errors))
@@ -0,0 +1,109 @@
+from django.test import TestCase, tag
+from edc_constants.constants import NO, YES
+
+from ..benchmarks import ValidatorBenchmark, compare_to_baseline
+from ..benchmarks.harness import percentile, results_as_dict
+from ..benchmarks.payloads import (BenchmarkFixture, benchmark_model_labels_applied,
+                                   missing_payloads, validator_payloads)
+from ..benchmarks.startup import (check_budget, package_name, parse_importtime,
+                                  startup_report)
+from ..form_validators import CaregiverLocatorFormValidator, ObstericalHistoryFormValidator
+
+
+@tag('benchmarks')
+class TestBenchmarks(TestCase):
+
+    def setUp(self):
+        self.cleaned_data = {
+            'may_visit_home': NO,
+            'may_call': YES,
+            'subject_cell': '71234567',
+            'may_call_work': NO,
+            'may_contact_indirectly': NO,
+            'has_caretaker': NO}
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile([], 50), 0)
+
+    def test_benchmark_valid_payload(self):
+        result = ValidatorBenchmark(
+            CaregiverLocatorFormValidator, self.cleaned_data, case='valid',
+            iterations=5, warmup=1).run()
+        self.assertEqual(result.outcome, 'valid')
+        self.assertEqual(result.iterations, 5)
+        self.assertEqual(result.queries, 0)
+        self.assertGreater(result.ops_per_sec, 0)
+
+    def test_benchmark_invalid_payload(self):
+        self.cleaned_data.update(subject_cell=None)
+        result = ValidatorBenchmark(
+            CaregiverLocatorFormValidator, self.cleaned_data, case='invalid',
+            iterations=5, warmup=1).run()
+        self.assertTrue(result.outcome.startswith('invalid'))
+
+    def test_validator_payloads(self):
+        self.assertEqual(
+            [case for case, _ in validator_payloads(CaregiverLocatorFormValidator, BenchmarkFixture())],
+            ['valid', 'invalid'])
+        self.assertEqual(
+            missing_payloads([CaregiverLocatorFormValidator, ObstericalHistoryFormValidator]),
+            ['ObstericalHistoryFormValidator'])
+
+    def test_model_labels_restored(self):
+        label = ObstericalHistoryFormValidator.ultrasound_model
+        with benchmark_model_labels_applied(ObstericalHistoryFormValidator):
+            self.assertEqual(ObstericalHistoryFormValidator.ultrasound_model,
+                             'flourish_form_validations.ultrasound')
+        self.assertEqual(ObstericalHistoryFormValidator.ultrasound_model, label)
+
+    def test_compare_to_baseline(self):
+        result = ValidatorBenchmark(
+            CaregiverLocatorFormValidator, self.cleaned_data, case='valid',
+            iterations=5, warmup=1).run()
+        baseline = results_as_dict([result])
+        self.assertEqual(compare_to_baseline([result], baseline), [])
+
+        baseline['CaregiverLocatorFormValidator']['valid'].update(
+            p50_ms=result.p50_ms / 10, queries=-1, outcome='invalid:required')
+        self.assertEqual(len(compare_to_baseline([result], baseline)), 3)
+
+
+@tag('benchmarks')
+class TestStartupBenchmark(TestCase):
+
+    def setUp(self):
+        self.report = {
+            'package': {'self_ms': 1.0, 'cumulative_ms': 20.0},
+            'modules': {
+                f'{package_name}.batch': {'self_ms': 0.5, 'cumulative_ms': 2.0},
+                f'{package_name}.rules': {'self_ms': 0.5, 'cumulative_ms': 40.0}},
+            'first_validation': {
+                'CaregiverLocatorFormValidator': {
+                    'setup_ms': 900.0, 'import_ms': 50.0,
+                    'validation_ms': 5.0, 'total_ms': 955.0}}}
+
+    def test_parse_importtime(self):
+        output = (
+            'import time: self [us] | cumulative | imported package\n'
+            'import time:       120 |        120 |   json.decoder\n'
+            'import time:       300 |        420 | json\n')
+        self.assertEqual(parse_importtime(output),
+                         {'json.decoder': (120, 120), 'json': (300, 420)})
+
+    def test_check_budget(self):
+        self.assertEqual(check_budget(self.report, {}), [])
+        self.assertEqual(
+            check_budget(self.report, {'package_ms': 50, 'module_ms': 50,
+                                       'first_validation_ms': 1000}), [])
+        messages = check_budget(self.report, {
+            'package_ms': 10, 'module_ms': 30,
+            'modules': {f'{package_name}.batch': 1},
+            'first_validation_ms': 500})
+        self.assertEqual(len(messages), 4)
+
+    def test_first_validation_requires_database(self):
+        with self.assertRaises(ValueError):
+            startup_report(validators=['SubjectConsentFormValidator'])
@@ -0,0 +1,82 @@
+from django.core.exceptions import ValidationError
+from django.test import TestCase, tag
+from edc_base.utils import get_utcnow, relativedelta
+from edc_constants.constants import NO, YES
+
+from ..form_validators import CaregiverLocatorFormValidator, SubjectConsentFormValidator
+from .models import FlourishConsentVersion
+from .test_model_mixin import TestModeMixin
+
+
+@tag('collect_errors')
+class TestCollectErrors(TestModeMixin, TestCase):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(SubjectConsentFormValidator, *args, **kwargs)
+
+    def setUp(self):
+        SubjectConsentFormValidator.prior_screening_model = \
+            'flourish_form_validations.screeningpriorbhpparticipants'
+        SubjectConsentFormValidator.preg_women_screening_model = \
+            'flourish_form_validations.screeningpregwomen'
+
+        FlourishConsentVersion.objects.create(
+            screening_identifier='ABC12345')
+
+        self.consent_options = {
+            'screening_identifier': 'ABC12345',
+            'consent_datetime': get_utcnow(),
+            'version': 1,
+            'dob': (get_utcnow() - relativedelta(years=25)).date(),
+            'first_name': 'TEST ONE',
+            'last_name': 'TEST',
+            'initials': 'TOT',
+            'identity': '123425678',
+            'confirm_identity': '123425678',
+            'citizen': YES}
+
+        self.locator_options = {
+            'may_visit_home': YES,
+            'physical_address': None,
+            'may_call': YES,
+            'subject_cell': None,
+            'may_call_work': NO,
+            'may_contact_indirectly': NO,
+            'has_caretaker': YES,
+            'caretaker_name': None}
+
+    def test_raise_on_first_error_by_default(self):
+        form_validator = CaregiverLocatorFormValidator(
+            cleaned_data=self.locator_options)
+        self.assertRaises(ValidationError, form_validator.validate)
+        self.assertIn('physical_address', form_validator._errors)
+        self.assertNotIn('caretaker_name', form_validator._errors)
+
+    def test_collect_all_errors(self):
+        form_validator = CaregiverLocatorFormValidator(
+            cleaned_data=self.locator_options)
+        form_validator.collect_errors = True
+        self.assertRaises(ValidationError, form_validator.validate)
+        for field in ['physical_address', 'may_call', 'caretaker_name']:
+            self.assertIn(field, form_validator._errors)
+
+    def test_collect_skips_dependent_rules(self):
+        self.consent_options.update(
+            first_name='Test one', initials='XX', identity='12342567A',
+            confirm_identity='12342567A')
+        form_validator = SubjectConsentFormValidator(
+            cleaned_data=self.consent_options)
+        form_validator.collect_errors = True
+        self.assertRaises(ValidationError, form_validator.validate)
+        self.assertIn('first_name', form_validator._errors)
+        self.assertIn('identity', form_validator._errors)
+        self.assertNotIn('initials', form_validator._errors)
+
+    def test_collect_valid(self):
+        form_validator = SubjectConsentFormValidator(
+            cleaned_data=self.consent_options)
+        form_validator.collect_errors = True
+        try:
+            form_validator.validate()
+        except ValidationError as e:
+            self.fail(f'ValidationError unexpectedly raised. Got{e}')
@@ -246,6 +246,17 @@ class TestRelationshipFatherInvolvement(TestModeMixin, TestCase):
         self.assertRaises(ValidationError, form_validator.validate)
         self.assertIn('father_child_contact', form_validator._errors)
 
+    def test_delivered_looked_up_again(self):
+        MaternalDelivery.objects.create(subject_identifier=self.subject_consent.subject_identifier)
+        self.clean_data['father_child_contact'] = NOT_APPLICABLE
+
+        form_validator = RelationshipFatherInvolvementFormValidator(cleaned_data=self.clean_data)
+        # as left by a validation before the delivery was saved
+        form_validator._delivered = False
+
+        self.assertRaises(ValidationError, form_validator.validate)
+        self.assertIn('father_child_contact', form_validator._errors)
+
     def test_fathers_financial_support_required(self):
         MaternalDelivery.objects.create(subject_identifier=self.subject_consent.subject_identifier)
         self.clean_data.update({
@@ -430,3 +441,15 @@ class TestRelationshipFatherInvolvement(TestModeMixin, TestCase):
 
         self.assertRaises(ValidationError, form_validator.validate)
         self.assertIn('discussion_with_partner', form_validator._errors)
+
+    def test_rules_run_in_memory_after_prefetch(self):
+        form_validator = RelationshipFatherInvolvementFormValidator(
+            cleaned_data=self.clean_data)
+        form_validator.prefetch()
+        self.assertEqual(
+            form_validator.m2m_selections('read_books'), frozenset(['mother']))
+        with self.assertNumQueries(0):
+            self.assertTrue(form_validator.delivered is not None)
+            for field in form_validator.m2m_fields:
+                form_validator.m2m_applicable_if_true(True, m2m_field=field)
+                form_validator.m2m_single_selection_if('read_na', m2m_field=field)
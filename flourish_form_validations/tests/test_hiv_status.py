@@ -0,0 +1,84 @@
+from dateutil.relativedelta import relativedelta
+from django.core.cache import caches
+from django.test import TestCase, tag
+from edc_base.utils import get_utcnow
+from edc_constants.constants import NEG, POS
+
+from ..form_validators.hiv_status import (MaternalStatus, get_hiv_status,
+                                          hiv_status_cache_alias, hiv_status_key,
+                                          hiv_statuses, invalidate_hiv_status)
+from .models import MaternalVisit, SubjectConsent
+from .test_model_mixin import clear_validation_caches
+
+
+@tag('hiv_status')
+class TestHivStatusCache(TestCase):
+
+    def setUp(self):
+        clear_validation_caches()
+        self.shared_cache = caches[hiv_status_cache_alias]
+        self.subject_identifier = '12345678'
+
+    def tearDown(self):
+        clear_validation_caches()
+
+    def test_cached_status_served(self):
+        hiv_statuses.set((self.subject_identifier, None), POS)
+        self.assertEqual(
+            get_hiv_status(subject_identifier=self.subject_identifier), POS)
+        self.assertEqual(
+            MaternalStatus(subject_identifier=self.subject_identifier).hiv_status, POS)
+
+    def test_invalidate(self):
+        hiv_statuses.set((self.subject_identifier, None), POS)
+        hiv_statuses.set(('87654321', None), NEG)
+        invalidate_hiv_status(subject_identifier=self.subject_identifier)
+        self.assertNotIn((self.subject_identifier, None), hiv_statuses)
+        self.assertIn(('87654321', None), hiv_statuses)
+
+    def test_visit_status_cached_by_visit(self):
+        # a status derived from one visit is not served for another
+        visit = MaternalVisit(pk=1, subject_identifier=self.subject_identifier)
+        hiv_statuses.set((self.subject_identifier, None), NEG)
+        hiv_statuses.set((self.subject_identifier, 2), NEG)
+        hiv_statuses.set((self.subject_identifier, visit.pk), POS)
+        self.assertEqual(MaternalStatus(visit).hiv_status, POS)
+        self.assertEqual(
+            get_hiv_status(subject_identifier=self.subject_identifier), NEG)
+
+    def test_invalidate_visit_statuses(self):
+        hiv_statuses.set((self.subject_identifier, 1), POS)
+        self.shared_cache.set(
+            hiv_status_key(self.subject_identifier, visit_id=1), POS)
+        invalidate_hiv_status(subject_identifier=self.subject_identifier)
+        self.assertNotIn((self.subject_identifier, 1), hiv_statuses)
+        self.assertIsNone(self.shared_cache.get(
+            hiv_status_key(self.subject_identifier, visit_id=1)))
+
+    def test_shared_cache_read_through(self):
+        # a status cached by another process is served once this
+        # process's index no longer holds it
+        self.shared_cache.set(hiv_status_key(self.subject_identifier), POS)
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                get_hiv_status(subject_identifier=self.subject_identifier), POS)
+        self.assertEqual(hiv_statuses.get((self.subject_identifier, None)), POS)
+
+    def test_invalidate_shared_cache(self):
+        self.shared_cache.set(hiv_status_key(self.subject_identifier), POS)
+        self.shared_cache.set(hiv_status_key('87654321'), NEG)
+        invalidate_hiv_status(subject_identifier=self.subject_identifier)
+        self.assertIsNone(
+            self.shared_cache.get(hiv_status_key(self.subject_identifier)))
+        self.assertEqual(self.shared_cache.get(hiv_status_key('87654321')), NEG)
+        invalidate_hiv_status()
+        self.assertIsNone(self.shared_cache.get(hiv_status_key('87654321')))
+
+    def test_invalidated_on_source_model_save(self):
+        hiv_statuses.set((self.subject_identifier, None), NEG)
+        SubjectConsent.objects.create(
+            subject_identifier=self.subject_identifier,
+            screening_identifier='ABC12345',
+            gender='F', dob=(get_utcnow() - relativedelta(years=25)).date(),
+            consent_datetime=get_utcnow(), version='1')
+        self.assertNotIn((self.subject_identifier, None), hiv_statuses)
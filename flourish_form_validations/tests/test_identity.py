@@ -0,0 +1,51 @@
+from django.test import TestCase, tag
+from edc_constants.constants import FEMALE, MALE
+
+from ..form_validators import check_identities, check_names, screen_records
+
+
+@tag('identity')
+class TestIdentity(TestCase):
+
+    def test_check_names(self):
+        errors = check_names([
+            ('JANE', 'DOE'), ('JANE ANN', 'DOE-SMITH'), (None, None),
+            ('Jane', 'DOE'), ('JANE ANN BETH', 'DOE SMITH')])
+        self.assertEqual(errors[:3], [{}, {}, {}])
+        self.assertEqual(list(errors[3]), ['first_name'])
+        self.assertEqual(list(errors[4]), ['first_name', 'last_name'])
+
+    def test_check_identities(self):
+        errors = check_identities([
+            ('123425678', 'country_id', FEMALE),
+            ('123415678', 'country_id', MALE),
+            ('12342567A', 'country_id', FEMALE),
+            ('12345', 'country_id', FEMALE),
+            ('123415678', 'country_id', FEMALE),
+            ('12345', 'passport', FEMALE),
+            (None, None, None)])
+        self.assertEqual(errors[:2], [None, None])
+        self.assertEqual(errors[2], 'Identity number must be digits.')
+        self.assertIn('9 values', errors[3])
+        self.assertIn('Female', errors[4])
+        self.assertEqual(errors[5:], [None, None])
+
+    def test_check_identities_types(self):
+        errors = check_identities(
+            [('12345', 'birth_cert', FEMALE)],
+            identity_types=['country_id', 'birth_cert'])
+        self.assertIn('9 values', errors[0])
+
+    def test_screen_records(self):
+        records = [
+            {'first_name': 'JANE', 'last_name': 'DOE',
+             'identity': '123425678', 'identity_type': 'country_id',
+             'gender': FEMALE},
+            {'first_name': 'Jane', 'last_name': 'DOE',
+             'identity': '12345', 'identity_type': 'country_id'},
+        ]
+        screened = screen_records(records)
+        self.assertEqual(len(screened), 1)
+        index, errors = screened[0]
+        self.assertEqual(index, 1)
+        self.assertEqual(sorted(errors), ['first_name', 'identity'])
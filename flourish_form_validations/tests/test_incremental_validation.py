@@ -0,0 +1,75 @@
+from dateutil.relativedelta import relativedelta
+from django.core.exceptions import ValidationError
+from django.test import TestCase, tag
+from edc_base.utils import get_utcnow
+from edc_constants.constants import NEG, NO, OTHER, YES
+
+from ..form_validators.covid19_form_validation import Covid19FormValidator
+from .models import (Appointment, FlourishConsentVersion, ListModel, MaternalVisit,
+                     SubjectConsent)
+
+
+@tag('incremental')
+class TestIncrementalValidation(TestCase):
+
+    def setUp(self):
+        FlourishConsentVersion.objects.create(
+            screening_identifier='ABC12345')
+
+        subject_consent = SubjectConsent.objects.create(
+            subject_identifier='11111111', screening_identifier='ABC12345',
+            gender='M', dob=(get_utcnow() - relativedelta(years=25)).date(),
+            consent_datetime=get_utcnow(), version='1')
+
+        appointment = Appointment.objects.create(
+            subject_identifier=subject_consent.subject_identifier,
+            appt_datetime=get_utcnow(),
+            visit_code='2000M')
+
+        self.form_data = {
+            'test_for_covid': YES,
+            'date_of_test': '2021-01-01',
+            'is_test_estimated': YES,
+            'reason_for_testing': OTHER,
+            'result_of_test': NEG,
+            'has_tested_positive': YES,
+            'date_of_test_member': None,
+            'close_contact': ListModel.objects.all(),
+            'symptoms_for_past_14days': ListModel.objects.all(),
+            'maternal_visit': MaternalVisit.objects.create(
+                appointment=appointment,
+                subject_identifier=subject_consent.subject_identifier,
+                report_datetime=get_utcnow())}
+
+    def test_collects_errors_of_all_rules(self):
+        result = Covid19FormValidator(cleaned_data=self.form_data).revalidate()
+        self.assertIn('other_reason_for_testing', result.errors)
+        self.assertIn('date_of_test_member', result.errors)
+
+    def test_dependency_graph(self):
+        result = Covid19FormValidator(cleaned_data=self.form_data).revalidate()
+        graph = result.dependency_graph()
+        self.assertIn('validate_member_test', graph['date_of_test_member'])
+        self.assertIn('validate_covid_test', graph['reason_for_testing'])
+        self.assertEqual(result.affected_rules(['date_of_test_member']),
+                         {'validate_member_test'})
+
+    def test_revalidate_changed_field(self):
+        previous = Covid19FormValidator(cleaned_data=self.form_data).revalidate()
+        self.form_data.update(date_of_test_member=get_utcnow().date())
+        result = Covid19FormValidator(cleaned_data=self.form_data).revalidate(
+            previous=previous, changed_fields=['date_of_test_member'])
+        self.assertNotIn('date_of_test_member', result.errors)
+        self.assertIn('other_reason_for_testing', result.errors)
+
+    def test_revalidate_valid(self):
+        self.form_data.update(
+            reason_for_testing='routine_testing', has_tested_positive=NO)
+        result = Covid19FormValidator(cleaned_data=self.form_data).revalidate()
+        self.assertTrue(result.is_valid)
+
+    def test_validate_after_revalidate(self):
+        form_validator = Covid19FormValidator(cleaned_data=self.form_data)
+        form_validator.revalidate()
+        self.assertIsNone(form_validator.rules_result)
+        self.assertRaises(ValidationError, form_validator.validate)
@@ -0,0 +1,99 @@
+import os
+import tempfile
+
+from dateutil.relativedelta import relativedelta
+from django.core.exceptions import ValidationError
+from django.test import TestCase, tag
+from edc_base.utils import get_utcnow
+from edc_constants.constants import YES
+
+from ..form_validators import CaregiverContactFormValidator
+from ..instrumentation import (PrometheusTextFileSink, RingBufferSink, instrument,
+                               uninstrument)
+from .models import CaregiverLocator, FlourishConsentVersion, SubjectConsent
+from .test_model_mixin import TestModeMixin
+
+
+@tag('instrumentation')
+class TestInstrumentation(TestModeMixin, TestCase):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(CaregiverContactFormValidator, *args, **kwargs)
+
+    def setUp(self):
+        self.subject_identifier = '12345678'
+
+        FlourishConsentVersion.objects.create(
+            screening_identifier='ABC12345')
+
+        SubjectConsent.objects.create(
+            subject_identifier=self.subject_identifier,
+            screening_identifier='ABC12345',
+            gender='F', dob=(get_utcnow() - relativedelta(years=25)).date(),
+            consent_datetime=get_utcnow() - relativedelta(days=1), version='1')
+
+        CaregiverLocator.objects.create(
+            subject_identifier=self.subject_identifier,
+            screening_identifier='ABC12345',
+            may_call=YES,
+            may_visit_home=YES)
+
+        self.sink = RingBufferSink()
+        instrument(CaregiverContactFormValidator, self.sink)
+
+    def tearDown(self):
+        uninstrument(CaregiverContactFormValidator)
+
+    def test_metric_recorded(self):
+        form_validator = CaregiverContactFormValidator(
+            cleaned_data={'subject_identifier': self.subject_identifier,
+                          'report_datetime': get_utcnow(),
+                          'contact_type': 'phone_call'})
+        form_validator.validate()
+        metric, = self.sink.records()
+        self.assertEqual(metric.validator, 'CaregiverContactFormValidator')
+        self.assertGreater(metric.query_count, 0)
+        self.assertIsNone(metric.error_code)
+
+    def test_error_code_recorded(self):
+        form_validator = CaregiverContactFormValidator(
+            cleaned_data={'subject_identifier': '99999999',
+                          'report_datetime': get_utcnow()})
+        self.assertRaises(ValidationError, form_validator.validate)
+        metric, = self.sink.records()
+        self.assertIsNotNone(metric.error_code)
+
+    def test_uninstrument(self):
+        uninstrument(CaregiverContactFormValidator)
+        form_validator = CaregiverContactFormValidator(
+            cleaned_data={'subject_identifier': self.subject_identifier,
+                          'report_datetime': get_utcnow(),
+                          'contact_type': 'phone_call'})
+        form_validator.validate()
+        self.assertEqual(self.sink.records(), [])
+
+    def test_prometheus_text_file(self):
+        path = os.path.join(tempfile.mkdtemp(), 'validators.prom')
+        uninstrument(CaregiverContactFormValidator)
+        instrument(CaregiverContactFormValidator,
+                   PrometheusTextFileSink(path=path, interval=0))
+        form_validator = CaregiverContactFormValidator(
+            cleaned_data={'subject_identifier': self.subject_identifier,
+                          'report_datetime': get_utcnow(),
+                          'contact_type': 'phone_call'})
+        form_validator.validate()
+        self.assertFalse(os.path.exists(path))
+        with open(path.replace('.prom', f'.{os.getpid()}.prom')) as f:
+            self.assertIn(
+                'flourish_form_validator_validations_total'
+                f'{{validator="CaregiverContactFormValidator",pid="{os.getpid()}"}} 1',
+                f.read())
+
+    def test_prometheus_text_file_removed(self):
+        path = os.path.join(tempfile.mkdtemp(), 'validators.prom')
+        sink = PrometheusTextFileSink(path=path, interval=0)
+        sink.write()
+        self.assertTrue(os.path.exists(sink.process_path()))
+        sink.remove()
+        self.assertFalse(os.path.exists(sink.process_path()))
+        sink.remove()
@@ -0,0 +1,21 @@
+from importlib import import_module
+
+from django.test import TestCase, tag
+
+from .. import form_validators
+
+
+@tag('lazy_exports')
+class TestLazyExports(TestCase):
+
+    def test_exports_resolve_to_module_attributes(self):
+        for name, module_name in form_validators._exports.items():
+            module = import_module(f'{form_validators.__name__}.{module_name}')
+            self.assertIs(getattr(form_validators, name), getattr(module, name))
+
+    def test_dir_lists_exports(self):
+        self.assertTrue(set(form_validators.__all__).issubset(dir(form_validators)))
+
+    def test_unknown_name(self):
+        with self.assertRaises(AttributeError):
+            form_validators.UnknownFormValidator
@@ -0,0 +1,49 @@
+from django.core.exceptions import ValidationError
+from django.test import TestCase, tag
+from edc_constants.constants import NOT_APPLICABLE, OTHER
+from edc_form_validators import FormValidator
+
+from ..form_validators import M2MSnapshotMixin
+from .models import ListModel
+
+
+class M2MFormValidator(M2MSnapshotMixin, FormValidator):
+    pass
+
+
+@tag('m2m_snapshot')
+class TestM2MSnapshot(TestCase):
+
+    def setUp(self):
+        ListModel.objects.create(name=NOT_APPLICABLE, short_name=NOT_APPLICABLE)
+        ListModel.objects.create(name=OTHER, short_name=OTHER)
+
+    def test_selections(self):
+        form_validator = M2MFormValidator(
+            cleaned_data={'who': ListModel.objects.all(), 'diagnoses': None})
+        self.assertEqual(form_validator.m2m_selections('who'),
+                         frozenset([NOT_APPLICABLE, OTHER]))
+        self.assertEqual(form_validator.m2m_selections('diagnoses'), frozenset())
+
+    def test_selections_queried_once(self):
+        form_validator = M2MFormValidator(
+            cleaned_data={'who': ListModel.objects.all(),
+                          'who_other': 'blah'})
+        with self.assertNumQueries(1):
+            form_validator.snapshot_m2m('who')
+        with self.assertNumQueries(0):
+            form_validator.m2m_selections('who')
+            form_validator.m2m_other_specify(
+                OTHER, m2m_field='who', field_other='who_other')
+            self.assertRaises(
+                ValidationError, form_validator.m2m_single_selection_if,
+                NOT_APPLICABLE, m2m_field='who')
+
+    def test_selections_retaken_for_new_queryset(self):
+        form_validator = M2MFormValidator(
+            cleaned_data={'who': ListModel.objects.filter(short_name=OTHER)})
+        self.assertEqual(form_validator.m2m_selections('who'), frozenset([OTHER]))
+        form_validator.cleaned_data['who'] = ListModel.objects.filter(
+            short_name=NOT_APPLICABLE)
+        self.assertEqual(form_validator.m2m_selections('who'),
+                         frozenset([NOT_APPLICABLE]))
@@ -1,6 +1,24 @@
 from dateutil.relativedelta import relativedelta
+from django.core.cache import caches
 from edc_constants.constants import NEG, POS, YES
 
+from ..form_validators.consent_version import consent_version_cache_alias
+from ..form_validators.hiv_status import hiv_status_cache_alias, hiv_statuses
+from ..form_validators.offstudy_status import offstudy_status_cache_alias, offstudy_statuses
+from ..form_validators.visit_context import visit_contexts
+
+
+def clear_validation_caches():
+    """Clears the shared and in-process caches validators read through,
+    so a test never sees entries left by another one.
+    """
+    for alias in {consent_version_cache_alias, hiv_status_cache_alias,
+                  offstudy_status_cache_alias}:
+        caches[alias].clear()
+    hiv_statuses.clear()
+    offstudy_statuses.clear()
+    visit_contexts.clear()
+
 
 class TestModeMixin:
 
@@ -0,0 +1,36 @@
+from django.test import TestCase, tag
+
+from ..form_validators import SubjectConsentFormValidator
+from ..form_validators.model_registry import ModelRegistry
+from .models import ScreeningPregWomen, SubjectConsent
+from .test_model_mixin import TestModeMixin
+
+
+@tag('model_registry')
+class TestModelRegistry(TestModeMixin, TestCase):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(SubjectConsentFormValidator, *args, **kwargs)
+
+    def test_resolves_and_caches(self):
+        registry = ModelRegistry()
+        self.assertEqual(
+            registry.get_model('flourish_form_validations.subjectconsent'),
+            SubjectConsent)
+        registry.get_model('flourish_form_validations.subjectconsent')
+        self.assertEqual(len(registry), 1)
+
+    def test_invalid_label_not_cached(self):
+        registry = ModelRegistry()
+        self.assertRaises(
+            LookupError, registry.get_model, 'flourish_form_validations.blah')
+        self.assertEqual(len(registry), 0)
+
+    def test_label_override(self):
+        form_validator = SubjectConsentFormValidator(cleaned_data={})
+        SubjectConsentFormValidator.preg_women_screening_model = \
+            'flourish_form_validations.subjectconsent'
+        self.assertEqual(form_validator.preg_women_screening_cls, SubjectConsent)
+        SubjectConsentFormValidator.preg_women_screening_model = \
+            'flourish_form_validations.screeningpregwomen'
+        self.assertEqual(form_validator.preg_women_screening_cls, ScreeningPregWomen)
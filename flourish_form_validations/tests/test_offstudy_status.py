@@ -0,0 +1,56 @@
+from datetime import date
+
+from django.core.cache import caches
+from django.test import TestCase, tag
+
+from ..form_validators.offstudy_status import (OffstudyStatus, get_offstudy_status,
+                                               invalidate_offstudy_status,
+                                               offstudy_status_cache_alias,
+                                               offstudy_status_key, offstudy_statuses)
+from ..form_validators.subject_context import SubjectContext
+from .models import OffStudy
+from .test_model_mixin import clear_validation_caches
+
+
+@tag('offstudy_status')
+class TestOffstudyStatusIndex(TestCase):
+
+    def setUp(self):
+        self.subject_identifier = '12345678'
+        self.shared_cache = caches[offstudy_status_cache_alias]
+        clear_validation_caches()
+
+    def tearDown(self):
+        clear_validation_caches()
+
+    def test_offstudy_before(self):
+        status = OffstudyStatus(pending_action=False, offstudy_date=date(2021, 5, 1))
+        self.assertTrue(status.offstudy_before(date(2021, 5, 2)))
+        self.assertFalse(status.offstudy_before(date(2021, 5, 1)))
+        self.assertFalse(OffstudyStatus(False, None).offstudy_before(date(2021, 5, 2)))
+
+    def test_indexed_status_served(self):
+        status = OffstudyStatus(pending_action=True, offstudy_date=None)
+        offstudy_statuses.set(self.subject_identifier, status)
+        context = SubjectContext(
+            subject_identifier=self.subject_identifier,
+            caregiver_offstudy_cls=OffStudy)
+        with self.assertNumQueries(0):
+            self.assertTrue(context.pending_offstudy_action)
+
+    def test_shared_cache_read_through(self):
+        self.shared_cache.set(
+            offstudy_status_key(self.subject_identifier), (False, date(2021, 5, 1)))
+        with self.assertNumQueries(0):
+            status = get_offstudy_status(self.subject_identifier, OffStudy)
+        self.assertEqual(status.offstudy_date, date(2021, 5, 1))
+        self.assertEqual(offstudy_statuses.get(self.subject_identifier), status)
+
+    def test_invalidate(self):
+        offstudy_statuses.set(self.subject_identifier, OffstudyStatus(True, None))
+        self.shared_cache.set(
+            offstudy_status_key(self.subject_identifier), (True, None))
+        invalidate_offstudy_status(self.subject_identifier)
+        self.assertNotIn(self.subject_identifier, offstudy_statuses)
+        self.assertIsNone(
+            self.shared_cache.get(offstudy_status_key(self.subject_identifier)))
@@ -0,0 +1,143 @@
+from itertools import product
+
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.test import TestCase, tag
+from edc_constants.constants import NO, NOT_APPLICABLE, YES
+from edc_form_validators import FormValidator
+
+from ..form_validators import Applicable, NotRequired, Required, RequirementTable
+
+
+class RequirementsFormValidator(FormValidator):
+
+    requirements = RequirementTable(
+        Required(YES, field='have_cough', targets=['cough_duration']),
+        NotRequired(NO, field='may_call', targets=['subject_cell'], inverse=False),
+        Applicable(YES, field='partner_present', targets=['disclosure_to_partner']),
+    )
+
+    def clean(self):
+        self.requirements.evaluate(self)
+
+
+@tag('requirements')
+class TestRequirementTable(TestCase):
+
+    def validate(self, **cleaned_data):
+        form_validator = RequirementsFormValidator(cleaned_data=cleaned_data)
+        form_validator.validate()
+        return form_validator
+
+    def test_required(self):
+        self.assertRaises(ValidationError, self.validate,
+                          have_cough=YES, cough_duration=None)
+        self.assertRaises(ValidationError, self.validate,
+                          have_cough=NO, cough_duration='month')
+        self.validate(have_cough=YES, cough_duration='month')
+        self.validate(have_cough=NO, cough_duration=None)
+
+    def test_not_required(self):
+        self.assertRaises(ValidationError, self.validate,
+                          may_call=NO, subject_cell='71234567')
+        self.validate(may_call=YES, subject_cell=None)
+
+    def test_applicable(self):
+        self.assertRaises(ValidationError, self.validate,
+                          partner_present=YES,
+                          disclosure_to_partner=NOT_APPLICABLE)
+        self.assertRaises(ValidationError, self.validate,
+                          partner_present=NO, disclosure_to_partner=YES)
+        self.validate(partner_present=NO, disclosure_to_partner=NOT_APPLICABLE)
+
+    def test_message_from_helper(self):
+        try:
+            self.validate(have_cough=YES, cough_duration=None)
+        except ValidationError as e:
+            self.assertIn('cough_duration', e.error_dict)
+        else:
+            self.fail('ValidationError not raised.')
+
+    def test_declared_order(self):
+        table = RequirementTable(
+            Required(YES, field='have_cough', targets=['cough_duration']),
+            Required(YES, field='may_call', targets=['subject_cell']),
+            Required(YES, field='have_cough', targets=['cough_num']))
+        form_validator = FormValidator(cleaned_data={
+            'have_cough': YES, 'cough_duration': 'month', 'cough_num': None,
+            'may_call': YES, 'subject_cell': None})
+        try:
+            table.evaluate(form_validator)
+        except ValidationError as e:
+            self.assertIn('subject_cell', e.error_dict)
+        else:
+            self.fail('ValidationError not raised.')
+
+    def test_dependencies(self):
+        requirements = RequirementsFormValidator.requirements
+        self.assertEqual(requirements.dependencies()['cough_duration'], {'have_cough'})
+        self.assertIn('subject_cell', requirements.fields)
+
+    def test_misconfigured(self):
+        self.assertRaises(ImproperlyConfigured, Required, YES, field='have_cough')
+        self.assertRaises(ImproperlyConfigured, Required, field='have_cough',
+                          targets=['cough_duration'])
+
+
+@tag('requirements')
+class TestRequirementPasses(TestCase):
+    """Compares Requirement.passes() with the edc helper it stands in
+    for, over every combination of trigger and target values.
+    """
+
+    missing = object()
+
+    values = [YES, NO, NOT_APPLICABLE, None, missing]
+
+    requirements = [
+        Required(YES, field='field', targets=['target']),
+        Required(YES, field='field', targets=['target'], inverse=False),
+        NotRequired(YES, field='field', targets=['target']),
+        NotRequired(YES, field='field', targets=['target'], inverse=False),
+        Applicable(YES, field='field', targets=['target']),
+        Applicable(YES, field='field', targets=['target'], inverse=False),
+    ]
+
+    def cleaned_data(self, value, target_value):
+        cleaned_data = {}
+        if value is not self.missing:
+            cleaned_data.update(field=value)
+        if target_value is not self.missing:
+            cleaned_data.update(target=target_value)
+        return cleaned_data
+
+    def helper_raises(self, requirement, cleaned_data):
+        form_validator = FormValidator(cleaned_data=cleaned_data)
+        try:
+            requirement.raise_for(form_validator, 'target')
+        except ValidationError:
+            return True
+        return False
+
+    def test_passes_never_skips_an_error(self):
+        for requirement, (value, target_value) in product(
+                self.requirements, product(self.values, self.values)):
+            cleaned_data = self.cleaned_data(value, target_value)
+            with self.subTest(requirement=requirement, inverse=requirement.inverse,
+                              cleaned_data=cleaned_data):
+                if requirement.passes(cleaned_data, cleaned_data.get('field'), 'target'):
+                    self.assertFalse(self.helper_raises(requirement, cleaned_data))
+
+    def test_table_same_as_helper(self):
+        for requirement, (value, target_value) in product(
+                self.requirements, product(self.values, self.values)):
+            cleaned_data = self.cleaned_data(value, target_value)
+            with self.subTest(requirement=requirement, inverse=requirement.inverse,
+                              cleaned_data=cleaned_data):
+                form_validator = FormValidator(cleaned_data=cleaned_data)
+                try:
+                    RequirementTable(requirement).evaluate(form_validator)
+                except ValidationError:
+                    raised = True
+                else:
+                    raised = False
+                self.assertEqual(raised, self.helper_raises(requirement, cleaned_data))
@@ -0,0 +1,127 @@
+from dateutil.relativedelta import relativedelta
+from django.core.cache import caches
+from django.core.exceptions import ValidationError
+from django.test import TestCase, tag
+from edc_base.utils import get_utcnow
+from edc_form_validators import FormValidator
+
+from ..form_validators import FormValidatorMixin
+from ..form_validators.result_cache import (ResultCacheMixin, content_hash,
+                                            instance_identifiers, result_cache_alias,
+                                            result_cache_stats)
+from .models import (Appointment, FlourishConsentVersion, ListModel, MaternalVisit,
+                     SubjectConsent, UltraSound)
+from .test_model_mixin import TestModeMixin
+
+
+class CachedFormValidator(ResultCacheMixin, FormValidator):
+
+    cache_results = True
+
+    cleans = 0
+
+    def clean(self):
+        CachedFormValidator.cleans += 1
+        if self.cleaned_data.get('dob') is None:
+            raise ValidationError({'dob': 'This field is required.'})
+
+
+class CachedCrfFormValidator(FormValidatorMixin, FormValidator):
+
+    cache_results = True
+
+
+@tag('result_cache')
+class TestResultCache(TestModeMixin, TestCase):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(CachedCrfFormValidator, *args, **kwargs)
+
+    def setUp(self):
+        caches[result_cache_alias].clear()
+        result_cache_stats.clear()
+        CachedFormValidator.cleans = 0
+        self.cleaned_data = {'subject_identifier': '11111111', 'dob': None}
+
+    def test_cached_error_raised(self):
+        for _ in range(2):
+            form_validator = CachedFormValidator(cleaned_data=dict(self.cleaned_data))
+            self.assertRaises(ValidationError, form_validator.validate)
+            self.assertIn('dob', form_validator._errors)
+        self.assertEqual(CachedFormValidator.cleans, 1)
+        self.assertEqual(
+            result_cache_stats.summary()['CachedFormValidator'],
+            {'hits': 1, 'misses': 1, 'hit_ratio': 0.5})
+
+    def test_cached_valid(self):
+        self.cleaned_data.update(dob=get_utcnow().date())
+        for _ in range(2):
+            CachedFormValidator(cleaned_data=dict(self.cleaned_data)).validate()
+        self.assertEqual(CachedFormValidator.cleans, 1)
+
+    def test_changed_cleaned_data_revalidated(self):
+        self.assertRaises(
+            ValidationError, CachedFormValidator(cleaned_data=self.cleaned_data).validate)
+        self.cleaned_data.update(dob=get_utcnow().date())
+        CachedFormValidator(cleaned_data=self.cleaned_data).validate()
+        self.assertEqual(CachedFormValidator.cleans, 2)
+
+    def test_revalidated_after_subject_record_saved(self):
+        self.assertRaises(
+            ValidationError, CachedFormValidator(cleaned_data=self.cleaned_data).validate)
+        SubjectConsent.objects.create(
+            subject_identifier='11111111', screening_identifier='ABC12345',
+            gender='F', dob=(get_utcnow() - relativedelta(years=25)).date(),
+            consent_datetime=get_utcnow(), version='1')
+        self.assertRaises(
+            ValidationError, CachedFormValidator(cleaned_data=self.cleaned_data).validate)
+        self.assertEqual(CachedFormValidator.cleans, 2)
+
+    def test_content_hash_reduces_instances_to_pk(self):
+        obj = ListModel.objects.create(name='one', short_name='one')
+        self.assertEqual(
+            content_hash({'list': obj}),
+            content_hash({'list': ListModel.objects.get(pk=obj.pk)}))
+        self.assertNotEqual(content_hash({'value': 1}), content_hash({'value': '1'}))
+
+    def test_unrelated_save_keeps_results(self):
+        self.assertRaises(
+            ValidationError, CachedFormValidator(cleaned_data=self.cleaned_data).validate)
+        ListModel.objects.create(name='two', short_name='two')
+        self.assertRaises(
+            ValidationError, CachedFormValidator(cleaned_data=self.cleaned_data).validate)
+        self.assertEqual(CachedFormValidator.cleans, 1)
+
+    def test_instance_identifiers(self):
+        obj = ListModel(name='two', short_name='two')
+        self.assertEqual(instance_identifiers(obj), [])
+        consent = SubjectConsent(subject_identifier='11111111',
+                                 screening_identifier='ABC12345')
+        self.assertEqual(instance_identifiers(consent), ['11111111', 'ABC12345'])
+
+    def test_visit_identifiers_read_without_query(self):
+        appointment = Appointment.objects.create(
+            subject_identifier='11111111', appt_datetime=get_utcnow(),
+            visit_code='1000')
+        visit = MaternalVisit.objects.create(
+            appointment=appointment, subject_identifier='11111111')
+        ultrasound = UltraSound(maternal_visit_id=visit.pk, ga_confirmed=20)
+        with self.assertNumQueries(0):
+            self.assertEqual(instance_identifiers(ultrasound),
+                             [f'maternal_visit:{visit.pk}'])
+        ultrasound = UltraSound(maternal_visit=visit, ga_confirmed=20)
+        self.assertEqual(instance_identifiers(ultrasound),
+                         ['11111111', f'maternal_visit:{visit.pk}'])
+
+    def test_revalidated_after_consent_version_saved(self):
+        SubjectConsent.objects.create(
+            subject_identifier='11111111', screening_identifier='ABC12345',
+            gender='F', dob=(get_utcnow() - relativedelta(years=25)).date(),
+            consent_datetime=get_utcnow() - relativedelta(days=1), version='1')
+        cleaned_data = {'subject_identifier': '11111111',
+                        'report_datetime': get_utcnow()}
+        self.assertRaises(
+            ValidationError,
+            CachedCrfFormValidator(cleaned_data=dict(cleaned_data)).validate)
+        FlourishConsentVersion.objects.create(screening_identifier='ABC12345')
+        CachedCrfFormValidator(cleaned_data=dict(cleaned_data)).validate()
@@ -0,0 +1,92 @@
+from django.core.exceptions import ValidationError
+from django.test import TestCase, tag
+from edc_form_validators import FormValidator
+
+from ..form_validators.rules import (MULTI_QUERY, PURE, SINGLE_QUERY, Rule,
+                                     ValidationRulesMixin)
+
+
+class ScheduledFormValidator(ValidationRulesMixin, FormValidator):
+
+    rules = [
+        Rule('validate_query', cost=SINGLE_QUERY),
+        Rule('validate_pure', cost=PURE),
+        Rule('validate_queries'),
+        Rule('validate_dependent', depends_on=['validate_query'], cost=PURE),
+    ]
+
+    failing = ()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.run = []
+
+    def check(self, method):
+        self.run.append(method)
+        if method in self.failing:
+            message = {method: 'Invalid.'}
+            self._errors.update(message)
+            raise ValidationError(message)
+
+    def validate_query(self):
+        self.check('validate_query')
+
+    def validate_pure(self):
+        self.check('validate_pure')
+
+    def validate_queries(self):
+        self.check('validate_queries')
+
+    def validate_dependent(self):
+        self.check('validate_dependent')
+
+
+@tag('rule_scheduler')
+class TestRuleScheduler(TestCase):
+
+    def test_schedule_cheapest_first(self):
+        form_validator = ScheduledFormValidator(cleaned_data={})
+        schedule = [[rule.method for _, rule in group]
+                    for group in form_validator.schedule(form_validator.rules)]
+        self.assertEqual(
+            schedule,
+            [['validate_pure'],
+             ['validate_query', 'validate_dependent'],
+             ['validate_queries']])
+
+    def test_runs_cheapest_first(self):
+        form_validator = ScheduledFormValidator(cleaned_data={})
+        form_validator.validate()
+        self.assertEqual(
+            form_validator.run,
+            ['validate_pure', 'validate_query', 'validate_dependent',
+             'validate_queries'])
+
+    def test_skips_costlier_rules_after_failure(self):
+        form_validator = ScheduledFormValidator(cleaned_data={})
+        form_validator.failing = ['validate_pure']
+        self.assertRaises(ValidationError, form_validator.validate)
+        self.assertEqual(form_validator.run, ['validate_pure', 'validate_query'])
+        self.assertIn('validate_pure', form_validator._errors)
+
+    def test_keeps_declared_precedence(self):
+        form_validator = ScheduledFormValidator(cleaned_data={})
+        form_validator.failing = ['validate_query', 'validate_pure']
+        self.assertRaises(ValidationError, form_validator.validate)
+        self.assertIn('validate_query', form_validator._errors)
+        self.assertNotIn('validate_pure', form_validator._errors)
+
+    def test_collect_errors_in_declared_order(self):
+        form_validator = ScheduledFormValidator(cleaned_data={})
+        form_validator.collect_errors = True
+        form_validator.failing = ['validate_queries', 'validate_pure']
+        with self.assertRaises(ValidationError) as cm:
+            form_validator.validate()
+        self.assertEqual(list(cm.exception.error_dict),
+                         ['validate_pure', 'validate_queries'])
+
+    def test_invalid_cost(self):
+        self.assertRaises(ValueError, Rule, 'validate_pure', cost='cheap')
+
+    def test_default_cost(self):
+        self.assertEqual(Rule('validate_pure').cost, MULTI_QUERY)
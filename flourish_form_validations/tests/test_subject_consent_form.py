@@ -218,3 +218,43 @@ class TestSubjectConsentForm(TestModeMixin, TestCase):
         
         self.assertRaises(ValidationError, form_validator.validate)
         self.assertIn('dob', form_validator._errors)
+
+    def test_lookups_loaded_once(self):
+        SubjectConsent.objects.create(
+            subject_identifier='11111111',
+            screening_identifier=self.screening_identifier,
+            consent_datetime=get_utcnow(),
+            dob=self.consent_options.get('dob'),
+            version='1',
+        )
+        form_validator = SubjectConsentFormValidator(
+            cleaned_data=self.consent_options)
+        form_validator.validate()
+        self.assertEqual(
+            form_validator.prefetched['screening_consent'].subject_identifier,
+            '11111111')
+        self.assertIsNone(form_validator.prefetched['subject_consent'])
+        with self.assertNumQueries(0):
+            form_validator.bhp_prior_screening
+            form_validator.preg_women_screening
+            form_validator.subject_consent
+            form_validator.screening_consent
+
+    def test_invalid_name_runs_only_gender_lookup(self):
+        self.consent_options.update(first_name='test one')
+        form_validator = SubjectConsentFormValidator(
+            cleaned_data=self.consent_options)
+        with self.assertNumQueries(1):
+            self.assertRaises(ValidationError, form_validator.validate)
+        self.assertIn('first_name', form_validator._errors)
+        self.assertEqual(list(form_validator.prefetched), ['preg_women_screening'])
+
+    def test_gender_reported_before_invalid_name(self):
+        ScreeningPregWomen.objects.create(
+            screening_identifier=self.screening_identifier)
+        self.consent_options.update(first_name='test one', gender='M')
+        form_validator = SubjectConsentFormValidator(
+            cleaned_data=self.consent_options)
+        self.assertRaises(ValidationError, form_validator.validate)
+        self.assertIn('gender', form_validator._errors)
+        self.assertNotIn('first_name', form_validator._errors)
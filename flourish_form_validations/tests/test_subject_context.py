@@ -0,0 +1,92 @@
+from dateutil.relativedelta import relativedelta
+from django.core.exceptions import ValidationError
+from django.test import TestCase, tag
+from edc_base.utils import get_utcnow
+from edc_form_validators import FormValidator
+
+from ..form_validators import FormValidatorMixin
+from ..form_validators.consent_version import get_consent_version
+from .models import FlourishConsentVersion, SubjectConsent
+from .test_model_mixin import TestModeMixin, clear_validation_caches
+
+
+class CrfFormValidator(FormValidatorMixin, FormValidator):
+    pass
+
+
+@tag('subject_context')
+class TestSubjectContext(TestModeMixin, TestCase):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(CrfFormValidator, *args, **kwargs)
+
+    def setUp(self):
+        self.subject_identifier = '11111111'
+        clear_validation_caches()
+
+        SubjectConsent.objects.create(
+            subject_identifier=self.subject_identifier,
+            screening_identifier='ABC12345',
+            gender='F',
+            dob=(get_utcnow() - relativedelta(years=25)).date(),
+            consent_datetime=get_utcnow() - relativedelta(days=2),
+            version='1')
+
+        self.cleaned_data = {
+            'subject_identifier': self.subject_identifier,
+            'report_datetime': get_utcnow()}
+
+    def tearDown(self):
+        clear_validation_caches()
+
+    def test_latest_consent_resolved_once(self):
+        form_validator = CrfFormValidator(cleaned_data=self.cleaned_data)
+        form_validator.subject_identifier = self.subject_identifier
+        with self.assertNumQueries(1):
+            form_validator.latest_consent_obj
+            form_validator.latest_consent_obj
+            form_validator.validate_against_consent_datetime(get_utcnow())
+
+    def test_context_rebuilt_for_new_subject(self):
+        form_validator = CrfFormValidator(cleaned_data=self.cleaned_data)
+        form_validator.subject_identifier = self.subject_identifier
+        self.assertIsNotNone(form_validator.latest_consent_obj)
+        form_validator.subject_identifier = '22222222'
+        self.assertIsNone(form_validator.latest_consent_obj)
+
+    def test_consent_version_required(self):
+        form_validator = CrfFormValidator(cleaned_data=self.cleaned_data)
+        self.assertRaises(ValidationError, form_validator.validate)
+
+    def test_consent_version_exists(self):
+        FlourishConsentVersion.objects.create(
+            screening_identifier='ABC12345')
+        form_validator = CrfFormValidator(cleaned_data=self.cleaned_data)
+        try:
+            form_validator.validate()
+        except ValidationError as e:
+            self.fail(f'ValidationError unexpectedly raised. Got{e}')
+
+    def test_context_reset_per_clean(self):
+        FlourishConsentVersion.objects.create(
+            screening_identifier='ABC12345')
+        form_validator = CrfFormValidator(cleaned_data=self.cleaned_data)
+        form_validator.validate()
+        context = form_validator.subject_context
+        form_validator.validate()
+        self.assertIsNot(context, form_validator.subject_context)
+
+    def test_consent_version_cached(self):
+        FlourishConsentVersion.objects.create(
+            screening_identifier='ABC12345')
+        consent_version = get_consent_version(FlourishConsentVersion, 'ABC12345')
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                get_consent_version(FlourishConsentVersion, 'ABC12345'),
+                consent_version)
+
+    def test_consent_version_invalidated_on_save(self):
+        self.assertIsNone(get_consent_version(FlourishConsentVersion, 'ABC12345'))
+        FlourishConsentVersion.objects.create(
+            screening_identifier='ABC12345')
+        self.assertIsNotNone(get_consent_version(FlourishConsentVersion, 'ABC12345'))
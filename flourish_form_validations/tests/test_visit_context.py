@@ -0,0 +1,105 @@
+from dateutil.relativedelta import relativedelta
+from django.test import TestCase, tag
+from edc_base.utils import get_utcnow
+from edc_form_validators import FormValidator
+
+from ..form_validators import FormValidatorMixin
+from .models import (Appointment, CaregiverChildConsent, MaternalVisit, OnSchedule,
+                     Schedule, SubjectConsent)
+from .test_model_mixin import TestModeMixin, clear_validation_caches
+
+
+class CrfFormValidator(FormValidatorMixin, FormValidator):
+    pass
+
+
+@tag('visit_context')
+class TestVisitContext(TestModeMixin, TestCase):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(CrfFormValidator, *args, **kwargs)
+
+    def setUp(self):
+        clear_validation_caches()
+        self.subject_identifier = '11111111'
+        self.child_subject_identifier = '11111111-10'
+
+        subject_consent = SubjectConsent.objects.create(
+            subject_identifier=self.subject_identifier,
+            screening_identifier='ABC12345',
+            gender='F',
+            dob=(get_utcnow() - relativedelta(years=25)).date(),
+            consent_datetime=get_utcnow(),
+            version='1')
+
+        CaregiverChildConsent.objects.create(
+            subject_consent=subject_consent,
+            subject_identifier=self.child_subject_identifier,
+            preg_enroll=True,
+            consent_datetime=get_utcnow())
+
+        OnSchedule.objects.create(
+            subject_identifier=self.subject_identifier,
+            child_subject_identifier=self.child_subject_identifier,
+            schedule_name='cohort_a_enrollment')
+
+        schedule = Schedule.objects.create(
+            subject_identifier=self.subject_identifier,
+            child_subject_identifier=self.child_subject_identifier,
+            schedule_name='cohort_a_enrollment',
+            onschedule_model='flourish_form_validations.onschedule')
+
+        appointment = Appointment.objects.create(
+            subject_identifier=self.subject_identifier,
+            appt_datetime=get_utcnow(),
+            visit_code='2000M')
+
+        self.maternal_visit = MaternalVisit.objects.create(
+            appointment=appointment,
+            schedule=schedule,
+            schedule_name='cohort_a_enrollment')
+
+    def tearDown(self):
+        clear_validation_caches()
+
+    def test_visit_context_shared_between_validators(self):
+        form_validator = CrfFormValidator(
+            cleaned_data={'maternal_visit': self.maternal_visit})
+        self.assertEqual(
+            form_validator.visit_context.child_subject_identifier,
+            self.child_subject_identifier)
+        self.assertTrue(form_validator.visit_context.latest_child_consent.preg_enroll)
+
+        form_validator = CrfFormValidator(
+            cleaned_data={'maternal_visit': self.maternal_visit})
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                form_validator.get_visit_onschedule_obj(
+                    self.maternal_visit).child_subject_identifier,
+                self.child_subject_identifier)
+            self.assertTrue(
+                form_validator.visit_context.latest_child_consent.preg_enroll)
+
+    def test_visit_context_invalidated_on_consent_save(self):
+        form_validator = CrfFormValidator(
+            cleaned_data={'maternal_visit': self.maternal_visit})
+        self.assertTrue(form_validator.visit_context.latest_child_consent.preg_enroll)
+
+        child_consent = CaregiverChildConsent.objects.get(
+            subject_identifier=self.child_subject_identifier)
+        child_consent.preg_enroll = False
+        child_consent.save()
+
+        self.assertFalse(form_validator.visit_context.latest_child_consent.preg_enroll)
+
+    def test_missing_onschedule_not_cached(self):
+        OnSchedule.objects.all().delete()
+        form_validator = CrfFormValidator(
+            cleaned_data={'maternal_visit': self.maternal_visit})
+        self.assertIsNone(form_validator.visit_context.onschedule_obj)
+
+        OnSchedule.objects.create(
+            subject_identifier=self.subject_identifier,
+            child_subject_identifier=self.child_subject_identifier,
+            schedule_name='cohort_a_enrollment')
+        self.assertIsNotNone(form_validator.visit_context.onschedule_obj)